@@ -0,0 +1,87 @@
+import os
+import sys
+import time
+import argparse
+import pygame
+from os import path
+
+from config.settings import ASSET_PACK_FILE, PRELOADED_SOUNDS
+from config.asset_manifest import BAKED_SPRITES
+from utils.asset_pack import AssetPack, build_asset_pack, bake_sprite
+
+"""
+Build step that bakes every sprite at its final size (and flipped variants) and every sound
+as decoded PCM into the asset pack loaded by the game at startup.
+
+Usage:
+    python build_assets.py [--output data/assets.pack] [--benchmark]
+"""
+
+def sound_files():
+    """
+    Get the paths of the sounds baked into the pack.
+
+    Returns:
+        list: The sound file paths.
+    """
+    return [path.join("assets", "sounds", file_name) for file_name in PRELOADED_SOUNDS]
+
+def benchmark(pack_path, sprites, sounds):
+    """
+    Compare the time needed to get every asset by decoding the source files and from the pack.
+
+    Args:
+        pack_path (str): The path of the built pack.
+        sprites (list): (file path, size, flip) tuples of the sprite variants.
+        sounds (list): Paths of the sound files.
+
+    Returns:
+        tuple: The decoding time and the pack time, in milliseconds.
+    """
+    sprites = [sprite for sprite in sprites if path.exists(sprite[0])]
+    sounds = [sound for sound in sounds if path.exists(sound)]
+
+    # Decode, scale and flip from the source files, as the game does without a pack
+    start = time.perf_counter()
+    for file_path, size, flip in sprites:
+        bake_sprite(file_path, size, flip)
+    for file_path in sounds:
+        pygame.mixer.Sound(file_path)
+    decode_ms = (time.perf_counter() - start) * 1000
+
+    # Map the pack and build the same surfaces and sounds from it
+    start = time.perf_counter()
+    pack = AssetPack(pack_path)
+    for file_path, size, flip in sprites:
+        pack.sprite(file_path, size, flip)
+    for file_path in sounds:
+        pack.sound(file_path)
+    pack_ms = (time.perf_counter() - start) * 1000
+
+    return decode_ms, pack_ms
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake the sprites and sounds into the asset pack.")
+    parser.add_argument("--output", default=ASSET_PACK_FILE, help="path of the pack file")
+    parser.add_argument("--benchmark", action="store_true", help="compare loading from the source files and from the pack")
+    args = parser.parse_args()
+
+    # The mixer must use the same format as the game, which initializes it with the defaults
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.mixer.init()
+
+    count, skipped = build_asset_pack(args.output, BAKED_SPRITES, sound_files())
+    print(f"{args.output}: {count} entries, {path.getsize(args.output) / 1024:.0f} KiB")
+    for file_path in skipped:
+        print(f"  skipped missing file {file_path}")
+
+    if args.benchmark:
+        decode_ms, pack_ms = benchmark(args.output, BAKED_SPRITES, sound_files())
+        print(f"decode from source files: {decode_ms:.1f} ms")
+        print(f"load from asset pack:     {pack_ms:.1f} ms ({decode_ms / pack_ms:.1f}x faster)")
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+import sys
+import time
+import random
+import argparse
+import tempfile
+from os import path
+
+from config.settings import LEVEL_PACK_FILE
+from levels.levels_distribution import LEVELS_DISTRIBUTION, ROUND_LAYOUTS
+from utils.level_pack import LevelPack, build_level_pack
+from utils.helpers import generate_wide_level_matrix
+
+"""
+Build step that writes the layouts of levels/levels_distribution.py and the round table into
+the level pack read by the game.
+
+Usage:
+    python build_levels.py [--output data/levels.pack] [--benchmark 500]
+"""
+
+def check(pack_path):
+    """
+    Read every layout and round of a pack back and compare them with the source.
+
+    Args:
+        pack_path (str): The path of the built pack.
+
+    Returns:
+        bool: True if the pack matches levels/levels_distribution.py, False otherwise.
+    """
+    pack = LevelPack(pack_path)
+    try:
+        layouts_match = all(pack.layout(index) == layout for index, layout in enumerate(LEVELS_DISTRIBUTION))
+        rounds_match = all(
+            pack.layout_for_round(round_number) == LEVELS_DISTRIBUTION[layout]
+            for round_number, layout in enumerate(ROUND_LAYOUTS, start=1)
+        )
+    finally:
+        pack.close()
+
+    return layouts_match and rounds_match
+
+def benchmark(layout_count):
+    """
+    Compare reading one layout of a large pack with reading all of them.
+
+    Args:
+        layout_count (int): The number of generated layouts of the pack.
+
+    Returns:
+        tuple: The time to open the pack and read one layout, and the time to read every layout, in milliseconds.
+    """
+    rng_state = random.getstate()
+    random.seed(0)
+    layouts = [generate_wide_level_matrix(random.randint(1, 20)) for _ in range(layout_count)]
+    random.setstate(rng_state)
+
+    with tempfile.TemporaryDirectory() as directory:
+        pack_path = path.join(directory, "benchmark.pack")
+        build_level_pack(pack_path, layouts, list(range(layout_count)))
+
+        start = time.perf_counter()
+        pack = LevelPack(pack_path)
+        for index in range(layout_count):
+            pack.layout(index)
+        all_ms = (time.perf_counter() - start) * 1000
+        pack.close()
+
+        start = time.perf_counter()
+        pack = LevelPack(pack_path)
+        pack.layout_for_round(layout_count // 2)
+        one_ms = (time.perf_counter() - start) * 1000
+        pack.close()
+
+    return one_ms, all_ms
+
+def main():
+    parser = argparse.ArgumentParser(description="Write the level layouts and the round table into the level pack.")
+    parser.add_argument("--output", default=LEVEL_PACK_FILE, help="path of the pack file")
+    parser.add_argument("--benchmark", type=int, metavar="LAYOUTS", help="compare reading one and every layout of a pack with this many generated layouts")
+    args = parser.parse_args()
+
+    size = build_level_pack(args.output, LEVELS_DISTRIBUTION, ROUND_LAYOUTS)
+    print(f"{args.output}: {len(LEVELS_DISTRIBUTION)} layouts, {len(ROUND_LAYOUTS)} rounds, {size} bytes")
+
+    if not check(args.output):
+        print("  the pack does not match levels/levels_distribution.py")
+        return 1
+
+    if args.benchmark:
+        one_ms, all_ms = benchmark(args.benchmark)
+        print(f"open and read one layout: {one_ms:.2f} ms")
+        print(f"read all {args.benchmark} layouts:    {all_ms:.2f} ms")
+
+if __name__ == "__main__":
+    sys.exit(main())
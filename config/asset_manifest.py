@@ -0,0 +1,58 @@
+from os import path
+
+from config.settings import (
+    MAPPY_SCALE, MEOWKY_SCALE, OPEN_DOOR_SCALE, CLOSED_DOOR_SCALE, ITEM_SCALES,
+    PLATFORM_WIDTH, PLATFORM_HEIGHT, TRAMPOLINE_WIDTH, TRAMPOLINE_HEIGHT,
+    SCREEN_WIDTH, SCREEN_HEIGHT,
+)
+
+# Sprites baked into the asset pack: (file path, final size or None to keep the original, flipped horizontally)
+SPRITES_PATH = path.join("assets", "sprites")
+
+def sprite(folder, file_name):
+    return path.join(SPRITES_PATH, folder, file_name)
+
+BAKED_SPRITES = []
+
+# Mappy
+for file_name in ["static_mappy.png"] + [f"death_animation_{n}_mappy.png" for n in range(1, 10)]:
+    BAKED_SPRITES.append((sprite("mappy", file_name), MAPPY_SCALE, False))
+for file_name in ["moving_mappy.png", "jumping_mappy.png"]:
+    BAKED_SPRITES.append((sprite("mappy", file_name), MAPPY_SCALE, False))
+    BAKED_SPRITES.append((sprite("mappy", file_name), MAPPY_SCALE, True))
+
+# Meowky
+for file_name in ["static_1_meowky.png", "static_2_meowky.png", "dead_meowky.png"]:
+    BAKED_SPRITES.append((sprite("meowky", file_name), MEOWKY_SCALE, False))
+for n in range(1, 4):
+    BAKED_SPRITES.append((sprite("meowky", f"moving_{n}_meowky.png"), MEOWKY_SCALE, False))
+    BAKED_SPRITES.append((sprite("meowky", f"moving_{n}_meowky.png"), MEOWKY_SCALE, True))
+
+# Doors
+for prefix in ["", "special_"]:
+    BAKED_SPRITES.append((sprite("doors", f"{prefix}open_door.png"), OPEN_DOOR_SCALE, False))
+    BAKED_SPRITES.append((sprite("doors", f"{prefix}door_left_closed.png"), CLOSED_DOOR_SCALE, False))
+    BAKED_SPRITES.append((sprite("doors", f"{prefix}door_right_closed.png"), CLOSED_DOOR_SCALE, False))
+
+# Trampolines
+for color in ["green", "blue", "pink", "red"]:
+    BAKED_SPRITES.append((sprite("trampolines", f"{color}_trampoline.png"), (TRAMPOLINE_WIDTH, TRAMPOLINE_HEIGHT), False))
+    for n in range(1, 6):
+        BAKED_SPRITES.append((sprite("trampolines", f"{color}_trampoline_moving_{n}.png"), (TRAMPOLINE_WIDTH, TRAMPOLINE_HEIGHT), False))
+BAKED_SPRITES.append((sprite("trampolines", "broken_trampoline.png"), (TRAMPOLINE_WIDTH, TRAMPOLINE_HEIGHT), False))
+
+# Platforms (regular cells and cells next to a void, which are wider) and walls
+for width in [PLATFORM_WIDTH, PLATFORM_WIDTH + abs(PLATFORM_WIDTH - TRAMPOLINE_WIDTH)]:
+    BAKED_SPRITES.append((sprite("structures", "platform.png"), (width, PLATFORM_HEIGHT), False))
+    BAKED_SPRITES.append((sprite("structures", "platform_floor.png"), (width, PLATFORM_HEIGHT + 15), False))
+BAKED_SPRITES.append((sprite("structures", "wall.png"), (8, 75), False))
+BAKED_SPRITES.append((sprite("structures", "wall.png"), (8, 20), False))
+BAKED_SPRITES.append((sprite("structures", "roof.png"), None, False))
+BAKED_SPRITES.append((sprite("structures", "goro_house.png"), (SCREEN_WIDTH, SCREEN_HEIGHT - 150), False))
+
+# Loot
+for name, size in ITEM_SCALES.items():
+    BAKED_SPRITES.append((sprite("loot", f"{name}.png"), size, False))
+
+# HUD
+BAKED_SPRITES.append((sprite("hud", "hearth_mappy.png"), None, False))
@@ -19,6 +19,14 @@ MAGENTA     = (255, 0, 255)
 BROWN       = (139, 69, 19)
 DARK_YELLOW = (100, 100, 0)
 
+# Presentacion: las escenas se dibujan en una superficie de SCREEN_WIDTH x SCREEN_HEIGHT y SDL la escala a la ventana
+DISPLAY_SCALE = 0  # Factor entero de la ventana; 0 elige el mayor que cabe en el escritorio
+DISPLAY_FULLSCREEN = False  # Se alterna con F11
+DISPLAY_VSYNC = False  # Sincronizacion vertical, si el renderizador la admite
+
+# Escenas estaticas: sin eventos, el bucle principal espera como maximo este tiempo (ms) por iteracion
+IDLE_WAIT_MS = 250
+
 # Configuracion de la pantalla inicial
 TITLE_FONT_SIZE = 60
 TEXT_FONT_SIZE = 40
@@ -47,4 +55,78 @@ MAPPY_SCALE = (30, 30)
 MEOWKY_SCALE = (25, 30)
 
 CLOSED_DOOR_SCALE = (10, 60)
-OPEN_DOOR_SCALE = (50, 60)
\ No newline at end of file
+OPEN_DOOR_SCALE = (50, 60)
+
+# Objetos, a 30 px de alto conservando la proporcion de cada imagen
+ITEM_SCALES = {
+    "radio": (33, 30),
+    "tv": (35, 30),
+    "computer": (35, 30),
+    "painting": (26, 30),
+    "safe": (28, 30),
+}
+
+# Configuracion del perfilador
+PROFILER_HISTORY = 120
+PROFILER_FONT_SIZE = 20
+PROFILER_GRAPH_HEIGHT = 60
+PROFILER_OVERLAY_SCALE = (300, 400)
+
+# Latencia de entrada: limites (ms) de los intervalos del histograma
+LATENCY_BUCKETS_MS = [1, 2, 4, 8, 16, 24, 33, 50, 100]
+LATENCY_TIMEOUT_FRAMES = 30  # Cuadros tras los que una tecla que no llego a la pantalla se descarta
+
+# Ritmo de cuadros: planificador preciso (sleep + espera activa) y limites (ms) del histograma de tiempos de cuadro
+FRAME_PACER_PRECISE = False  # Cuesta una espera activa de hasta FRAME_PACER_SPIN_MS por cuadro
+FRAME_PACER_SPIN_MS = 2
+FRAME_TIME_BUCKETS_MS = [8, 12, 15, 16, 16.5, 17, 18, 20, 25, 33, 50, 100]
+
+# Telemetria: metricas de sesion y de nivel en lineas JSON, escritas por un hilo en segundo plano
+TELEMETRY_ENABLED = True
+TELEMETRY_DIR = "data/telemetry"
+TELEMETRY_QUEUE_SIZE = 256  # Registros en espera; si la cola esta llena se descartan
+TELEMETRY_BUCKETS_MS = [0.25, 0.5, 1, 2, 4, 8, 12, 16, 25, 33, 50, 100]
+
+# Configuracion de trazas (formato Chrome trace / Perfetto)
+TRACE_ENABLED = True
+TRACE_BUFFER_SIZE = 100000
+TRACE_DIR = "data/traces"
+
+# Mensajes de arranque por consola (pantalla, tiempo hasta los recursos y el primer cuadro); las trazas los registran siempre
+STARTUP_LOG = False
+
+# Sonidos decodificados en segundo plano durante la pantalla inicial
+PRELOADED_SOUNDS = [
+    "mappy_credit_sound.mp3",
+    "mappy_game_over.mp3",
+    "mappy_game_start.mp3",
+    "mappy_miss.mp3",
+    "mappy_level_clear.mp3",
+    "mappy_name_entry.mp3",
+    "mappy_item_get.mp3",
+    "mappy_trampoline_jump.mp3",
+]
+
+# Paquete de recursos precompilado (generado con build_assets.py)
+ASSET_PACK_FILE = "data/assets.pack"
+
+# Paquete de niveles (generado con build_levels.py a partir de levels/levels_distribution.py)
+LEVEL_PACK_FILE = "data/levels.pack"
+
+# Navegacion de los enemigos
+NAV_DOOR_COST = 4
+NAV_ALL_PAIRS_LIMIT = 400  # Niveles con mas celdas calculan las distancias a cada objetivo cuando se necesitan
+NAV_TARGET_CACHE = 32  # Objetivos recientes cuyas distancias se conservan
+
+# Planificador de la IA de los enemigos
+AI_THINK_INTERVAL = 4  # Cada enemigo decide una vez cada 4 ticks
+AI_TIME_BUDGET_MS = 1.0
+
+# Nivel de detalle: enemigos a mas de esta distancia (px) de la pantalla se actualizan de forma simplificada
+MEOWKY_LOD_DISTANCE = 200
+
+# Niveles anchos: se dividen en bloques de columnas que se crean al acercarse a la camara
+LEVEL_STREAMING_COLUMNS = 24  # Niveles con mas columnas se cargan por bloques
+LEVEL_CHUNK_COLUMNS = 8
+LEVEL_LOAD_MARGIN = 400  # Distancia (px) a la pantalla a la que se crea un bloque, mayor que MEOWKY_LOD_DISTANCE
+LEVEL_RELEASE_MARGIN = 900  # Distancia (px) a la pantalla a la que se libera un bloque
@@ -0,0 +1,126 @@
+import pygame
+
+# Window of the display module, to give it a fixed size; private to pygame and missing in some builds
+try:
+    from pygame._sdl2.video import Window
+except ImportError:
+    Window = None
+
+from config.settings import DISPLAY_SCALE, DISPLAY_FULLSCREEN, DISPLAY_VSYNC
+
+"""
+This module defines the presentation layer of the game. Scenes always draw on a logical surface
+of the native resolution, and SDL scales it to the window when the frame is presented, so a
+larger window or a fullscreen monitor costs one scaled copy per frame instead of more pixels
+for every sprite.
+"""
+
+class Display:
+    """
+    Opens the window with pygame.SCALED: the surface returned by set_mode keeps the logical size,
+    and SDL presents it scaled to the window with nearest neighbour filtering. In a window it uses
+    the largest integer factor that fits, with black borders around it. The window can be resized
+    or made fullscreen freely.
+
+    If the renderer has no vsync the window opens without it, and if SCALED is not available at
+    all the window has the logical size and any enlargement is left to the OS.
+
+    Args:
+        width (int): The logical width.
+        height (int): The logical height.
+        scale (int, optional): The integer factor of the window, 0 for the largest one that fits the desktop, which is also used if the factor cannot be set. Defaults to DISPLAY_SCALE.
+        fullscreen (bool, optional): Whether to fill the monitor. Defaults to DISPLAY_FULLSCREEN.
+        vsync (bool, optional): Whether presenting waits for the vertical refresh. Defaults to DISPLAY_VSYNC.
+    """
+    def __init__(self, width, height, scale=DISPLAY_SCALE, fullscreen=DISPLAY_FULLSCREEN, vsync=DISPLAY_VSYNC):
+        self.size = (width, height)
+        self.scaled = True
+        self.vsync = vsync
+        self.surface = self.open(scale, fullscreen)
+
+    def open(self, scale, fullscreen):
+        """
+        Open the window.
+
+        Args:
+            scale (int): The integer factor of the window, 0 for the largest one that fits the desktop.
+            fullscreen (bool): Whether to fill the monitor.
+
+        Returns:
+            pygame.Surface: The logical surface the scenes draw on.
+        """
+        flags = pygame.SCALED | (pygame.FULLSCREEN if fullscreen else pygame.RESIZABLE)
+
+        if self.vsync:
+            try:
+                return self.resize(pygame.display.set_mode(self.size, flags, vsync=1), scale, fullscreen)
+            except pygame.error:
+                self.vsync = False
+
+        try:
+            return self.resize(pygame.display.set_mode(self.size, flags), scale, fullscreen)
+        except pygame.error:
+            self.scaled = False
+            return pygame.display.set_mode(self.size)
+
+    def resize(self, surface, scale, fullscreen):
+        """
+        Give the window a fixed integer factor of the logical size, if this pygame build can resize it.
+
+        Args:
+            surface (pygame.Surface): The logical surface of the opened window.
+            scale (int): The integer factor, 0 to keep the one chosen by pygame.
+            fullscreen (bool): Whether the window fills the monitor, which ignores the factor.
+
+        Returns:
+            pygame.Surface: The same surface.
+        """
+        if scale and not fullscreen and Window is not None:
+            try:
+                Window.from_display_module().size = (self.size[0] * scale, self.size[1] * scale)
+            except (AttributeError, pygame.error):
+                pass  # SCALED keeps the factor it chose
+
+        return surface
+
+    def handle_event(self, event):
+        """
+        Toggle fullscreen with F11.
+
+        Args:
+            event (pygame.event.Event): The event to handle.
+        """
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F11 and self.scaled:
+            pygame.display.toggle_fullscreen()
+
+    def present(self):
+        """
+        Show the logical surface, scaled to the window.
+        """
+        pygame.display.flip()
+
+    def factor(self):
+        """
+        Get the integer factor the logical surface is presented at in a window.
+
+        Returns:
+            int: The largest integer factor that fits the window, 1 without SCALED.
+        """
+        if not self.scaled:
+            return 1
+
+        window_width, window_height = pygame.display.get_window_size()
+        return max(1, min(window_width // self.size[0], window_height // self.size[1]))
+
+    def describe(self):
+        """
+        Describe the presentation, for the startup log.
+
+        Returns:
+            str: The logical size, window size, factor and vsync.
+        """
+        window_width, window_height = pygame.display.get_window_size()
+        return (
+            f"Display {self.size[0]}x{self.size[1]} presented in a {window_width}x{window_height} window "
+            f"(x{self.factor()}{'' if self.scaled else ', not scaled'}, vsync {'on' if self.vsync else 'off'})"
+        )
@@ -0,0 +1,170 @@
+import numpy as np
+
+"""
+This module defines the LevelEncoder class, which keeps the state of a level as NumPy arrays:
+a grid with one channel per kind of object over the cells of the level matrix, and a table
+with one row per moving entity. Both are updated in place every tick and exposed as read-only
+views, so reading them allocates nothing.
+"""
+
+# Grid channels
+PLATFORM = 0  # 1 on platform cells
+SHAFT = 1  # 1 on trampoline cells and the empty cells above them
+TRAMPOLINE = 2  # Bounces left before the trampoline breaks, 0 once broken
+ITEM = 3  # Item type, 0 without item
+TARGET = 4  # 1 on the items of the targeted type
+DOOR = 5  # 1 closed door, 2 open door
+SPECIAL_DOOR = 6  # 1 if the door of the cell sends waves
+MEOWKY = 7  # Number of Meowkies in the cell
+WAVE = 8  # Number of waves in the cell
+PLAYER = 9  # 1 on the cell of the player
+GRID_CHANNELS = 10
+
+# Entity table columns
+KIND = 0  # 0 empty row, 1 player, 2 Meowky, 3 wave
+X = 1  # Horizontal center, in level coordinates
+Y = 2  # Bottom, in level coordinates
+STATE = 3  # Index in ENTITY_STATES, -1 for waves
+ROW = 4
+COLUMN = 5
+ENTITY_FEATURES = 6
+
+KIND_PLAYER, KIND_MEOWKY, KIND_WAVE = 1, 2, 3
+
+ENTITY_STATES = ["idle", "left", "right", "up", "down", "jump", "stun"]
+STATE_INDEX = {state: index for index, state in enumerate(ENTITY_STATES)}
+
+class LevelEncoder:
+    """
+    Encodes a level into persistent arrays.
+
+    Args:
+        max_meowkies (int, optional): Rows of the entity table for Meowkies. Defaults to 32.
+        max_waves (int, optional): Rows of the entity table for waves. Defaults to 16.
+    """
+    def __init__(self, max_meowkies=32, max_waves=16):
+        self.max_meowkies = max_meowkies
+        self.max_waves = max_waves
+
+        self.level = None
+        self.chunk_version = -1  # Chunk version of the level when the cells below were found
+        self._grid = None
+        self._entities = np.zeros((1 + max_meowkies + max_waves, ENTITY_FEATURES), dtype=np.float32)
+        self.entities = self.read_only(self._entities)
+        self.grid = None
+
+        # Cells of the objects that do not move, found again when the level loads or releases chunks
+        self.item_cells = []
+        self.door_cells = []
+        self.trampoline_cells = []
+
+    def read_only(self, array):
+        """
+        Get a view of an array that can not be written.
+
+        Args:
+            array (np.ndarray): The array.
+
+        Returns:
+            np.ndarray: The read-only view, sharing memory with the array.
+        """
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    def attach(self, level):
+        """
+        Start encoding a level. The arrays are reused if the level has the same size as the previous one.
+
+        Args:
+            level (Level): The level to encode.
+        """
+        self.level = level
+
+        rows, cols = level.navigation.rows, level.navigation.cols
+        if self._grid is None or self._grid.shape != (GRID_CHANNELS, rows, cols):
+            self._grid = np.zeros((GRID_CHANNELS, rows, cols), dtype=np.int8)
+            self.grid = self.read_only(self._grid)
+
+        # Static channels
+        self._grid[PLATFORM].fill(0)
+        self._grid[SHAFT].fill(0)
+        for r, c in level.navigation.platform_cells:
+            self._grid[PLATFORM, r, c] = 1
+        for r, c in level.navigation.shafts:
+            self._grid[SHAFT, r, c] = 1
+
+        self.find_static_cells()
+
+    def find_static_cells(self):
+        """
+        Find the cells of the loaded items, doors and trampolines of the level.
+        """
+        level = self.level
+        self.chunk_version = level.chunk_version
+        self.item_cells = [(item, level.cell_at(item.rect)) for item in level.items]
+        self.door_cells = [(door, level.cell_at(door.rect)) for door in level.doors]
+        self.trampoline_cells = [(trampoline, level.cell_at(trampoline.rect)) for trampoline in level.trampolines]
+
+    def update(self, player):
+        """
+        Write the current state of the level into the arrays.
+
+        Args:
+            player (Mappy): The player.
+        """
+        level = self.level
+        grid = self._grid
+        entities = self._entities
+
+        if level.chunk_version != self.chunk_version:
+            self.find_static_cells()
+
+        grid[TRAMPOLINE:].fill(0)
+
+        for trampoline, (r, c) in self.trampoline_cells:
+            grid[TRAMPOLINE, r, c] = 0 if trampoline.broken else 3 - trampoline.bounce_counter
+
+        for item, (r, c) in self.item_cells:
+            if item.alive():
+                grid[ITEM, r, c] = item.item_type
+                grid[TARGET, r, c] = item.item_type == level.targeted_item
+
+        for door, (r, c) in self.door_cells:
+            grid[DOOR, r, c] = 2 if door.state == 0 else 1
+            grid[SPECIAL_DOOR, r, c] = door.special
+
+        # Entity table: the player, then the Meowkies, then the waves
+        entities.fill(0)
+        self.encode_entity(0, KIND_PLAYER, player, PLAYER)
+
+        for row, meowky in enumerate(level.meowkies):
+            if row == self.max_meowkies:
+                break
+            self.encode_entity(1 + row, KIND_MEOWKY, meowky, MEOWKY)
+
+        for row, wave in enumerate(level.waves):
+            if row == self.max_waves:
+                break
+            self.encode_entity(1 + self.max_meowkies + row, KIND_WAVE, wave, WAVE)
+
+    def encode_entity(self, row, kind, sprite, channel):
+        """
+        Write a moving entity into its row of the entity table and its cell of the grid.
+
+        Args:
+            row (int): The row of the entity table.
+            kind (int): KIND_PLAYER, KIND_MEOWKY or KIND_WAVE.
+            sprite (pygame.sprite.Sprite): The entity.
+            channel (int): The grid channel that counts this kind of entity.
+        """
+        r, c = self.level.cell_at(sprite.rect)
+        self._grid[channel, r, c] += 1
+
+        entities = self._entities
+        entities[row, KIND] = kind
+        entities[row, X] = sprite.rect.centerx - self.level.offset
+        entities[row, Y] = sprite.rect.bottom
+        entities[row, STATE] = STATE_INDEX.get(getattr(sprite, "state", None), -1)
+        entities[row, ROW] = r
+        entities[row, COLUMN] = c
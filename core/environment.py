@@ -0,0 +1,279 @@
+import os
+import heapq
+import random
+import numpy as np
+from itertools import islice
+import pygame
+
+from levels.level import Level
+from entities.mappy import Mappy
+from core.encoder import LevelEncoder, ENTITY_STATES
+from utils.tracer import tracer
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+"""
+This module defines a Gym-style environment around a Level and Mappy, for agents and batch
+experiments, and a vectorized variant that steps several independent levels in lockstep.
+
+Every step applies an action, updates Mappy and the level as the game does in one frame and
+returns the observation, the score gained as reward and whether the episode ended.
+"""
+
+# Actions, applied with the same rules as the keyboard in Game.handle_event
+NOOP, LEFT, RIGHT, DOWN, STOP = range(5)
+ACTIONS = [NOOP, LEFT, RIGHT, DOWN, STOP]
+
+OBSERVATION_MEOWKIES = 8  # Nearest Meowkies included in the observation
+OBSERVATION_ITEMS = 10  # Item slots included in the observation
+OBSERVATION_SIZE = 6 + OBSERVATION_MEOWKIES * 3 + OBSERVATION_ITEMS * 4
+
+# Start of the Meowky and item blocks of the observation
+MEOWKIES_START = 6
+ITEMS_START = MEOWKIES_START + OBSERVATION_MEOWKIES * 3
+
+def init_headless():
+    """
+    Initialize pygame without a window or sound card, unless the program already did.
+    """
+    if not pygame.get_init():
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        pygame.init()
+
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
+
+    # Tracing every step would take longer than the step itself
+    tracer.enabled = False
+
+def observe(level, player, out=None):
+    """
+    Build the observation of a level.
+
+    Positions are in level coordinates, divided by the level size. Meowkies are given relative
+    to the player, nearest first. Missing Meowkies and collected items are left as zeros.
+
+    The values are gathered in lists and written with one slice assignment per block, which is
+    much cheaper than setting the array element by element.
+
+    Args:
+        level (Level): The level.
+        player (Mappy): The player.
+        out (np.ndarray, optional): A float32 array of OBSERVATION_SIZE values to write into, such as a row of a batch. Defaults to a new array.
+
+    Returns:
+        np.ndarray: The float32 observation, of OBSERVATION_SIZE values.
+    """
+    if out is None:
+        out = np.zeros(OBSERVATION_SIZE, dtype=np.float32)
+    else:
+        out.fill(0)
+
+    width = level.width
+    height = level.height
+    player_x = player.rect.centerx
+    player_y = player.rect.bottom
+
+    # Player and round state
+    out[:MEOWKIES_START] = (
+        (player_x - level.offset) / width,
+        player_y / height,
+        ENTITY_STATES.index(player.state) / len(ENTITY_STATES) if player.state in ENTITY_STATES else 0,
+        level.targeted_item / 5,
+        float(level.streak),
+        level.items_left / OBSERVATION_ITEMS,
+    )
+
+    # Nearest Meowkies, without sorting all of them
+    values = []
+    nearest = heapq.nsmallest(OBSERVATION_MEOWKIES, level.meowkies, key=lambda meowky: abs(meowky.rect.centerx - player_x) + abs(meowky.rect.bottom - player_y))
+    for meowky in nearest:
+        values += ((meowky.rect.centerx - player_x) / width, (meowky.rect.bottom - player_y) / height, 1)
+    out[MEOWKIES_START:MEOWKIES_START + len(values)] = values
+
+    # Remaining items
+    values = []
+    for item in islice(level.items, OBSERVATION_ITEMS):
+        values += ((item.rect.centerx - level.offset) / width, item.rect.bottom / height, item.item_type / 5, 1)
+    out[ITEMS_START:ITEMS_START + len(values)] = values
+
+    return out
+
+class MappyEnv:
+    """
+    Single level environment with the reset/step interface of Gym.
+
+    Args:
+        level_number (int, optional): The level played in every episode. Defaults to 1.
+        max_steps (int, optional): Steps after which the episode is truncated. Defaults to 3600 (one minute).
+    """
+    def __init__(self, level_number=1, max_steps=3600):
+        init_headless()
+
+        self.level_number = level_number
+        self.max_steps = max_steps
+        self.level = None
+        self.player = None
+        self.steps = 0
+        self.encoder = None
+
+    def reset(self, seed=None, out=None):
+        """
+        Start a new episode with a newly generated level.
+
+        Args:
+            seed (int, optional): Seed of the random generator used to generate and play the level. Defaults to None.
+            out (np.ndarray, optional): Array the observation is written into. Defaults to a new array.
+
+        Returns:
+            tuple: The observation and an info dict.
+        """
+        if seed is not None:
+            random.seed(seed)
+
+        # Return the pooled sprites of the previous level before replacing it
+        if self.level:
+            self.level.release_pooled()
+
+        self.level = Level(self.level_number)
+        self.player = Mappy(SCREEN_WIDTH - 170, SCREEN_HEIGHT - 119)
+        self.player.level = self.level
+        self.steps = 0
+
+        if self.encoder:
+            self.encoder.attach(self.level)
+
+        return observe(self.level, self.player, out), {}
+
+    def encode(self):
+        """
+        Get the grid and entity encoding of the current state, see core.encoder.LevelEncoder.
+        The arrays are updated in place on every call and must not be kept across calls.
+
+        Returns:
+            tuple: The read-only grid and entity table views.
+        """
+        if self.encoder is None:
+            self.encoder = LevelEncoder()
+            self.encoder.attach(self.level)
+
+        self.encoder.update(self.player)
+        return self.encoder.grid, self.encoder.entities
+
+    def apply_action(self, action):
+        """
+        Apply an action to Mappy, with the same rules as the keyboard.
+
+        Args:
+            action (int): One of ACTIONS.
+        """
+        player = self.player
+
+        if action in [LEFT, RIGHT]:
+            if player.state in ["idle", "left", "right", "up"]:
+                if action == LEFT:
+                    player.move_left(self.level.platforms)
+                else:
+                    player.move_right(self.level.platforms)
+
+        elif action == DOWN:
+            if player.state in ["up"]:
+                player.move_down()
+
+        elif action == STOP:
+            if player.state in ["left", "right"]:
+                player.stop()
+
+    def step(self, action, out=None):
+        """
+        Advance the level by one frame.
+
+        Args:
+            action (int): One of ACTIONS.
+            out (np.ndarray, optional): Array the observation is written into. Defaults to a new array.
+
+        Returns:
+            tuple: The observation, the reward, whether the episode ended (caught, fell or level cleared),
+            whether it was truncated by max_steps, and an info dict.
+        """
+        self.apply_action(action)
+
+        self.player.update()
+        reward = self.level.update(self.player)
+        self.level.follow_player(self.player)
+        self.steps += 1
+
+        caught = self.level.check_collision(self.player)
+        fell = self.level.check_fall(self.player)
+        cleared = self.level.items_left == 0
+
+        terminated = caught or fell or cleared
+        truncated = not terminated and self.steps >= self.max_steps
+        info = {"caught": caught, "fell": fell, "cleared": cleared, "steps": self.steps}
+
+        return observe(self.level, self.player, out), float(reward), terminated, truncated, info
+
+class VectorMappyEnv:
+    """
+    Several independent MappyEnv stepped together, with batched observations and results.
+
+    Finished environments are reset automatically; the last observation of their episode
+    is given in the info dict as "final_observation".
+
+    Args:
+        num_envs (int): The number of environments.
+        level_number (int, optional): The level played in every episode. Defaults to 1.
+        max_steps (int, optional): Steps after which an episode is truncated. Defaults to 3600.
+    """
+    def __init__(self, num_envs, level_number=1, max_steps=3600):
+        self.envs = [MappyEnv(level_number, max_steps) for _ in range(num_envs)]
+        self.num_envs = num_envs
+
+        self.observations = np.zeros((num_envs, OBSERVATION_SIZE), dtype=np.float32)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.terminated = np.zeros(num_envs, dtype=bool)
+        self.truncated = np.zeros(num_envs, dtype=bool)
+
+    def reset(self, seed=None):
+        """
+        Start a new episode in every environment.
+
+        Args:
+            seed (int, optional): Seed of the random generator. The levels are generated one after another from it. Defaults to None.
+
+        Returns:
+            tuple: The (num_envs, OBSERVATION_SIZE) observations and a list of info dicts.
+        """
+        if seed is not None:
+            random.seed(seed)
+
+        infos = []
+        for i, env in enumerate(self.envs):
+            _, info = env.reset(out=self.observations[i])
+            infos.append(info)
+
+        return self.observations.copy(), infos
+
+    def step(self, actions):
+        """
+        Advance every environment by one frame.
+
+        Args:
+            actions (sequence): One action for each environment.
+
+        Returns:
+            tuple: The observations, rewards, terminated and truncated flags as arrays of num_envs rows, and a list of info dicts.
+        """
+        infos = []
+        for i, env in enumerate(self.envs):
+            # Observations are written straight into their row of the batch
+            row = self.observations[i]
+            _, self.rewards[i], self.terminated[i], self.truncated[i], info = env.step(int(actions[i]), row)
+
+            if self.terminated[i] or self.truncated[i]:
+                info["final_observation"] = row.copy()
+                env.reset(out=row)
+
+            infos.append(info)
+
+        return self.observations.copy(), self.rewards.copy(), self.terminated.copy(), self.truncated.copy(), infos
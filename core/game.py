@@ -1,7 +1,8 @@
+import time
 import pygame
 from os import path
 
-from config.settings import BLACK, SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, PROFILER_HISTORY, PROFILER_OVERLAY_SCALE, TRACE_DIR, PRELOADED_SOUNDS, ASSET_PACK_FILE, STARTUP_LOG
 
 from entities.mappy import Mappy
 
@@ -13,8 +14,16 @@ from core.scenes.transition_screen import TransitionScene
 from core.scenes.game_over_screen import GameOverScreen
 from core.scenes.scores_screen import ScoresScreen
 from core.scenes.pause_screen import PauseScreen
+from core.scenes.profiler_overlay import ProfilerOverlay
+from core.scenes.game_scenes import StartScene, ChangeScene, LevelScene, BlockScene, ResetScene, GameOverScene, GameOverScreenScene, ScoresScene, PauseScene
 
-from utils.helpers import save_score, save_progress, load_progress
+from utils.profiler import FrameProfiler
+from utils.latency import InputLatency
+from utils.frame_pacer import FramePacer
+from utils.telemetry import SessionMetrics, telemetry
+from utils.animation import clock
+from utils.tracer import traced, tracer
+from utils.assets import AssetLoader, list_files, load_sound, open_asset_pack, in_asset_pack
 
 class Game:
     """
@@ -22,28 +31,77 @@ class Game:
 
     Args:
         screen (pygame.Surface): The screen surface where the game will be drawn.
+        start_time (float, optional): The time.perf_counter() value when the program started. Defaults to now.
     """
-    def __init__(self, screen):
+    def __init__(self, screen, start_time=None):
         # Initialize sprite group and screen dimensions
         self.screen = screen
         self.all_sprites = pygame.sprite.Group()
+        self.start_time = start_time if start_time is not None else time.perf_counter()
 
         self.width = SCREEN_WIDTH
         self.height = SCREEN_HEIGHT
 
+        # The scenes that only need fonts are ready for the first frame
         self.transition_scene = TransitionScene(self.width, self.height)
         self.start_screen = StartScreen(self.width, self.height)
         self.game_over_screen = GameOverScreen(self.width, self.height)
-        self.scores_screen = ScoresScreen(self.width, self.height - 150)
         self.pause_screen = PauseScreen(self.width, self.height)
+
+        # Scene objects, looked up by the name of the current scene
+        self.scenes = {
+            "start": StartScene(self),
+            "change": ChangeScene(self),
+            "level": LevelScene(self),
+            "block": BlockScene(self),
+            "reset": ResetScene(self),
+            "game_over": GameOverScene(self),
+            "game_over_screen": GameOverScreenScene(self),
+            "scores": ScoresScene(self),
+            "pause": PauseScene(self),
+        }
+        self.redraw = True  # Whether a static scene must be drawn again
         self.scene = "start"
 
+        # Map the prebuilt asset pack, if there is one, so its assets need no decoding
+        open_asset_pack(ASSET_PACK_FILE)
+
+        # Decode the remaining sprites and sounds in the background while the start screen is shown
+        sounds_path = path.join("assets", "sounds")
+        self.loader = AssetLoader(
+            [file_path for file_path in list_files(path.join("assets", "sprites"), ".png") if not in_asset_pack(file_path)],
+            [path.join(sounds_path, file_name) for file_name in PRELOADED_SOUNDS if not in_asset_pack(path.join(sounds_path, file_name))],
+        )
+        self.loader.start()
+        self.assets_ready = False
+
+        # Frame profiler, toggled with F3
+        self.profiler = FrameProfiler(PROFILER_HISTORY)
+        self.profiler_overlay = ProfilerOverlay(*PROFILER_OVERLAY_SCALE)
+
+        # Latency of the movement keys, from handle_event to the flipped frame
+        self.latency = InputLatency()
+
+        # Frame scheduler of the main loop, with its pacing statistics printed with F5
+        self.pacer = FramePacer(FPS)
+
+        # Session and level metrics, written to the telemetry file
+        self.metrics = SessionMetrics(telemetry)
+
         self.initial_level_score = 0
         self.level_number = 1
         self.level = None
 
         self.block_count = 0
         self.controls = False
+        self.is_music = False
+
+    def finish_loading(self):
+        """
+        Wait for the background loader and create the objects that need its assets:
+        the player, the HUD, the scores screen and the sounds.
+        """
+        self.loader.wait()
 
         self.player = Mappy(self.width - 170, self.height - 119)
         self.all_sprites.add(self.player)
@@ -51,15 +109,46 @@ class Game:
         self.HUD = HUD(SCREEN_WIDTH, 60)
         self.HUD.player_lifes = self.player.lifes
 
+        self.scores_screen = ScoresScreen(self.width, self.height - 150)
+
         self.load_sounds()
-        self.is_music = False
+        self.assets_ready = True
+
+        # Report how long the assets took to be ready
+        elapsed_ms = (time.perf_counter() - self.start_time) * 1000
+        tracer.instant("assets ready", "assets")
+        if STARTUP_LOG:
+            print(f"Assets ready {elapsed_ms:.0f} ms after start ({self.loader.total} files)")
 
+    @property
+    def scene(self):
+        """str: The name of the current scene, a key of self.scenes. Changing it redraws the screen."""
+        return self._scene
+
+    @scene.setter
+    def scene(self, name):
+        self._scene = name
+        self.redraw = True
+
+    @traced("Game.load_level", "level")
     def load_level(self):
         """
         Load the current level based on the level number.
         """
+        # Return the pooled sprites of the previous level before replacing it
+        if self.level:
+            self.level.release_pooled()
+
         # Create a new Level instance
-        self.level = Level(self.level_number)
+        build_start = time.perf_counter()
+        self.level = Level(self.level_number, self.profiler)
+        self.metrics.start_level(self.level, self.level_number, (time.perf_counter() - build_start) * 1000, self.HUD.current_score)
+
+    def close(self):
+        """
+        Send the metrics of the session to the telemetry file, before the game closes.
+        """
+        self.metrics.end_session(self.HUD.current_score if self.assets_ready else 0)
 
     def handle_event(self, event):
         """
@@ -69,308 +158,115 @@ class Game:
             event (pygame.event.Event): The event to handle.
         """
 
-        # Handle events for different scenes
-        if self.scene == "start":
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
-                    self.scene = "change"
-                    self.sounds["game_start"].play()
-
-                if event.key == pygame.K_l:
-                    prev_save = load_progress()
-                    if prev_save["level"] != -1:
-                        self.level_number = prev_save["level"]
-                        self.HUD.current_score = prev_save["score"]
-                        self.player.lifes = prev_save["lifes"]
-                        self.HUD.player_lifes = prev_save["lifes"]
-                        self.scene = "change"
-                        self.sounds["game_start"].play()
-
-        elif self.scene == "level" and self.controls == True:
-            if event.type == pygame.KEYDOWN:
-                if self.player.state in ["idle", "left", "right", "up"]:
-                    if event.key == pygame.K_LEFT:
-                        self.player.move_left(self.level.platforms)
-                    elif event.key == pygame.K_RIGHT:
-                        self.player.move_right(self.level.platforms)
-                
-                if self.player.state in ["up"]:
-                    if event.key == pygame.K_DOWN:
-                        self.player.move_down()
-
-                if event.key == pygame.K_ESCAPE:
-                    self.scene = "pause"
-
-            if event.type == pygame.KEYUP:
-                if self.player.state in ["left", "right"]:
-                    if event.key == pygame.K_LEFT or event.key == pygame.K_RIGHT:
-                        self.player.stop()
-        
-        elif self.scene == "scores":
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_LEFT:
-                    self.scores_screen.change_selection("left")
-                elif event.key == pygame.K_RIGHT:
-                    self.scores_screen.change_selection("right")
-                elif event.key == pygame.K_UP:
-                    self.scores_screen.change_letter("up")
-                    self.scores_screen.generate_top_5_with_status()
-                elif event.key == pygame.K_DOWN:
-                    self.scores_screen.change_letter("down")
-                    self.scores_screen.generate_top_5_with_status()
-                elif event.key == pygame.K_SPACE:
-                    if "." not in self.scores_screen.current_name:
-                        save_score(self.scores_screen.current_name, self.scores_screen.current_score, self.scores_screen.current_round)
-                        self.scene = "start"
-                        self.level_number = 1
-                        self.scores_screen.current_name = "..."
-                        self.HUD.current_score = 0
-                        self.player.state = "idle"
-                        self.player.lifes = 4
-
-        elif self.scene == "pause":
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.scene = "level"
-                if event.key == pygame.K_q:
-                    save_progress(self.level_number, self.initial_level_score, self.player.lifes)
-                    self.start_screen.load_level()
-                    self.scene = "start"
-                    self.level_number = 1
-                    self.scores_screen.current_name = "..."
-                    self.HUD.current_score = 0
-                    self.player.state = "idle"
-                    self.player.lifes = 4
-                    self.HUD.player_lifes = 4
-                    self.level = None
-                    self.block_count = 0
-
-    def scroll_screen(self):
-        """
-        Scroll the screen horizontally based on the player's position.
-        """
-
-        # Adjust screen offset for scrolling
-        screen_mid = self.width // 2
-
-        if self.level.width > self.width:
-            if self.player.rect.centerx > screen_mid:
-                if ((self.width - 60) - self.level.offset) < self.level.width:
-                    movement = self.player.speed_x if self.player.state in ["right"] else self.player.speed_x - 1
-                    self.player.rect.centerx = screen_mid
-                    self.level.scroll(-movement)
-
-            if self.player.rect.centerx < screen_mid:
-                if -self.level.offset > 0:
-                    movement = self.player.speed_x if self.player.state in ["left"] else self.player.speed_x - 1
-                    self.player.rect.centerx = screen_mid
-                    self.level.scroll(movement)
-
-    def update(self, dt):
-        """
-        Update the game state based on the current scene and elapsed time.
-
-        Args:
-            dt (float): The time elapsed since the last update.
-        """
-        # Update game state for different scenes
-        self.all_sprites.update()
+        # Any input or window event may change what a static scene shows
+        self.redraw = True
 
-        if self.scene == "level":
-            self.update_level()
-            
-        elif self.scene == "block":
-            self.block_level()
+        # Toggle the profiler overlay in any scene
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.profiler.toggle()
 
-        elif self.scene == "change":
-            self.change_level()
+        # Export the recorded trace in any scene
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+            self.export_trace()
 
-        elif self.scene == "reset":
-            self.reset_level()
+        # Print the frame pacing statistics in any scene
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F5:
+            for line in self.pacer.report():
+                print(line)
 
-        elif self.scene == "game_over":
-            self.game_over()
+        # Follow the movement keys while the player has control
+        sample = None
+        if event.type == pygame.KEYDOWN and event.key in [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_DOWN] and self.scene == "level" and self.controls:
+            sample = self.latency.key_down(event.key)
+            previous_state = self.player.state
 
-        elif self.scene == "game_over_screen":
-            self.game_over_transition()
+        # Handle events for the current scene
+        self.scenes[self.scene].handle_event(event)
 
-    def update_level(self, inital_block: int = 2):
-        """
-        Update the level state, including player actions and level transitions.
+        if sample:
+            self.latency.key_handled(sample, previous_state, self.player)
 
-        Args:
-            inital_block (int): The initial block duration before enabling controls.
+    def export_trace(self):
         """
+        Export the spans recorded by the tracer to a Chrome trace JSON file.
 
-        # Update level logic and handle transitions
-        if self.block_count > FPS * inital_block:
-            if not self.is_music:
-                pygame.mixer.music.play(-1)
-                self.is_music = True
-
-            self.controls = True
-            score = self.level.update(self.player)
-            self.HUD.add_score(score)
-            self.scroll_screen()
-
-            # Verifies end game conditions
-            if len(self.level.items) == 0:
-                pygame.mixer.music.stop()
-                self.is_music = False
-                self.sounds["level_clear"].play()
-
-                self.block_count = 0
-                self.scene = "block"
-                self.player.stop()
-
-            if self.level.check_collision(self.player) or self.level.check_fall(self.player):
-                pygame.mixer.music.stop()
-                self.is_music = False
-                self.sounds["miss"].play()
-
-                self.block_count = 0
-                self.player.stop()
-                self.player.lifes -= 1
-                
-                self.scene = "reset" if self.player.lifes + 1 > 0 else "game_over"
-                self.level.scroll(-(abs(self.level.width - (SCREEN_WIDTH + abs(self.level.offset) - 60)))) # Resets the camera position
-                self.level.reset_meowkies()
-                self.level.reset_trampolines()
-        else:
-            self.controls = False
-            self.block_count += 1
-
-    def block_level(self, duration: int = 3):
+        Returns:
+            str: The path of the exported file.
         """
-        Handle the block level state, which is a pause between levels.
+        file_name = time.strftime("trace_%Y%m%d_%H%M%S.json")
+        return tracer.export(path.join(TRACE_DIR, file_name))
 
-        Args:
-            duration (int): The duration of the block state in seconds.
+    def scroll_screen(self):
         """
-
-        # Manage block level state
-        self.controls = False
-        if self.block_count > FPS * duration:
-            self.level_number = (self.level_number + 1) % 30  # Always loop between 1 and 30
-
-            # Bonus levels logic (not implemented)
-            if self.level_number not in [3, 7, 11, 15, 19, 23, 27]:
-                self.scene = "change"
-                self.block_count = 0
-        else:
-            self.block_count += 1
-
-    def change_level(self, duration: int = 2):
+        Scroll the screen horizontally based on the player's position.
         """
-        Transition to the next level after a delay.
 
-        Args:
-            duration (int): The duration of the transition state in seconds.
-        """
+        self.level.follow_player(self.player, self.width)
 
-        # Handle level transition logic
-        if self.block_count > FPS * duration:
-            self.scene = "level"
-            self.load_level()
-            self.player.rect.topleft = (self.width - 170, self.height - 119)
-            self.player.level = self.level
-            self.block_count = 0
-            self.initial_level_score = self.HUD.current_score
-        else:
-            self.block_count += 1
-
-    def reset_level(self, duration = 4):
+    def update(self, dt):
         """
-        Reset the current level after the player loses a life.
+        Update the game state based on the current scene and elapsed time.
 
         Args:
-            duration (int): The duration of the reset state in seconds.
+            dt (float): The time elapsed since the last update.
         """
+        self.profiler.begin_frame()
 
-        # Reset level state and player position
-        if self.block_count > FPS * duration:
-            self.HUD.player_lifes = self.player.lifes
-            self.player.death_animation_counter, self.player.death_animation_frame = 0, 0
-            self.player.state = "idle"
-            self.player.rect.topleft = (self.width - 170, self.height - 119)
-            self.block_count = 0
-            self.scene = "level"
-        else:
-            self.player.animate_death()
-            self.block_count += 1
-
-    def game_over(self, duration = 4):
-        """
-        Handle the game over state, transitioning to the game over screen.
+        # Finish loading as soon as the background loader is done
+        if not self.assets_ready:
+            if self.loader.finished():
+                self.finish_loading()
+            return
 
-        Args:
-            duration (int): The duration of the game over state in seconds.
-        """
+        # Scenes that wait for input do no work, and animations stand still in them
+        scene = self.scenes[self.scene]
+        if not scene.needs_update:
+            return
 
-        # Manage game over logic
-        if self.block_count > FPS * duration:
-            self.sounds["game_over"].play(maxtime=10*1000)
+        update_start = time.perf_counter()
+        clock.advance()
+        scene.update()
+        self.metrics.updated((time.perf_counter() - update_start) * 1000)
 
-            self.scene = "game_over_screen"
-            self.block_count = 0
-        else:
-            self.player.animate_death()
-            self.block_count += 1
+        if self.latency.pending:
+            self.latency.frame_updated()
 
-    def game_over_transition(self, duration = 10):
+    def needs_draw(self):
         """
-        Transition from the game over screen to the scores screen.
+        Check if the next frame differs from the one on screen. Static scenes are drawn again
+        only after an event or a scene change, unless the loading bar or the profiler overlay
+        is shown.
 
-        Args:
-            duration (int): The duration of the game over transition in seconds.
+        Returns:
+            bool: True if the frame must be drawn, False otherwise.
         """
+        return self.redraw or not self.scenes[self.scene].static or not self.assets_ready or self.profiler.enabled
 
-        # Handle game over to scores transition
-        if self.block_count > FPS * duration:
-            self.sounds["name_entry"].play()
+    def idle(self):
+        """
+        Check if the game has nothing to do until the next event.
 
-            self.scene = "scores"
-            self.scores_screen.current_round = self.level_number
-            self.scores_screen.current_score = self.HUD.current_score
-            self.scores_screen.generate_top_5_with_status()
-            self.block_count = 0
-        else:
-            self.block_count += 1
+        Returns:
+            bool: True if the current scene needs neither updates nor drawing, False otherwise.
+        """
+        return self.assets_ready and not self.scenes[self.scene].needs_update and not self.needs_draw()
 
     def draw(self):
         """
         Draw the current game scene to the screen.
         """
+        draw_start = time.perf_counter()
+        self.redraw = False
+        self.scenes[self.scene].draw(self.screen)
 
-        # Render the appropriate scene based on the current state
-        if self.scene == "start":
-            self.start_screen.draw(self.screen)
-
-        elif self.scene == "level" or self.scene == "block":
-            self.screen.fill(BLACK)
-            self.level.draw(self.screen)
-            self.HUD.draw(self.screen)
-            self.all_sprites.draw(self.screen)
-        
-        elif self.scene == "reset" or self.scene == "game_over":
-            self.screen.fill(BLACK)
-            self.HUD.draw(self.screen)
-            self.all_sprites.draw(self.screen)
-
-        elif self.scene == "change":
-            self.transition_scene.draw(self.screen, self.level_number)
-
-        elif self.scene == "game_over_screen":
-            self.game_over_screen.draw(self.screen)
-            self.HUD.draw(self.screen)
-
-        elif self.scene == "scores":
-            self.scores_screen.draw(self.screen)
-            self.HUD.draw(self.screen)
+        # Profiler overlay on top of the current scene
+        if self.profiler.enabled:
+            self.profiler_overlay.draw(self.screen, self.profiler)
 
-        elif self.scene == "pause":
-            self.pause_screen.draw(self.screen)
+        self.metrics.drawn((time.perf_counter() - draw_start) * 1000)
+        self.latency.frame_drawn()
 
+    @traced("Game.load_sounds", "assets")
     def load_sounds(self):
         """
         Load game sounds and music from the assets directory.
@@ -381,10 +277,10 @@ class Game:
 
         self.sounds = {
             "main_theme": pygame.mixer.music.load(path.join(base_bath, "mappy_main_theme.mp3")),
-            "credit": pygame.mixer.Sound(path.join(base_bath, "mappy_credit_sound.mp3")),
-            "game_over": pygame.mixer.Sound(path.join(base_bath, "mappy_game_over.mp3")),
-            "game_start": pygame.mixer.Sound(path.join(base_bath, "mappy_game_start.mp3")),
-            "miss": pygame.mixer.Sound(path.join(base_bath, "mappy_miss.mp3")),
-            "level_clear": pygame.mixer.Sound(path.join(base_bath, "mappy_level_clear.mp3")),
-            "name_entry": pygame.mixer.Sound(path.join(base_bath, "mappy_name_entry.mp3")),
+            "credit": load_sound(path.join(base_bath, "mappy_credit_sound.mp3")),
+            "game_over": load_sound(path.join(base_bath, "mappy_game_over.mp3")),
+            "game_start": load_sound(path.join(base_bath, "mappy_game_start.mp3")),
+            "miss": load_sound(path.join(base_bath, "mappy_miss.mp3")),
+            "level_clear": load_sound(path.join(base_bath, "mappy_level_clear.mp3")),
+            "name_entry": load_sound(path.join(base_bath, "mappy_name_entry.mp3")),
         }
\ No newline at end of file
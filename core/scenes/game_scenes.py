@@ -0,0 +1,406 @@
+import pygame
+
+from config.settings import BLACK, SCREEN_WIDTH, FPS
+
+from utils.helpers import save_score, save_progress, load_progress
+from utils.tracer import traced
+
+"""
+This module defines the scenes of the game as objects that handle their own events, updates
+and drawing. Game keeps the name of the current scene and dispatches to the matching object,
+so only the current scene does any work.
+
+The screens of core.scenes (StartScreen, PauseScreen, ...) only draw; the scenes below decide
+what happens in them and when to move to the next scene.
+"""
+
+class GameScene:
+    """
+    Base class of the scenes of the game.
+
+    Scenes that only wait for input set needs_update to False: their update is not called
+    and the animation clock stands still. Scenes that look the same until an event or a scene
+    change set static to True, so they are drawn once instead of every frame.
+
+    Args:
+        game (Game): The game the scene belongs to.
+    """
+    needs_update = True
+    static = False
+
+    def __init__(self, game):
+        self.game = game
+
+    def handle_event(self, event):
+        """
+        Handle an input event.
+
+        Args:
+            event (pygame.event.Event): The event to handle.
+        """
+
+    def update(self):
+        """
+        Advance the scene by one frame.
+        """
+
+    def draw(self, screen):
+        """
+        Draw the scene.
+
+        Args:
+            screen (pygame.Surface): The screen surface to draw on.
+        """
+
+class StartScene(GameScene):
+    """
+    Start screen, waiting for a new game or a saved one.
+    """
+    needs_update = False
+    static = True
+
+    def handle_event(self, event):
+        game = self.game
+
+        if event.type == pygame.KEYDOWN:
+            # A key that starts the game waits for the remaining assets
+            if event.key in [pygame.K_SPACE, pygame.K_l] and not game.assets_ready:
+                game.finish_loading()
+
+            if event.key == pygame.K_SPACE:
+                game.scene = "change"
+                game.sounds["game_start"].play()
+
+            if event.key == pygame.K_l:
+                prev_save = load_progress()
+                if prev_save["level"] != -1:
+                    game.level_number = prev_save["level"]
+                    game.HUD.current_score = prev_save["score"]
+                    game.player.lifes = prev_save["lifes"]
+                    game.HUD.player_lifes = prev_save["lifes"]
+                    game.scene = "change"
+                    game.sounds["game_start"].play()
+
+    def draw(self, screen):
+        game = self.game
+        game.start_screen.draw(screen, 1.0 if game.assets_ready else game.loader.progress())
+
+class LevelScene(GameScene):
+    """
+    The level being played.
+    """
+    def handle_event(self, event):
+        game = self.game
+        player = game.player
+
+        if not game.controls:
+            return
+
+        if event.type == pygame.KEYDOWN:
+            if player.state in ["idle", "left", "right", "up"]:
+                if event.key == pygame.K_LEFT:
+                    player.move_left(game.level.platforms)
+                elif event.key == pygame.K_RIGHT:
+                    player.move_right(game.level.platforms)
+
+            if player.state in ["up"]:
+                if event.key == pygame.K_DOWN:
+                    player.move_down()
+
+            if event.key == pygame.K_ESCAPE:
+                game.scene = "pause"
+
+        if event.type == pygame.KEYUP:
+            if player.state in ["left", "right"]:
+                if event.key == pygame.K_LEFT or event.key == pygame.K_RIGHT:
+                    player.stop()
+
+    @traced("LevelScene.update", "scene")
+    def update(self, inital_block: int = 2):
+        """
+        Update the level state, including player actions and level transitions.
+
+        Args:
+            inital_block (int): The initial block duration before enabling controls.
+        """
+        game = self.game
+
+        # The player only moves while a level is played
+        game.all_sprites.update()
+
+        # Update level logic and handle transitions
+        if game.block_count > FPS * inital_block:
+            if not game.is_music:
+                pygame.mixer.music.play(-1)
+                game.is_music = True
+
+            game.controls = True
+            with game.profiler.section("Level.update"):
+                score = game.level.update(game.player)
+            game.HUD.add_score(score)
+
+            with game.profiler.section("scroll_screen"):
+                game.scroll_screen()
+
+            # Verifies end game conditions
+            if game.level.items_left == 0:
+                pygame.mixer.music.stop()
+                game.is_music = False
+                game.sounds["level_clear"].play()
+                game.metrics.end_level("cleared", game.HUD.current_score)
+
+                game.block_count = 0
+                game.scene = "block"
+                game.player.stop()
+
+            if game.level.check_collision(game.player) or game.level.check_fall(game.player):
+                pygame.mixer.music.stop()
+                game.is_music = False
+                game.sounds["miss"].play()
+
+                game.block_count = 0
+                game.player.stop()
+                game.player.lifes -= 1
+                game.metrics.died()
+
+                game.scene = "reset" if game.player.lifes + 1 > 0 else "game_over"
+                if game.scene == "game_over":
+                    game.metrics.end_level("game_over", game.HUD.current_score)
+                game.level.scroll(-(abs(game.level.width - (SCREEN_WIDTH + abs(game.level.offset) - 60)))) # Resets the camera position
+                game.level.reset_meowkies()
+                game.level.reset_trampolines()
+        else:
+            game.controls = False
+            game.block_count += 1
+
+    def draw(self, screen):
+        game = self.game
+
+        screen.fill(BLACK)
+        with game.profiler.section("Level.draw"):
+            game.level.draw(screen)
+        with game.profiler.section("HUD.draw"):
+            game.HUD.draw(screen)
+        with game.profiler.section("all_sprites.draw"):
+            game.all_sprites.draw(screen)
+
+class BlockScene(LevelScene):
+    """
+    Pause between a cleared level and the next one, with the level still shown.
+    """
+    def handle_event(self, event):
+        pass
+
+    @traced("BlockScene.update", "scene")
+    def update(self, duration: int = 3):
+        """
+        Handle the block level state, which is a pause between levels.
+
+        Args:
+            duration (int): The duration of the block state in seconds.
+        """
+        game = self.game
+
+        # Manage block level state
+        game.controls = False
+        if game.block_count > FPS * duration:
+            game.level_number = game.level_number % 30 + 1  # Always loop between 1 and 30
+
+            # Bonus levels logic (not implemented)
+            if game.level_number not in [3, 7, 11, 15, 19, 23, 27]:
+                game.scene = "change"
+                game.block_count = 0
+        else:
+            game.block_count += 1
+
+class ChangeScene(GameScene):
+    """
+    Transition screen showing the number of the next round.
+    """
+    static = True
+
+    @traced("ChangeScene.update", "scene")
+    def update(self, duration: int = 2):
+        """
+        Transition to the next level after a delay.
+
+        Args:
+            duration (int): The duration of the transition state in seconds.
+        """
+        game = self.game
+
+        # Handle level transition logic
+        if game.block_count > FPS * duration:
+            game.scene = "level"
+            game.load_level()
+            game.player.rect.topleft = (game.width - 170, game.height - 119)
+            game.player.level = game.level
+            game.block_count = 0
+            game.initial_level_score = game.HUD.current_score
+        else:
+            game.block_count += 1
+
+    def draw(self, screen):
+        self.game.transition_scene.draw(screen, self.game.level_number)
+
+class DeathScene(GameScene):
+    """
+    Base class of the scenes that show the death animation of the player.
+    """
+    def draw(self, screen):
+        game = self.game
+
+        screen.fill(BLACK)
+        with game.profiler.section("HUD.draw"):
+            game.HUD.draw(screen)
+        with game.profiler.section("all_sprites.draw"):
+            game.all_sprites.draw(screen)
+
+class ResetScene(DeathScene):
+    """
+    The player lost a life and the level starts again.
+    """
+    @traced("ResetScene.update", "scene")
+    def update(self, duration = 4):
+        """
+        Reset the current level after the player loses a life.
+
+        Args:
+            duration (int): The duration of the reset state in seconds.
+        """
+        game = self.game
+        player = game.player
+
+        # Reset level state and player position
+        if game.block_count > FPS * duration:
+            game.HUD.player_lifes = player.lifes
+            player.animator.stop()
+            player.state = "idle"
+            player.rect.topleft = (game.width - 170, game.height - 119)
+            game.block_count = 0
+            game.scene = "level"
+        else:
+            player.animate_death()
+            game.block_count += 1
+
+class GameOverScene(DeathScene):
+    """
+    The player lost the last life.
+    """
+    @traced("GameOverScene.update", "scene")
+    def update(self, duration = 4):
+        """
+        Handle the game over state, transitioning to the game over screen.
+
+        Args:
+            duration (int): The duration of the game over state in seconds.
+        """
+        game = self.game
+
+        # Manage game over logic
+        if game.block_count > FPS * duration:
+            game.sounds["game_over"].play(maxtime=10*1000)
+
+            game.scene = "game_over_screen"
+            game.block_count = 0
+        else:
+            game.player.animate_death()
+            game.block_count += 1
+
+class GameOverScreenScene(GameScene):
+    """
+    Game over screen, shown for a while before the scores.
+    """
+    static = True
+
+    @traced("GameOverScreenScene.update", "scene")
+    def update(self, duration = 10):
+        """
+        Transition from the game over screen to the scores screen.
+
+        Args:
+            duration (int): The duration of the game over transition in seconds.
+        """
+        game = self.game
+
+        # Handle game over to scores transition
+        if game.block_count > FPS * duration:
+            game.sounds["name_entry"].play()
+
+            game.scene = "scores"
+            game.scores_screen.current_round = game.level_number
+            game.scores_screen.current_score = game.HUD.current_score
+            game.scores_screen.generate_top_5_with_status()
+            game.block_count = 0
+        else:
+            game.block_count += 1
+
+    def draw(self, screen):
+        self.game.game_over_screen.draw(screen)
+        self.game.HUD.draw(screen)
+
+class ScoresScene(GameScene):
+    """
+    Name entry and best scores.
+    """
+    needs_update = False
+    static = True
+
+    def handle_event(self, event):
+        game = self.game
+        scores_screen = game.scores_screen
+
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_LEFT:
+                scores_screen.change_selection("left")
+            elif event.key == pygame.K_RIGHT:
+                scores_screen.change_selection("right")
+            elif event.key == pygame.K_UP:
+                scores_screen.change_letter("up")
+                scores_screen.generate_top_5_with_status()
+            elif event.key == pygame.K_DOWN:
+                scores_screen.change_letter("down")
+                scores_screen.generate_top_5_with_status()
+            elif event.key == pygame.K_SPACE:
+                if "." not in scores_screen.current_name:
+                    save_score(scores_screen.current_name, scores_screen.current_score, scores_screen.current_round)
+                    game.scene = "start"
+                    game.level_number = 1
+                    scores_screen.current_name = "..."
+                    game.HUD.current_score = 0
+                    game.player.state = "idle"
+                    game.player.lifes = 4
+
+    def draw(self, screen):
+        self.game.scores_screen.draw(screen)
+        self.game.HUD.draw(screen)
+
+class PauseScene(GameScene):
+    """
+    The level is paused, the animations stand still.
+    """
+    needs_update = False
+    static = True
+
+    def handle_event(self, event):
+        game = self.game
+
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                game.scene = "level"
+            if event.key == pygame.K_q:
+                save_progress(game.level_number, game.initial_level_score, game.player.lifes)
+                game.metrics.end_level("quit", game.HUD.current_score)
+                game.start_screen.load_level()
+                game.scene = "start"
+                game.level_number = 1
+                game.scores_screen.current_name = "..."
+                game.HUD.current_score = 0
+                game.player.state = "idle"
+                game.player.lifes = 4
+                game.HUD.player_lifes = 4
+                game.level = None
+                game.block_count = 0
+
+    def draw(self, screen):
+        self.game.pause_screen.draw(screen)
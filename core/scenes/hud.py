@@ -1,9 +1,10 @@
-import pygame
 from os import path
 
 from core.scenes.scene import Scene
 from config.settings import WHITE, RED, SCREEN_HEIGHT
 from utils.helpers import load_scores
+from utils.tracer import traced
+from utils.assets import load_sprite
 
 class HUD(Scene):
     """
@@ -77,9 +78,10 @@ class HUD(Scene):
         for i in range(self.player_lifes):
             screen.blit(self.hearth_image, (i * 40 + 5, SCREEN_HEIGHT - 50))
 
+    @traced("HUD.load_images", "assets")
     def load_images(self):
         """
         Load the images required for the HUD, such as the heart icon.
         """
         base_path = path.join("assets", "sprites", "hud")
-        self.hearth_image = pygame.image.load(path.join(base_path, "hearth_mappy.png"))
\ No newline at end of file
+        self.hearth_image = load_sprite(path.join(base_path, "hearth_mappy.png"))
\ No newline at end of file
@@ -0,0 +1,82 @@
+import pygame
+from os import path
+
+from core.scenes.scene import Scene
+from utils.assets import load_font
+from config.settings import WHITE, YELLOW, RED, GREEN, FPS, PROFILER_FONT_SIZE, PROFILER_GRAPH_HEIGHT
+
+class ProfilerOverlay(Scene):
+    """
+    Overlay drawn on top of any scene with the timings collected by the frame profiler.
+    Shows the rolling average of every section and a graph of the last frame times.
+    """
+
+    def __init__(self, width, height):
+        """
+        Initialize the overlay with the given dimensions.
+
+        Args:
+            width (int): The width of the overlay panel.
+            height (int): The height of the overlay panel.
+        """
+        super().__init__(width, height)
+
+        font_path = path.join("assets", "fonts", "Jersey25-Regular.ttf")
+        self.small_font = load_font(font_path, PROFILER_FONT_SIZE)
+
+        self.panel = pygame.Surface((width, height), pygame.SRCALPHA)
+
+    def draw(self, screen, profiler):
+        """
+        Draw the profiler timings onto the provided screen.
+
+        Args:
+            screen (pygame.Surface): The screen surface to draw on.
+            profiler (FrameProfiler): The profiler with the collected timings.
+        """
+        # Translucent background
+        self.panel.fill((0, 0, 0, 170))
+
+        line_height = PROFILER_FONT_SIZE
+        y = 5
+
+        # Frame time and FPS
+        frame_ms = profiler.average_frame_time()
+        fps = 1000 / frame_ms if frame_ms else 0
+        header = self.small_font.render(f"frame {frame_ms:5.2f} ms  ({fps:4.0f} FPS)", True, YELLOW)
+        self.panel.blit(header, (5, y))
+        y += line_height
+
+        # Rolling averages of every section, in the order they were first measured
+        for name in profiler.sections:
+            name_text = self.small_font.render(name, True, WHITE)
+            time_text = self.small_font.render(f"{profiler.average(name):.2f} ms", True, WHITE)
+            self.panel.blit(name_text, (5, y))
+            self.panel.blit(time_text, (self.width - time_text.get_width() - 5, y))
+            y += line_height
+
+        # Last value of every counter
+        for name, value in profiler.counters.items():
+            name_text = self.small_font.render(name, True, YELLOW)
+            value_text = self.small_font.render(str(value), True, YELLOW)
+            self.panel.blit(name_text, (5, y))
+            self.panel.blit(value_text, (self.width - value_text.get_width() - 5, y))
+            y += line_height
+
+        # Frame time graph, one bar per frame, with the frame budget as a reference line
+        graph_top = self.height - PROFILER_GRAPH_HEIGHT - 5
+        graph_bottom = self.height - 5
+        budget_ms = 1000 / FPS
+        scale = PROFILER_GRAPH_HEIGHT / (budget_ms * 2)
+
+        bar_width = max(1, (self.width - 10) // profiler.history)
+        for i, frame_time in enumerate(profiler.frame_times):
+            bar_height = min(PROFILER_GRAPH_HEIGHT, int(frame_time * scale))
+            color = GREEN if frame_time <= budget_ms * 1.1 else RED
+            pygame.draw.rect(self.panel, color, (5 + i * bar_width, graph_bottom - bar_height, bar_width, bar_height))
+
+        budget_y = graph_bottom - int(budget_ms * scale)
+        pygame.draw.line(self.panel, YELLOW, (5, budget_y), (self.width - 5, budget_y))
+        pygame.draw.line(self.panel, WHITE, (5, graph_top), (5, graph_bottom))
+
+        screen.blit(self.panel, (0, 0))
@@ -1,7 +1,7 @@
-import pygame
 from os import path
 
 from config.settings import TEXT_FONT_SIZE, TITLE_FONT_SIZE
+from utils.assets import load_font
 
 """
 This module defines the Scene class, which serves as a base class for different game scenes.
@@ -22,5 +22,5 @@ class Scene:
 
         # Load the font for titles and text from the assets directory
         font_path = path.join("assets", "fonts", "Jersey25-Regular.ttf")
-        self.title_font = pygame.font.Font(font_path, TITLE_FONT_SIZE)
-        self.text_font = pygame.font.Font(font_path, TEXT_FONT_SIZE)
\ No newline at end of file
+        self.title_font = load_font(font_path, TITLE_FONT_SIZE)
+        self.text_font = load_font(font_path, TEXT_FONT_SIZE)
\ No newline at end of file
@@ -1,4 +1,3 @@
-import pygame
 import string
 from os import path
 
@@ -6,6 +5,8 @@ from core.scenes.scene import Scene
 from config.settings import BLACK, WHITE, YELLOW, SCREEN_WIDTH, SCREEN_HEIGHT
 
 from utils.helpers import load_scores
+from utils.tracer import traced
+from utils.assets import load_sprite
 
 class ScoresScreen(Scene):
     """
@@ -147,6 +148,7 @@ class ScoresScreen(Scene):
         inst_text_rect = inst_text.get_rect(center=(self.width // 2, self.height))
         screen.blit(inst_text, inst_text_rect)
 
+    @traced("ScoresScreen.load_images", "assets")
     def load_images(self, width, height):
         """
         Load the images required for the scores screen.
@@ -156,4 +158,4 @@ class ScoresScreen(Scene):
             height (int): The height of the screen.
         """
         base_path = path.join("assets", "sprites", "structures")
-        self.image = pygame.transform.scale(pygame.image.load(path.join(base_path, "goro_house.png")), (width, height))
\ No newline at end of file
+        self.image = load_sprite(path.join(base_path, "goro_house.png"), (width, height))
\ No newline at end of file
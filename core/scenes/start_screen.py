@@ -1,3 +1,5 @@
+import pygame
+
 from core.scenes.scene import Scene
 from config.settings import BLACK, GRAY, WHITE
 
@@ -19,12 +21,13 @@ class StartScreen(Scene):
         super().__init__(width, height)
         self.prev_save = load_progress()
 
-    def draw(self, screen):
+    def draw(self, screen, progress=1.0):
         """
         Draw the start screen elements onto the provided screen.
 
         Args:
             screen (pygame.Surface): The screen surface to draw on.
+            progress (float, optional): Fraction of the assets already loaded. Defaults to 1.0.
         """
         # Fill the background with a solid color
         screen.fill(BLACK)
@@ -51,5 +54,12 @@ class StartScreen(Scene):
         screen.blit(instructions1_text, instructions1_rect)
         screen.blit(instructions2_text, instructions2_rect)
 
+        # Draw the loading bar while the assets are decoded in the background
+        if progress < 1.0:
+            bar_rect = pygame.Rect(0, 0, self.width // 2, 10)
+            bar_rect.center = (self.width // 2, self.height - 60)
+            pygame.draw.rect(screen, GRAY, bar_rect, 1)
+            pygame.draw.rect(screen, WHITE, (bar_rect.x, bar_rect.y, int(bar_rect.width * progress), bar_rect.height))
+
     def load_level(self):
         self.prev_save = load_progress()
\ No newline at end of file
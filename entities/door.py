@@ -1,6 +1,8 @@
 import pygame
 import random
 from os import path
+from utils.tracer import traced
+from utils.assets import load_sprite
 from config.settings import BROWN, CYAN, OPEN_DOOR_SCALE, CLOSED_DOOR_SCALE
 
 class Door(pygame.sprite.Sprite):
@@ -101,17 +103,18 @@ class Door(pygame.sprite.Sprite):
 
         return False
     
+    @traced("Door.load_images", "assets")
     def load_images(self):
         """Load all images for the door's states and types."""
         base_path = path.join("assets", "sprites", "doors")
 
-        OPEN_DOOR = pygame.transform.scale(pygame.image.load(path.join(base_path, "open_door.png")).convert_alpha(), OPEN_DOOR_SCALE)
-        DOOR_LEFT_CLOSED = pygame.transform.scale(pygame.image.load(path.join(base_path, "door_left_closed.png")).convert_alpha(), CLOSED_DOOR_SCALE)
-        DOOR_RIGHT_CLOSED = pygame.transform.scale(pygame.image.load(path.join(base_path, "door_right_closed.png")).convert_alpha(), CLOSED_DOOR_SCALE)
+        OPEN_DOOR = load_sprite(path.join(base_path, "open_door.png"), OPEN_DOOR_SCALE)
+        DOOR_LEFT_CLOSED = load_sprite(path.join(base_path, "door_left_closed.png"), CLOSED_DOOR_SCALE)
+        DOOR_RIGHT_CLOSED = load_sprite(path.join(base_path, "door_right_closed.png"), CLOSED_DOOR_SCALE)
 
-        SPECIAL_OPEN_DOOR = pygame.transform.scale(pygame.image.load(path.join(base_path, "special_open_door.png")).convert_alpha(), OPEN_DOOR_SCALE)
-        SPECIAL_DOOR_LEFT_CLOSED = pygame.transform.scale(pygame.image.load(path.join(base_path, "special_door_left_closed.png")).convert_alpha(), CLOSED_DOOR_SCALE)
-        SPECIAL_DOOR_RIGHT_CLOSED = pygame.transform.scale(pygame.image.load(path.join(base_path, "special_door_right_closed.png")).convert_alpha(), CLOSED_DOOR_SCALE)
+        SPECIAL_OPEN_DOOR = load_sprite(path.join(base_path, "special_open_door.png"), OPEN_DOOR_SCALE)
+        SPECIAL_DOOR_LEFT_CLOSED = load_sprite(path.join(base_path, "special_door_left_closed.png"), CLOSED_DOOR_SCALE)
+        SPECIAL_DOOR_RIGHT_CLOSED = load_sprite(path.join(base_path, "special_door_right_closed.png"), CLOSED_DOOR_SCALE)
 
         self.images = {
             "open_door": OPEN_DOOR,
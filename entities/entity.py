@@ -1,5 +1,8 @@
 import pygame
 
+from utils.animation import Animator
+from config.settings import SCREEN_WIDTH
+
 class Entity(pygame.sprite.Sprite):
     """Base class for all game entities, providing movement, collision detection, and animation capabilities."""
 
@@ -25,8 +28,26 @@ class Entity(pygame.sprite.Sprite):
         self.jump_frame = 0  # Current frame of the jump animation
         self.jump_duration = 20  # Total duration of the jump animation
 
-        self.animation_counter = 1  # Counter for animation frames
-        self.animation_frame = 1  # Current animation frame
+        self.animator = Animator()  # Plays the animation clips
+
+    def reset(self, x, y):
+        """Place the entity at a new position and clear its movement and animation state.
+
+        Args:
+            x (int): The x-coordinate of the entity's new position.
+            y (int): The y-coordinate of the entity's new position.
+        """
+        self.rect.topleft = (x, y)
+
+        self.direction = ""
+        self.state = "idle"
+        self.platform_change = None
+
+        self.jump_start = None
+        self.jump_end = None
+        self.jump_frame = 0
+
+        self.animator.stop()
 
     def move_left(self, platforms):
         """Move the entity to the left and handle platform interactions.
@@ -152,9 +173,18 @@ class Entity(pygame.sprite.Sprite):
             
         return False
 
+    def on_screen(self):
+        """Check if the entity overlaps the visible part of the level horizontally.
+
+        Returns:
+            bool: True if part of the entity is on screen, False otherwise.
+        """
+        return self.rect.right >= 0 and self.rect.left <= SCREEN_WIDTH
+
     def update(self):
         """Update the entity's position and state based on its current behavior."""
-        if self.state != "stun":
+        # Off-screen entities keep their old image, the animation clock gives the right frame once they are visible
+        if self.state != "stun" and self.on_screen():
             self.animate()
 
         if self.state != "jump":
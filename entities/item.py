@@ -1,8 +1,13 @@
 import pygame
 from os import path
 
-from utils.helpers import scale_image_by_height
-from config.settings import BASE_ITEM_SCORE
+from utils.tracer import traced
+from utils.assets import load_sprite, load_sound
+from utils.animation import clock
+from config.settings import BASE_ITEM_SCORE, ITEM_SCALES
+
+# Sprite of every item type
+ITEM_TYPES = {1: "radio", 2: "tv", 3: "computer", 4: "painting", 5: "safe"}
 
 class Item(pygame.sprite.Sprite):
     """Represents an item in the game that can be collected by the player."""
@@ -17,28 +22,16 @@ class Item(pygame.sprite.Sprite):
             height (int, optional): The height to scale the item's image. Defaults to 30.
         """
         super().__init__()
-        self.load_images()
         self.item_type = item_type
-        self.visible = True
-        self.animation_time = 0
+        self.blink_start = None  # Clock tick when the targeted animation started, None if not targeted
 
         # Set the item's image based on its type
-        match item_type:
-            case 1:
-                self.image = scale_image_by_height(self.images["radio"], height)
-            case 2:
-                self.image = scale_image_by_height(self.images["tv"], height)
-            case 3:
-                self.image = scale_image_by_height(self.images["computer"], height)
-            case 4:
-                self.image = scale_image_by_height(self.images["painting"], height)
-            case 5:
-                self.image = scale_image_by_height(self.images["safe"], height)
+        self.image = self.load_image(ITEM_TYPES[item_type], height)
 
         self.rect = self.image.get_rect(bottomright=(x, y))
 
         # Load the sound effect for item collection
-        self.sound = pygame.mixer.Sound(path.join("assets", "sounds", "mappy_item_get.mp3"))
+        self.sound = load_sound(path.join("assets", "sounds", "mappy_item_get.mp3"))
 
     def check_collision(self, player):
         """Check if the player collides with the item and handle the interaction.
@@ -55,27 +48,36 @@ class Item(pygame.sprite.Sprite):
         
         return 0
     
+    @property
+    def visible(self):
+        """bool: Whether the item is shown. Targeted items blink every 10 ticks of the animation clock."""
+        if self.blink_start is None:
+            return True
+
+        return clock.since(self.blink_start) // 10 % 2 == 0
+
     def start_targeted_animation(self):
         """Start the targeted animation for the item, making it blink."""
-        self.animation_time += 1
-        
-        if self.animation_time % 10 == 0:
-            self.visible = not self.visible
-            self.animation_time = 0
+        if self.blink_start is None:
+            self.blink_start = clock.tick
 
     def stop_targeted_animation(self):
         """Stop the targeted animation and make the item visible."""
-        self.visible = True
-        self.animation_time = 0
-
-    def load_images(self):
-        """Load all images for the different types of items."""
-        base_path = path.join("assets", "sprites", "loot")
-
-        self.images = {
-            "radio": pygame.image.load(path.join(base_path, "radio.png")).convert_alpha(),
-            "tv": pygame.image.load(path.join(base_path, "tv.png")).convert_alpha(),
-            "computer": pygame.image.load(path.join(base_path, "computer.png")).convert_alpha(),
-            "painting": pygame.image.load(path.join(base_path, "painting.png")).convert_alpha(),
-            "safe": pygame.image.load(path.join(base_path, "safe.png")).convert_alpha(),
-        }
\ No newline at end of file
+        self.blink_start = None
+
+    @traced("Item.load_image", "assets")
+    def load_image(self, name, height):
+        """Load the sprite of an item type at its final size, shared by every item of that type and height.
+
+        Args:
+            name (str): The name of the item type (e.g., "radio").
+            height (int): The height of the sprite, keeping the proportions of ITEM_SCALES.
+
+        Returns:
+            pygame.Surface: The sprite.
+        """
+        width, scale_height = ITEM_SCALES[name]
+        if height != scale_height:
+            width = round(width * height / scale_height)
+
+        return load_sprite(path.join("assets", "sprites", "loot", f"{name}.png"), (width, height))
\ No newline at end of file
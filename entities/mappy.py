@@ -2,8 +2,18 @@ import pygame
 from os import path
 
 from entities.entity import Entity
+from utils.tracer import traced
+from utils.atlas import load_atlas
+from utils.animation import load_clips
 from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, MAPPY_SCALE
 
+# Walking shows the idle frame one tick out of ten, dying shows seven frames for 15 ticks each
+MAPPY_CLIPS = {
+    "left": ([("moving_left", 9), ("idle", 1)], True),
+    "right": ([("moving_right", 9), ("idle", 1)], True),
+    "death": ([(f"death_animation_{n}", 15) for n in range(1, 8)], False),
+}
+
 class Mappy(Entity):
     """Represents the main character, Mappy, inheriting from the Entity class."""
 
@@ -22,9 +32,6 @@ class Mappy(Entity):
 
         self.lifes = lifes
 
-        self.death_animation_counter = 0
-        self.death_animation_frame = 1
-
     def update(self):
         """Update Mappy's position and ensure it stays within screen bounds."""
         super().update()
@@ -61,6 +68,7 @@ class Mappy(Entity):
 
             if trampoline_score:
                 trampoline.start_animation()
+                level.bounces += 1
 
             if trampoline != horizontal_match_trampoline:
                 trampoline.reset()
@@ -108,25 +116,18 @@ class Mappy(Entity):
                 item_score += item.check_collision(self)
 
                 if item_score:
-                    level.items.remove(item)
+                    level.remove_item(item)
 
                     if level.targeted_item == item.item_type:
                         level.streak = True
                         level.pairs_collected += 1
                     else:
-                        level.targeted_item = item.item_type
+                        level.set_target(item.item_type)
                         level.streak = False
 
                     score += item_score * (level.pairs_collected + 1) if level.streak else item_score
                     break
 
-        # Animate targeted items
-        for item in level.items:
-            if item.item_type == level.targeted_item:
-                item.start_targeted_animation()
-            else:
-                item.stop_targeted_animation()
-
         # Check collisions with walls
         for wall in level.walls:
             wall.check_collision(self)
@@ -134,28 +135,16 @@ class Mappy(Entity):
         return score
 
     def animate_death(self):
-        """Animate Mappy's death sequence."""
+        """Animate Mappy's death sequence, from its first frame when Mappy is just caught."""
+        self.animator.play(self.clips["death"], restart=self.state != "stun")
         self.state = "stun"
-        if self.death_animation_frame < 7:
-            if self.death_animation_counter % 15 == 0:
-                self.death_animation_frame += 1
-
-            self.death_animation_counter += 1
-
-        self.image = self.images[f"death_animation_{self.death_animation_frame}"]
+        self.image = self.animator.frame()
 
     def animate(self):
         """Animate Mappy based on its current state and direction."""
         if self.state in ["left", "right"]:
-            self.animation_counter += 1
-
-            if self.animation_counter % 10 == 0:
-                self.image = self.images["idle"]
-            else:
-                if self.state == "left":
-                    self.image = self.images["moving_left"]
-                else:
-                    self.image = self.images["moving_right"]
+            self.animator.play(self.clips[self.state])
+            self.image = self.animator.frame()
     
         elif self.state == "idle": self.image = self.images["idle"]
 
@@ -165,39 +154,20 @@ class Mappy(Entity):
             else:
                 self.image = self.images["jumping_right"]
 
+    @traced("Mappy.load_images", "assets")
     def load_images(self):
-        """Load all images for Mappy's animations and states."""
+        """Load all images for Mappy's animations and states, as views of the shared Mappy atlas."""
         base_path = path.join("assets", "sprites", "mappy")
 
-        MAPPY_IDLE = pygame.transform.scale(pygame.image.load(path.join(base_path, "static_mappy.png")).convert_alpha(), MAPPY_SCALE)
-        MAPPY_MOVING_LEFT = pygame.transform.scale(pygame.image.load(path.join(base_path, "moving_mappy.png")).convert_alpha(), MAPPY_SCALE)
-        MAPPY_MOVING_RIGHT = pygame.transform.flip(MAPPY_MOVING_LEFT, True, False)
-        MAPPY_JUMPING_LEFT = pygame.transform.scale(pygame.image.load(path.join(base_path, "jumping_mappy.png")).convert_alpha(), MAPPY_SCALE)
-        MAPPY_JUMPING_RIGHT = pygame.transform.flip(MAPPY_JUMPING_LEFT, True, False)
-
-        MAPPY_DEATH_ANIMATION_1 = pygame.transform.scale(pygame.image.load(path.join(base_path, "death_animation_1_mappy.png")).convert_alpha(), MAPPY_SCALE)
-        MAPPY_DEATH_ANIMATION_2 = pygame.transform.scale(pygame.image.load(path.join(base_path, "death_animation_2_mappy.png")).convert_alpha(), MAPPY_SCALE)
-        MAPPY_DEATH_ANIMATION_3 = pygame.transform.scale(pygame.image.load(path.join(base_path, "death_animation_3_mappy.png")).convert_alpha(), MAPPY_SCALE)
-        MAPPY_DEATH_ANIMATION_4 = pygame.transform.scale(pygame.image.load(path.join(base_path, "death_animation_4_mappy.png")).convert_alpha(), MAPPY_SCALE)
-        MAPPY_DEATH_ANIMATION_5 = pygame.transform.scale(pygame.image.load(path.join(base_path, "death_animation_5_mappy.png")).convert_alpha(), MAPPY_SCALE)
-        MAPPY_DEATH_ANIMATION_6 = pygame.transform.scale(pygame.image.load(path.join(base_path, "death_animation_6_mappy.png")).convert_alpha(), MAPPY_SCALE)
-        MAPPY_DEATH_ANIMATION_7 = pygame.transform.scale(pygame.image.load(path.join(base_path, "death_animation_7_mappy.png")).convert_alpha(), MAPPY_SCALE)
-        MAPPY_DEATH_ANIMATION_8 = pygame.transform.scale(pygame.image.load(path.join(base_path, "death_animation_8_mappy.png")).convert_alpha(), MAPPY_SCALE)
-        MAPPY_DEATH_ANIMATION_9 = pygame.transform.scale(pygame.image.load(path.join(base_path, "death_animation_9_mappy.png")).convert_alpha(), MAPPY_SCALE)
-
-        self.images = {
-            "idle": MAPPY_IDLE,
-            "moving_left": MAPPY_MOVING_LEFT,
-            "moving_right": MAPPY_MOVING_RIGHT,
-            "jumping_left": MAPPY_JUMPING_LEFT,
-            "jumping_right": MAPPY_JUMPING_RIGHT,
-            "death_animation_1": MAPPY_DEATH_ANIMATION_1,
-            "death_animation_2": MAPPY_DEATH_ANIMATION_2,
-            "death_animation_3": MAPPY_DEATH_ANIMATION_3,
-            "death_animation_4": MAPPY_DEATH_ANIMATION_4,
-            "death_animation_5": MAPPY_DEATH_ANIMATION_5,
-            "death_animation_6": MAPPY_DEATH_ANIMATION_6,
-            "death_animation_7": MAPPY_DEATH_ANIMATION_7,
-            "death_animation_8": MAPPY_DEATH_ANIMATION_8,
-            "death_animation_9": MAPPY_DEATH_ANIMATION_9,
-        }
\ No newline at end of file
+        frames = [
+            ("idle", path.join(base_path, "static_mappy.png"), MAPPY_SCALE, False),
+            ("moving_left", path.join(base_path, "moving_mappy.png"), MAPPY_SCALE, False),
+            ("moving_right", path.join(base_path, "moving_mappy.png"), MAPPY_SCALE, True),
+            ("jumping_left", path.join(base_path, "jumping_mappy.png"), MAPPY_SCALE, False),
+            ("jumping_right", path.join(base_path, "jumping_mappy.png"), MAPPY_SCALE, True),
+        ]
+        for n in range(1, 10):
+            frames.append((f"death_animation_{n}", path.join(base_path, f"death_animation_{n}_mappy.png"), MAPPY_SCALE, False))
+
+        self.images = load_atlas("mappy", frames).frames
+        self.clips = load_clips("mappy", self.images, MAPPY_CLIPS)
\ No newline at end of file
@@ -1,11 +1,19 @@
 import random
-import pygame
 
 from os import path
 
 from entities.entity import Entity
+from utils.tracer import traced
+from utils.atlas import load_atlas
+from utils.animation import load_clips
 from config.settings import MEOWKY_SCALE
 
+# Walking animations, two frames shown for 10 ticks each
+MEOWKY_CLIPS = {
+    "left": ([("moving_left_1", 10), ("moving_left_2", 10)], True),
+    "right": ([("moving_right_1", 10), ("moving_right_2", 10)], True),
+}
+
 class Meowky(Entity):
     """Represents the Meowky enemy character, inheriting from the Entity class."""
 
@@ -23,9 +31,28 @@ class Meowky(Entity):
 
         self.stun_counter = 0  # Counter for stun duration
         self.speed_x = 2  # Horizontal movement speed
+        self.nav_cell = None  # Level cell where Meowky last chose a direction
+        self.think_slot = 0  # Tick of the AI scheduler round in which Meowky decides
+
+    def reset(self, x, y):
+        """Reuse Meowky from a new position, as if it had just been created.
+
+        Args:
+            x (int): The x-coordinate of Meowky's new position.
+            y (int): The y-coordinate of Meowky's new position.
+        """
+        self.image = self.images["idle_1"]
+        super().reset(x, y)
+
+        self.stun_counter = 0
+        self.speed_x = 2
+        self.speed_y = 5
+        self.nav_cell = None
 
     def update_on_level(self, level, player):
-        """Update Meowky's behavior and interactions within the current level.
+        """Update Meowky's movement and interactions within the current level.
+
+        The decisions are taken separately by think, called by the level's AI scheduler.
 
         Args:
             level: The current level object containing platforms, trampolines, and walls.
@@ -33,19 +60,6 @@ class Meowky(Entity):
         """
         self.update()
 
-        # Randomly decide Meowky's movement based on player's position
-        if self.state not in ["jump", "down", "left", "right"]:
-            if random.random() < 0.1:
-                if player.rect.y > self.rect.y:
-                    if player.rect < self.rect:
-                        self.move_left(level.platforms)
-                    elif player.rect > self.rect:
-                        self.move_right(level.platforms)
-
-        # Idle state random movement
-        if self.state == "idle":
-            self.move_right(level.platforms) if random.randint(0, 1) == 0 else self.move_left(level.platforms)
-
         collide_list = self.list_group_collisions(level.platforms)
         horizontal_match_trampoline = None
 
@@ -103,6 +117,67 @@ class Meowky(Entity):
         for wall in level.walls:
             wall.check_collision(self)
 
+    def update_far(self, level):
+        """Cheap update for a Meowky walking far from the screen.
+
+        Meowky walks without animation or collision checks, turning around at the ends of its
+        platform span, as seen in the navigation graph, and at the closed doors. Open doors let it
+        through, as in the full update. It is not drawn, and the full update takes over as soon as
+        it gets close to the screen.
+
+        Args:
+            level: The current level object containing the navigation graph and the doors.
+        """
+        dx = -self.speed_x if self.state == "left" else self.speed_x
+        previous_cell = level.cell_at(self.rect)
+        self.rect.x += dx
+
+        cell = level.cell_at(self.rect)
+        if cell not in level.navigation.platform_cells or (cell != previous_cell and level.door_closed(cell)):
+            self.rect.x -= dx
+            self.state = "right" if self.state == "left" else "left"
+
+    def think(self, level, player):
+        """Decide Meowky's next movement.
+
+        Args:
+            level: The current level object containing platforms and the navigation graph.
+            player: The player object to chase.
+        """
+        # Follow the shortest path to the player
+        self.chase(level, player)
+
+        # Idle state random movement, when the player can not be reached
+        if self.state == "idle":
+            self.move_right(level.platforms) if random.randint(0, 1) == 0 else self.move_left(level.platforms)
+
+    def chase(self, level, player):
+        """Turn towards the next cell of the shortest path to the player, looked up in the level's navigation graph.
+
+        Walking Meowkies only decide when they enter a new cell. Vertical steps need no decision:
+        Meowky falls into the shafts and the trampolines bounce it up.
+
+        Args:
+            level: The current level object containing the navigation graph.
+            player: The player object to chase.
+        """
+        if self.state in ["jump", "down", "stun"]:
+            return
+
+        cell = level.cell_at(self.rect)
+        if self.state in ["left", "right"] and cell == self.nav_cell:
+            return
+        self.nav_cell = cell
+
+        step = level.navigation.next_step(cell, level.cell_at(player.rect))
+        if step is None or step[0] != cell[0]:
+            return
+
+        if step[1] < cell[1]:
+            self.move_left(level.platforms)
+        else:
+            self.move_right(level.platforms)
+
     def animate_death(self):
         """Animate Meowky's death by setting its image to the 'dead' state."""
         self.image = self.images["dead"]
@@ -110,18 +185,8 @@ class Meowky(Entity):
     def animate(self):
         """Animate Meowky based on its current state and direction."""
         if self.state in ["left", "right"]:
-            if self.animation_frame <= 2:
-                if self.animation_counter % 10 == 0:
-                    self.animation_frame += 1
-                else:
-                    if self.state == "left":
-                        self.image = self.images[f"moving_left_{self.animation_frame}"]
-                    else:
-                        self.image = self.images[f"moving_right_{self.animation_frame}"]
-
-                self.animation_counter += 1
-            else:
-                self.animation_frame = 1
+            self.animator.play(self.clips[self.state])
+            self.image = self.animator.frame()
     
         elif self.state in ["idle", "up", "down"]: self.image = self.images["idle_1"]
 
@@ -131,30 +196,19 @@ class Meowky(Entity):
             else:
                 self.image = self.images["moving_right_1"]
 
+    @traced("Meowky.load_images", "assets")
     def load_images(self):
-        """Load all images for Meowky's animations and states."""
+        """Load all images for Meowky's animations and states, as views of the shared Meowky atlas."""
         base_path = path.join("assets", "sprites", "meowky")
 
-        MEOWKY_IDLE_1 = pygame.transform.scale(pygame.image.load(path.join(base_path, "static_1_meowky.png")).convert_alpha(), MEOWKY_SCALE)
-        MEOWKY_IDLE_2 = pygame.transform.scale(pygame.image.load(path.join(base_path, "static_2_meowky.png")).convert_alpha(), MEOWKY_SCALE)
-
-        MEOWKY_MOVING_LEFT_1 = pygame.transform.scale(pygame.image.load(path.join(base_path, "moving_1_meowky.png")).convert_alpha(), MEOWKY_SCALE)
-        MEOWKY_MOVING_LEFT_2 = pygame.transform.scale(pygame.image.load(path.join(base_path, "moving_2_meowky.png")).convert_alpha(), MEOWKY_SCALE)
-        MEOWKY_MOVING_LEFT_3 = pygame.transform.scale(pygame.image.load(path.join(base_path, "moving_3_meowky.png")).convert_alpha(), MEOWKY_SCALE)
-        MEOWKY_MOVING_RIGHT_1 = pygame.transform.flip(MEOWKY_MOVING_LEFT_1, True, False)
-        MEOWKY_MOVING_RIGHT_2 = pygame.transform.flip(MEOWKY_MOVING_LEFT_2, True, False)
-        MEOWKY_MOVING_RIGHT_3 = pygame.transform.flip(MEOWKY_MOVING_LEFT_3, True, False)
-
-        MEOWKY_DEAD = pygame.transform.scale(pygame.image.load(path.join(base_path, "dead_meowky.png")).convert_alpha(), MEOWKY_SCALE)
-
-        self.images = {
-            "idle_1": MEOWKY_IDLE_1,
-            "idle_2": MEOWKY_IDLE_2,
-            "moving_left_1": MEOWKY_MOVING_LEFT_1,
-            "moving_left_2": MEOWKY_MOVING_LEFT_2,
-            "moving_left_3": MEOWKY_MOVING_LEFT_3,
-            "moving_right_1": MEOWKY_MOVING_RIGHT_1,
-            "moving_right_2": MEOWKY_MOVING_RIGHT_2,
-            "moving_right_3": MEOWKY_MOVING_RIGHT_3,
-            "dead": MEOWKY_DEAD,
-        }
\ No newline at end of file
+        frames = [
+            ("idle_1", path.join(base_path, "static_1_meowky.png"), MEOWKY_SCALE, False),
+            ("idle_2", path.join(base_path, "static_2_meowky.png"), MEOWKY_SCALE, False),
+        ]
+        for n in range(1, 4):
+            frames.append((f"moving_left_{n}", path.join(base_path, f"moving_{n}_meowky.png"), MEOWKY_SCALE, False))
+            frames.append((f"moving_right_{n}", path.join(base_path, f"moving_{n}_meowky.png"), MEOWKY_SCALE, True))
+        frames.append(("dead", path.join(base_path, "dead_meowky.png"), MEOWKY_SCALE, False))
+
+        self.images = load_atlas("meowky", frames).frames
+        self.clips = load_clips("meowky", self.images, MEOWKY_CLIPS)
\ No newline at end of file
@@ -22,6 +22,17 @@ class Wave(pygame.sprite.Sprite):
         self.speed_x = 4  # Horizontal movement speed
         self.direction = direction  # Direction of movement (-1 for left, 1 for right)
 
+    def reset(self, x, y, direction):
+        """Reuse the wave from a new position and direction.
+
+        Args:
+            x (int): The x-coordinate of the wave's new position.
+            y (int): The y-coordinate of the wave's new position.
+            direction (int): The direction of the wave's movement (-1 for left, 1 for right).
+        """
+        self.rect.center = (x, y)
+        self.direction = direction
+
     def check_collision(self, entity):
         """Check if the wave collides with an entity and apply effects.
 
@@ -0,0 +1,137 @@
+"""
+This module defines the LevelChunk class, a block of consecutive columns of a level whose
+sprites are described by blueprints and only instantiated while the camera is near.
+
+Released sprites keep the state the player can change (open doors, worn out trampolines,
+collected items) in their blueprint, so the chunk looks the same when it is loaded again.
+"""
+
+# Attributes saved when a sprite of each kind is released, besides its position
+SAVED_ATTRIBUTES = {
+    "door": ("state", "width", "image"),
+    "trampoline": ("bounce_counter", "broken", "color", "image"),
+}
+
+class Blueprint:
+    """
+    A sprite of the level, with the arguments to create it and its saved state.
+
+    Args:
+        kind (str): The group of the level the sprite belongs to ("platform", "wall", "item", "door" or "trampoline").
+        factory (type): The sprite class.
+        *args: Arguments of the sprite class, in level coordinates.
+        **kwargs: Keyword arguments of the sprite class.
+    """
+    __slots__ = ("kind", "factory", "args", "kwargs", "sprite", "state", "removed")
+
+    def __init__(self, kind, factory, *args, **kwargs):
+        self.kind = kind
+        self.factory = factory
+        self.args = args
+        self.kwargs = kwargs
+
+        self.sprite = None  # The instantiated sprite, None while the chunk is released
+        self.state = None  # Saved attributes and rectangle, None if the sprite was never changed
+        self.removed = False  # Whether the sprite left the level for good, like a collected item
+
+class LevelChunk:
+    """
+    A block of columns of a level, loaded and released as a whole.
+
+    Args:
+        index (int): The position of the chunk in the level, from the left.
+    """
+    def __init__(self, index):
+        self.index = index
+        self.blueprints = []
+        self.loaded = False
+
+        # Horizontal extent, in level coordinates
+        self.left = None
+        self.right = None
+
+    def add(self, kind, factory, *args, **kwargs):
+        """
+        Add the blueprint of a sprite to the chunk.
+
+        Args:
+            kind (str): The group of the level the sprite belongs to.
+            factory (type): The sprite class.
+            *args: Arguments of the sprite class, in level coordinates.
+            **kwargs: Keyword arguments of the sprite class.
+
+        Returns:
+            Blueprint: The new blueprint.
+        """
+        blueprint = Blueprint(kind, factory, *args, **kwargs)
+        self.blueprints.append(blueprint)
+        return blueprint
+
+    def extend(self, left, right):
+        """
+        Grow the horizontal extent of the chunk to include a cell.
+
+        Args:
+            left (int): The left x of the cell, in level coordinates.
+            right (int): The right x of the cell, in level coordinates.
+        """
+        self.left = left if self.left is None else min(self.left, left)
+        self.right = right if self.right is None else max(self.right, right)
+
+    def load(self, level):
+        """
+        Instantiate the sprites of the chunk and add them to the level.
+
+        Args:
+            level (Level): The level the chunk belongs to.
+        """
+        for blueprint in self.blueprints:
+            if blueprint.removed:
+                continue
+
+            sprite = blueprint.factory(*blueprint.args, **blueprint.kwargs)
+            sprite.blueprint = blueprint
+
+            if blueprint.state:
+                attributes, rect = blueprint.state
+                for name, value in attributes.items():
+                    setattr(sprite, name, value)
+                sprite.rect = rect.copy()
+
+            sprite.rect.x += level.offset
+            blueprint.sprite = sprite
+            level.add_sprite(blueprint.kind, sprite)
+
+        self.loaded = True
+
+    def release(self, level):
+        """
+        Save the state of the sprites of the chunk and remove them from the level.
+
+        Args:
+            level (Level): The level the chunk belongs to.
+        """
+        for blueprint in self.blueprints:
+            sprite = blueprint.sprite
+            if sprite is None:
+                continue
+
+            if blueprint.kind in SAVED_ATTRIBUTES:
+                attributes = {name: getattr(sprite, name) for name in SAVED_ATTRIBUTES[blueprint.kind]}
+                blueprint.state = (attributes, sprite.rect.move(-level.offset, 0))
+
+            sprite.kill()
+            blueprint.sprite = None
+
+        self.loaded = False
+
+    def forget(self, kind):
+        """
+        Forget the saved state of the released sprites of a kind, so they are loaded as new.
+
+        Args:
+            kind (str): The kind of sprite.
+        """
+        for blueprint in self.blueprints:
+            if blueprint.kind == kind and blueprint.sprite is None:
+                blueprint.state = None
@@ -0,0 +1,57 @@
+"""
+This module compiles the platform cells of a level row into spans: every run of adjacent
+platform cells becomes a single Platform sprite, so the collision checks scan one sprite per
+run instead of one per cell. Runs are split at the chunk borders, so every span belongs to
+a single chunk (see levels.chunks).
+
+Items and doors are still placed from the cells, the spans only replace the platforms.
+"""
+
+class PlatformSpan:
+    """
+    A run of adjacent platform cells of a row.
+
+    Args:
+        column (int): The column of the first cell.
+        x (int): The left x of the first cell, in level coordinates.
+    """
+    __slots__ = ("column", "x", "segments")
+
+    def __init__(self, column, x):
+        self.column = column
+        self.x = x
+        self.segments = []  # Width of every cell of the run
+
+    @property
+    def last_column(self):
+        """int: The column of the last cell."""
+        return self.column + len(self.segments) - 1
+
+    @property
+    def width(self):
+        """int: The width of the whole run."""
+        return sum(self.segments)
+
+def compile_platform_spans(cells, chunk_columns=None):
+    """
+    Merge the platform cells of a row into spans.
+
+    Args:
+        cells (list): The (column, x, width) of every platform cell of the row, from left to right.
+        chunk_columns (int, optional): Columns of each chunk, spans do not cross chunk borders. Defaults to None (no chunks).
+
+    Returns:
+        list: The PlatformSpan of every run, from left to right.
+    """
+    spans = []
+    for column, x, width in cells:
+        span = spans[-1] if spans else None
+
+        same_chunk = span is not None and (chunk_columns is None or span.column // chunk_columns == column // chunk_columns)
+        if span is None or span.last_column != column - 1 or not same_chunk:
+            span = PlatformSpan(column, x)
+            spans.append(span)
+
+        span.segments.append(width)
+
+    return spans
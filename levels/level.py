@@ -1,4 +1,6 @@
 import pygame
+import random
+from bisect import bisect_right
 from os import path
 
 from structures.trampoline import Trampoline
@@ -10,25 +12,48 @@ from entities.meowky import Meowky
 from entities.door import Door
 from entities.wave import Wave
 
-from utils.helpers import get_level_matrix, generate_items_matrix, generate_doors_matrix
-from config.settings import PLATFORM_WIDTH, PLATFORM_HEIGHT, TRAMPOLINE_HEIGHT, TRAMPOLINE_WIDTH, FLOOR_HEIGHT, SCREEN_WIDTH, FPS
+from levels.navigation import NavigationGraph
+from levels.chunks import LevelChunk
+from levels.compiler import compile_platform_spans
+
+from utils.helpers import get_level_matrix, generate_items_matrix, generate_doors_matrix, generate_by_sections
+from utils.profiler import FrameProfiler
+from utils.tracer import traced, tracer
+from utils.pool import ObjectPool
+from utils.ai_scheduler import AIScheduler
+from utils.assets import load_sprite
+from config.settings import PLATFORM_WIDTH, PLATFORM_HEIGHT, TRAMPOLINE_HEIGHT, TRAMPOLINE_WIDTH, FLOOR_HEIGHT, SCREEN_WIDTH, FPS, MEOWKY_LOD_DISTANCE
+from config.settings import LEVEL_STREAMING_COLUMNS, LEVEL_CHUNK_COLUMNS, LEVEL_LOAD_MARGIN, LEVEL_RELEASE_MARGIN
 
 class Level:
     """
     Represents a game level, including its platforms, trampolines, items, walls, enemies, doors, and waves.
     Handles the generation, updating, and rendering of these elements.
+
+    Levels wider than LEVEL_STREAMING_COLUMNS are split in chunks of LEVEL_CHUNK_COLUMNS columns,
+    whose sprites only exist while the camera is near (see levels.chunks). Narrower levels are a
+    single chunk, loaded when the level is built.
     """
 
-    def __init__(self, level_number):
+    # Pools shared by every level, so recycled sprites outlive the level that created them
+    wave_pool = ObjectPool(Wave)
+    meowky_pool = ObjectPool(Meowky)
+
+    def __init__(self, level_number, profiler=None, level_matrix=None):
         """
         Initialize the level with the given level number.
 
         Args:
             level_number (int): The number of the level to load.
+            profiler (FrameProfiler, optional): Profiler that measures the update sections. Defaults to a disabled one.
+            level_matrix (list, optional): Layout to use instead of the one of the level number, like the ones of generate_wide_level_matrix. Defaults to None.
         """
+        self.profiler = profiler if profiler else FrameProfiler()
+
         self.platforms = pygame.sprite.Group()
         self.trampolines = pygame.sprite.Group()
         self.items = pygame.sprite.Group()
+        self.items_by_type = {}  # Item type -> group with the items of that type
         self.walls = pygame.sprite.Group()
         self.meowkies = pygame.sprite.Group()
         self.doors = pygame.sprite.Group()
@@ -39,34 +64,52 @@ class Level:
 
         # Level dimensions and offset for scrolling
         self.offset = 0
+        self.start_x = 0
+        self.start_y = 0
+        self.cell_edges = []  # Left x of every cell of each row, relative to the level origin
         self.width = 0
         self.height = 0
 
+        # Column chunks and the sprites they create
+        self.chunks = []
+        self.streaming = False
+        self.chunk_version = 0  # Increased every time a chunk is loaded or released
+        self.items_left = 0  # Items not collected yet, loaded or not
+        self.door_blueprints = {}  # (row, column) -> blueprint of the door in that cell
+        self.bounces = 0  # Trampoline bounces of the player, for the telemetry
+
         # Generate matrices for level layout, items, and doors
-        level_matrix = get_level_matrix(level_number)
-        items_matrix = generate_items_matrix(level_matrix)
-        doors_matrix = generate_doors_matrix(level_matrix)
+        if level_matrix is None:
+            level_matrix = get_level_matrix(level_number)
+        items_matrix = generate_by_sections(generate_items_matrix, level_matrix)
+        doors_matrix = generate_by_sections(generate_doors_matrix, level_matrix)
 
         # Load roof sprite
-        self.roof = pygame.image.load(path.join("assets", "sprites", "structures", "roof.png")).convert_alpha()
-        self.roof_rect = self.roof.get_rect()
-
-        # Build the level layout
-        self.build_level(level_matrix, items_matrix, doors_matrix)
+        self.roof = load_sprite(path.join("assets", "sprites", "structures", "roof.png"))
+        self.roof_rect = self.roof.get_rect()  # Covers the whole roof, drawn as repeated tiles of the roof sprite
 
         # Initialize gameplay variables
         self.targeted_item = -1
         self.streak = True
         self.pairs_collected = 0
 
+        # Build the level layout and the graph the enemies navigate with
+        self.build_level(level_matrix, items_matrix, doors_matrix)
+        self.navigation = NavigationGraph(level_matrix, doors_matrix)
+        self.ai = AIScheduler()
+
         self.total_meowkies = level_number
         self.current_meowkies = 0
         self.meowkies_delay_counter = 0
 
+    @traced("Level.build_level", "level")
     def build_level(self, level_matrix, items_matrix, door_matrix, start_x=60, start_y=210):
         """
         Build the level layout based on the provided matrices.
 
+        The sprites are described in the blueprints of the chunks, and only the chunks near the
+        camera are instantiated. The platform cells of each row are merged into spans.
+
         Args:
             level_matrix (list): Matrix representing the level structure.
             items_matrix (list): Matrix representing item placements.
@@ -76,52 +119,62 @@ class Level:
         """
         increment = 0
         y = start_y
+        self.start_x = start_x
+        self.start_y = start_y
+
+        columns = len(level_matrix[0])
+        self.streaming = columns > LEVEL_STREAMING_COLUMNS
+        chunk_columns = LEVEL_CHUNK_COLUMNS if self.streaming else columns
+        self.chunks = [LevelChunk(index) for index in range((columns + chunk_columns - 1) // chunk_columns)]
 
         for r_index, row in enumerate(level_matrix):
             x = start_x
+            self.cell_edges.append([])
+            platform_cells = []  # (Column, x, width) of the platform cells of the row
             for c_index, cell in enumerate(row):
+                self.cell_edges[r_index].append(x)
+                chunk = self.chunks[c_index // chunk_columns]
+                cell_x = x
+
                 # Wall generation
                 if c_index == 0:
                     if r_index == 0:
-                        wall = Wall(x + 2, y, height=20)
+                        chunk.add("wall", Wall, x + 2, y, height=20)
                     else:
-                        wall = Wall(x + 2, y)
-                    self.walls.add(wall)
+                        chunk.add("wall", Wall, x + 2, y)
                 if c_index == len(row) - 1:
                     if r_index == 0:
-                        wall = Wall(x + TRAMPOLINE_WIDTH, y, height=20)
+                        chunk.add("wall", Wall, x + TRAMPOLINE_WIDTH, y, height=20)
                     else:
-                        wall = Wall(x + TRAMPOLINE_WIDTH, y)
-                    self.walls.add(wall)
+                        chunk.add("wall", Wall, x + TRAMPOLINE_WIDTH, y)
 
                 # Void
                 if cell == 0:
                     x += TRAMPOLINE_WIDTH
                     increment = abs(PLATFORM_WIDTH - TRAMPOLINE_WIDTH)
 
-                # Platform generation
+                # Platform cells, merged into spans at the end of the row
                 elif cell == 1:
-                    is_floor = False if r_index == len(level_matrix) - 1 else True
-                    platform = Platform(x, y, PLATFORM_WIDTH + increment, PLATFORM_HEIGHT, floor=is_floor)
-                    self.platforms.add(platform)
+                    platform_cells.append((c_index, x, PLATFORM_WIDTH + increment))
                     x += PLATFORM_WIDTH + increment
 
                     # Items generation
                     if items_matrix[r_index][c_index] != 0:
-                        item = Item(x - 10, y, items_matrix[r_index][c_index])
-                        self.items.add(item)
+                        chunk.add("item", Item, x - 10, y, items_matrix[r_index][c_index])
+                        self.items_left += 1
 
                     # Doors generation
                     if door_matrix[r_index][c_index] in [1, 2] and c_index not in [0, len(row) - 1]:
                         special = True if door_matrix[r_index][c_index] == 2 else False
 
                         if level_matrix[r_index][c_index - 1] == 0:
-                            door = Door(x + 5 - PLATFORM_WIDTH - increment, y, direction=1, special=special)
+                            door = chunk.add("door", Door, x + 5 - PLATFORM_WIDTH - increment, y, direction=1, special=special)
                         elif level_matrix[r_index][c_index + 1] == 0:
-                            door = Door(x - 5, y, direction=-1, special=special)
+                            door = chunk.add("door", Door, x - 5, y, direction=-1, special=special)
                         else:
-                            door = Door(x - 5, y, special=special)
-                        self.doors.add(door)
+                            # Random facing, chosen now so the door faces the same way every time it is loaded
+                            door = chunk.add("door", Door, x - 5, y, direction=-1 if random.randint(0, 1) == 0 else 1, special=special)
+                        self.door_blueprints[(r_index, c_index)] = door
 
                     # Reset increment
                     if increment > 0:
@@ -133,17 +186,31 @@ class Level:
                         if level_matrix[r_index][c_index + 1] == 1:
                             increment = abs(PLATFORM_WIDTH - TRAMPOLINE_WIDTH)
 
-                    trampoline = Trampoline(x, y + (PLATFORM_HEIGHT - TRAMPOLINE_HEIGHT), TRAMPOLINE_WIDTH, TRAMPOLINE_HEIGHT)
-                    self.trampolines.add(trampoline)
+                    chunk.add("trampoline", Trampoline, x, y + (PLATFORM_HEIGHT - TRAMPOLINE_HEIGHT), TRAMPOLINE_WIDTH, TRAMPOLINE_HEIGHT)
                     x += TRAMPOLINE_WIDTH
 
+                chunk.extend(cell_x, x)
+
+            # Platform generation, one sprite for every run of platform cells
+            is_floor = False if r_index == len(level_matrix) - 1 else True
+            for span in compile_platform_spans(platform_cells, chunk_columns):
+                chunk = self.chunks[span.column // chunk_columns]
+                chunk.add("platform", Platform, span.x, y, height=PLATFORM_HEIGHT, floor=is_floor, segments=span.segments)
+
             y += FLOOR_HEIGHT
 
         self.width = x
         self.height = y - FLOOR_HEIGHT
-        self.roof = pygame.transform.scale(self.roof, (x - TRAMPOLINE_WIDTH + 10, self.roof.get_height()))
+
+        # Narrow levels stretch the roof over the whole level, wide ones repeat it
+        roof_width = x - TRAMPOLINE_WIDTH + 10
+        if not self.streaming:
+            self.roof = pygame.transform.scale(self.roof, (roof_width, self.roof.get_height()))
+        self.roof_rect = pygame.Rect(0, 0, roof_width, self.roof.get_height())
         self.roof_rect.bottomleft = (start_x, start_y)
+
         self.scroll(-self.width + SCREEN_WIDTH - 60)
+        self.stream_chunks(force=True)
 
     def generate_enemies(self, delay=2):
         """
@@ -154,9 +221,12 @@ class Level:
         """
         if self.current_meowkies < self.total_meowkies:
             if self.meowkies_delay_counter > FPS * delay:
-                meowky = Meowky(self.width // 2 - abs(self.offset) + 40, 100)
+                # Wide levels spawn in the middle of the screen, where the chunks are loaded
+                spawn_x = self.width // 2 - abs(self.offset) + 40 if not self.streaming else SCREEN_WIDTH // 2 + 40
+                meowky = self.meowky_pool.acquire(spawn_x, 100)
                 meowky.move_down()
                 self.meowkies.add(meowky)
+                self.ai.register(meowky)
                 self.meowkies_delay_counter = 0
                 self.current_meowkies += 1
             else:
@@ -166,9 +236,99 @@ class Level:
         """
         Reset all Meowkies in the level.
         """
-        self.meowkies.empty()
+        self.meowky_pool.release_all(self.meowkies)
+        self.ai.clear()
         self.current_meowkies = 0
 
+    def release_pooled(self):
+        """
+        Return every pooled sprite of the level (Meowkies and waves) to its pool.
+        """
+        self.reset_meowkies()
+        self.wave_pool.release_all(self.waves)
+
+    def stream_chunks(self, force=False):
+        """
+        Load the chunks that came within LEVEL_LOAD_MARGIN of the screen and release the ones
+        farther than LEVEL_RELEASE_MARGIN. The gap between both margins keeps a chunk from being
+        loaded and released again while the camera moves around its edge.
+
+        Args:
+            force (bool, optional): Also load the chunks of levels that are not streamed. Defaults to False.
+        """
+        if not self.streaming and not force:
+            return
+
+        view_left = -self.offset
+        view_right = view_left + SCREEN_WIDTH
+
+        for chunk in self.chunks:
+            if not self.streaming:
+                near, far = True, False
+            else:
+                near = chunk.right >= view_left - LEVEL_LOAD_MARGIN and chunk.left <= view_right + LEVEL_LOAD_MARGIN
+                far = chunk.right < view_left - LEVEL_RELEASE_MARGIN or chunk.left > view_right + LEVEL_RELEASE_MARGIN
+
+            if near and not chunk.loaded:
+                chunk.load(self)
+                self.chunk_version += 1
+            elif far and chunk.loaded:
+                chunk.release(self)
+                self.chunk_version += 1
+
+        self.profiler.count("loaded chunks", sum(chunk.loaded for chunk in self.chunks))
+
+    def add_sprite(self, kind, sprite):
+        """
+        Add a sprite of a loaded chunk to its groups.
+
+        Args:
+            kind (str): The kind of sprite, see levels.chunks.Blueprint.
+            sprite (pygame.sprite.Sprite): The sprite.
+        """
+        if kind == "platform":
+            self.platforms.add(sprite)
+        elif kind == "wall":
+            self.walls.add(sprite)
+        elif kind == "door":
+            self.doors.add(sprite)
+        elif kind == "trampoline":
+            self.trampolines.add(sprite)
+        elif kind == "item":
+            self.items.add(sprite)
+            self.items_by_type.setdefault(sprite.item_type, pygame.sprite.Group()).add(sprite)
+            if sprite.item_type == self.targeted_item:
+                sprite.start_targeted_animation()
+
+    def remove_item(self, item):
+        """
+        Remove a collected item from the level.
+
+        Args:
+            item (Item): The item to remove.
+        """
+        self.items.remove(item)
+        self.items_by_type[item.item_type].remove(item)
+        item.blueprint.removed = True
+        self.items_left -= 1
+
+    def set_target(self, item_type):
+        """
+        Change the targeted item type, making its items blink and stopping the previous ones.
+
+        Args:
+            item_type (int): The new targeted item type.
+        """
+        if item_type == self.targeted_item:
+            return
+
+        for item in self.items_by_type.get(self.targeted_item, []):
+            item.stop_targeted_animation()
+        for item in self.items_by_type.get(item_type, []):
+            item.start_targeted_animation()
+
+        self.targeted_item = item_type
+
     def reset_trampolines(self):
         """
         Reset all trampolines in the level to their initial state.
@@ -177,6 +337,9 @@ class Level:
             trampoline.reset()
             trampoline.broken = False
 
+        for chunk in self.chunks:
+            chunk.forget("trampoline")
+
     def check_collision(self, player):
         """
         Check for collisions between the player and Meowkies.
@@ -210,6 +373,7 @@ class Level:
 
         return False
 
+    @traced("Level.update", "level")
     def update(self, player):
         """
         Update the level state, including player interactions and enemy behavior.
@@ -221,14 +385,144 @@ class Level:
             int: The score gained during this update.
         """
         score = 0
-        score += player.update_on_level(self)
+        self.stream_chunks()
+
+        with self.profiler.section("Mappy.update_on_level"):
+            score += player.update_on_level(self)
+
+        with self.profiler.section("Meowky loop"):
+            score += self.update_meowkies(player)
+
+        for door in self.doors:
+            if door.check_collision(player):
+                if door.special:
+                    wave = self.wave_pool.acquire(door.rect.centerx, door.rect.centery, door.direction)
+                    self.waves.add(wave)
 
+        for wave in self.waves:
+            wave.update()
+
+            # Recycle the waves that left the level
+            if not self.in_bounds(wave.rect):
+                self.wave_pool.release(wave)
+
+        self.profiler.count("waves", len(self.waves))
+        self.profiler.count("pooled waves", len(self.wave_pool.free))
+        tracer.counter("waves", active=len(self.waves), pooled=len(self.wave_pool.free))
+
+        # Off-screen trampolines catch up with the animation clock when they become visible
+        for trampoline in self.trampolines:
+            if self.on_screen(trampoline.rect):
+                trampoline.update()
+
+        self.generate_enemies()
+
+        return score
+
+    def in_bounds(self, rect):
+        """
+        Check if a rectangle still overlaps the horizontal extent of the level.
+
+        Args:
+            rect (pygame.Rect): The rectangle to check, in screen coordinates.
+
+        Returns:
+            bool: True if part of the rectangle is between the level walls, False otherwise.
+        """
+        return rect.right >= self.start_x + self.offset and rect.left <= self.width + self.offset
+
+    def on_screen(self, rect):
+        """
+        Check if a rectangle overlaps the visible part of the level horizontally.
+
+        Args:
+            rect (pygame.Rect): The rectangle to check, in screen coordinates.
+
+        Returns:
+            bool: True if part of the rectangle is on screen, False otherwise.
+        """
+        return rect.right >= 0 and rect.left <= SCREEN_WIDTH
+
+    def is_far(self, rect):
+        """
+        Check if a rectangle is more than MEOWKY_LOD_DISTANCE pixels away from the screen horizontally.
+
+        Args:
+            rect (pygame.Rect): The rectangle to check, in screen coordinates.
+
+        Returns:
+            bool: True if the rectangle is far from the screen, False otherwise.
+        """
+        return rect.right < -MEOWKY_LOD_DISTANCE or rect.left > SCREEN_WIDTH + MEOWKY_LOD_DISTANCE
+
+    def door_closed(self, cell):
+        """
+        Check if a cell has a closed door, loaded or saved in its released chunk.
+
+        Args:
+            cell (tuple): The (row, column) of the cell.
+
+        Returns:
+            bool: True if the door of the cell is closed, False if it is open or there is no door.
+        """
+        blueprint = self.door_blueprints.get(cell)
+        if blueprint is None:
+            return False
+
+        if blueprint.sprite is not None:
+            return blueprint.sprite.state != 0
+        if blueprint.state is not None:
+            return blueprint.state[0]["state"] != 0
+        return True  # Never opened
+
+    def cell_at(self, rect):
+        """
+        Get the level matrix cell an entity stands in.
+
+        Args:
+            rect (pygame.Rect): The rectangle of the entity, in screen coordinates.
+
+        Returns:
+            tuple: The (row, column) of the cell, clamped to the level.
+        """
+        row = (rect.bottom - self.start_y + FLOOR_HEIGHT // 2) // FLOOR_HEIGHT
+        row = min(max(row, 0), len(self.cell_edges) - 1)
+
+        edges = self.cell_edges[row]
+        column = bisect_right(edges, rect.centerx - self.offset) - 1
+        column = min(max(column, 0), len(edges) - 1)
+
+        return row, column
+
+    def update_meowkies(self, player):
+        """
+        Update every Meowky and its interactions with doors, waves and the level bounds.
+
+        Args:
+            player (Player): The player object.
+
+        Returns:
+            int: The score gained by stunning Meowkies during this update.
+        """
+        score = 0
+        despawned = []
+
+        # Only the Meowkies whose turn it is decide, within the frame's time budget
+        with self.profiler.section("Meowky AI"):
+            self.ai.run(self.meowkies, self, player)
+
+        far = 0
         for meowky in self.meowkies:
-            meowky.update_on_level(self, player)
+            # Meowkies walking far from the screen take the cheap path, without animation or doors
+            if meowky.state in ["left", "right"] and self.is_far(meowky.rect):
+                meowky.update_far(self)
+                far += 1
+            else:
+                meowky.update_on_level(self, player)
 
-            # Logic with meowkies and doors
-            for door in self.doors:
-                door.check_collision(meowky, enemy=True)
+                # Logic with meowkies and doors
+                for door in self.doors:
+                    door.check_collision(meowky, enemy=True)
 
             # Stun after door collision logic
             if meowky.state == "stun":
@@ -237,8 +531,8 @@ class Level:
                     meowky.animate_death()
                 else:
                     score += 50
-                    self.meowkies.remove(meowky)
-                    self.current_meowkies -= 1
+                    despawned.append(meowky)
+                    continue
 
             # Logic with meowkies and waves
             for wave in self.waves:
@@ -246,25 +540,33 @@ class Level:
 
             # Check if meowky fell
             if meowky.rect.y > self.height:
-                self.meowkies.remove(meowky)
-                self.current_meowkies -= 1
+                despawned.append(meowky)
 
-        for door in self.doors:
-            if door.check_collision(player):
-                if door.special:
-                    wave = Wave(door.rect.centerx, door.rect.centery, door.direction)
-                    self.waves.add(wave)
-
-        for wave in self.waves:
-            wave.update()
+        # Remove the stunned and fallen meowkies in one batch, once the iteration is over
+        self.despawn_meowkies(despawned)
 
-        for trampoline in self.trampolines:
-            trampoline.update()
+        self.profiler.count("meowkies", len(self.meowkies))
+        self.profiler.count("far meowkies", far)
+        self.profiler.count("pooled meowkies", len(self.meowky_pool.free))
+        tracer.counter("meowkies", active=len(self.meowkies), far=far, pooled=len(self.meowky_pool.free))
 
-        self.generate_enemies()
+        self.profiler.count("AI thought", self.ai.thought)
+        self.profiler.count("AI deferred", self.ai.deferred_count)
+        tracer.counter("AI", thought=self.ai.thought, skipped=self.ai.skipped, deferred=self.ai.deferred_count)
 
         return score
 
+    def despawn_meowkies(self, meowkies):
+        """
+        Remove Meowkies from the level and return them to the pool.
+
+        Args:
+            meowkies (list): The Meowkies to remove.
+        """
+        for meowky in meowkies:
+            self.meowky_pool.release(meowky)
+        self.current_meowkies -= len(meowkies)
+
     def scroll(self, dx):
         """
         Scroll the level horizontally by a given amount.
@@ -280,6 +582,30 @@ class Level:
 
         self.roof_rect.x += dx
 
+    def follow_player(self, player, screen_width=SCREEN_WIDTH):
+        """
+        Scroll the level to keep the player in the middle of the screen, within the level bounds.
+
+        Args:
+            player (Player): The player object.
+            screen_width (int, optional): The width of the screen. Defaults to SCREEN_WIDTH.
+        """
+        # Adjust screen offset for scrolling
+        screen_mid = screen_width // 2
+
+        if self.width > screen_width:
+            if player.rect.centerx > screen_mid:
+                if ((screen_width - 60) - self.offset) < self.width:
+                    movement = player.speed_x if player.state in ["right"] else player.speed_x - 1
+                    player.rect.centerx = screen_mid
+                    self.scroll(-movement)
+
+            if player.rect.centerx < screen_mid:
+                if -self.offset > 0:
+                    movement = player.speed_x if player.state in ["left"] else player.speed_x - 1
+                    player.rect.centerx = screen_mid
+                    self.scroll(movement)
+
     def draw(self, screen):
         """
         Draw the level elements onto the screen.
@@ -300,4 +626,21 @@ class Level:
         self.meowkies.draw(screen)
         self.waves.draw(screen)
 
-        screen.blit(self.roof, self.roof_rect)
\ No newline at end of file
+        self.draw_roof(screen)
+
+    def draw_roof(self, screen):
+        """
+        Draw the visible tiles of the roof.
+
+        Args:
+            screen (pygame.Surface): The screen surface to draw on.
+        """
+        tile_width = self.roof.get_width()
+        right = min(self.roof_rect.right, screen.get_width())
+
+        # Skip the tiles left of the screen
+        x = self.roof_rect.x + max(0, -self.roof_rect.x) // tile_width * tile_width
+        while x < right:
+            area = pygame.Rect(0, 0, min(tile_width, self.roof_rect.right - x), self.roof_rect.height)
+            screen.blit(self.roof, (x, self.roof_rect.y), area)
+            x += tile_width
\ No newline at end of file
@@ -37,4 +37,12 @@ LEVELS_DISTRIBUTION = [
         [0, 1, 2, 1, 1, 0, 1, 1, 2, 1, 0],
         [2, 1, 1, 1, 1, 2, 1, 1, 1, 1, 2]
     ],
-]
\ No newline at end of file
+]
+
+# Layout of every round, starting at round 1. Bonus rounds (3, 7, 11, ...) are skipped by the
+# game and keep the layout of the round before them.
+ROUND_LAYOUTS = [
+    0, 0, 0, 1, 1, 1, 1, 2, 2, 2,
+    2, 3, 3, 3, 3, 0, 0, 0, 0, 1,
+    1, 1, 1, 2, 2, 2, 2, 3, 3, 3,
+]
@@ -0,0 +1,272 @@
+import heapq
+from collections import OrderedDict
+
+from config.settings import NAV_DOOR_COST, NAV_ALL_PAIRS_LIMIT, NAV_TARGET_CACHE
+
+"""
+This module defines the NavigationGraph class, built once per level from its layout and doors,
+which stores the distance and the first step of the shortest path between every pair of cells
+so the enemies can chase the player without searching the level every frame.
+
+Levels with more than NAV_ALL_PAIRS_LIMIT cells would need too much time and memory for the
+all-pairs tables, so their distances to a target are computed when first needed and the last
+NAV_TARGET_CACHE targets are kept. The enemies all chase the same target, the player.
+
+Cells are identified by (row, column) in the level matrix:
+    - Platform cells (1) connect to their left and right neighbours.
+    - Trampoline cells (2) and the empty cells above them form a shaft, walked up and down.
+    - Other empty cells (0) drop to the first platform below them.
+"""
+
+UNREACHABLE = -1
+
+class NavigationGraph:
+    """
+    Directed graph of the cells of a level, with all-pairs distances and next steps, or
+    distances to the recent targets for large levels.
+
+    Args:
+        level_matrix (list): Matrix representing the level structure.
+        doors_matrix (list, optional): Matrix with the doors of the level, crossing a door costs NAV_DOOR_COST. Defaults to None.
+    """
+    def __init__(self, level_matrix, doors_matrix=None):
+        self.rows = len(level_matrix)
+        self.cols = len(level_matrix[0])
+        self.size = self.rows * self.cols
+
+        self.shafts = self.find_shafts(level_matrix)
+        self.platform_cells = {(r, c) for r in range(self.rows) for c in range(self.cols) if level_matrix[r][c] == 1}
+        self.door_cells = {(r, c) for r in range(self.rows) for c in range(self.cols) if doors_matrix and doors_matrix[r][c]}
+        self.edges = self.build_edges(level_matrix, doors_matrix)
+        self.all_pairs = self.size <= NAV_ALL_PAIRS_LIMIT
+
+        # Shortest paths from every cell, stored as flat lists indexed by cell number
+        self.distance = []
+        self.next_hop = []
+        self.targets = OrderedDict()  # Target cell number -> distance of every cell to it, for large levels
+        if not self.all_pairs:
+            self.reverse_edges = self.build_reverse_edges()
+            return
+
+        for source in range(self.size):
+            distance, next_hop = self.shortest_paths(source)
+            self.distance.append(distance)
+            self.next_hop.append(next_hop)
+
+    def index(self, cell):
+        """
+        Get the number of a cell.
+
+        Args:
+            cell (tuple): The (row, column) of the cell.
+
+        Returns:
+            int: The cell number.
+        """
+        return cell[0] * self.cols + cell[1]
+
+    def cell(self, index):
+        """
+        Get the cell of a number.
+
+        Args:
+            index (int): The cell number.
+
+        Returns:
+            tuple: The (row, column) of the cell.
+        """
+        return divmod(index, self.cols)
+
+    def find_shafts(self, level_matrix):
+        """
+        Find the cells a trampoline can bounce an entity through.
+
+        Args:
+            level_matrix (list): Matrix representing the level structure.
+
+        Returns:
+            set: The (row, column) of every trampoline cell and of the empty cells above it.
+        """
+        shafts = set()
+        for r_index, row in enumerate(level_matrix):
+            for c_index, cell in enumerate(row):
+                if cell == 2:
+                    shafts.add((r_index, c_index))
+
+                    r = r_index - 1
+                    while r >= 0 and level_matrix[r][c_index] == 0:
+                        shafts.add((r, c_index))
+                        r -= 1
+
+        return shafts
+
+    def build_edges(self, level_matrix, doors_matrix):
+        """
+        Build the moves available from every cell.
+
+        Args:
+            level_matrix (list): Matrix representing the level structure.
+            doors_matrix (list): Matrix with the doors of the level, or None.
+
+        Returns:
+            list: For every cell number, a list of (neighbour cell number, cost) pairs.
+        """
+        edges = [[] for _ in range(self.size)]
+
+        def add(origin, target, cost=1):
+            # Walking into or out of a door cell may be blocked, so it is more expensive
+            if doors_matrix and origin[0] == target[0]:
+                if doors_matrix[origin[0]][origin[1]] or doors_matrix[target[0]][target[1]]:
+                    cost += NAV_DOOR_COST
+            edges[self.index(origin)].append((self.index(target), cost))
+
+        for r in range(self.rows):
+            for c in range(self.cols):
+                cell = level_matrix[r][c]
+
+                if (r, c) in self.shafts:
+                    # Bounce up and fall down the shaft, or jump off to the platforms beside it
+                    if (r - 1, c) in self.shafts:
+                        add((r, c), (r - 1, c))
+                    if (r + 1, c) in self.shafts:
+                        add((r, c), (r + 1, c))
+                    for side in [c - 1, c + 1]:
+                        if 0 <= side < self.cols and level_matrix[r][side] == 1:
+                            add((r, c), (r, side))
+
+                elif cell == 1:
+                    # Walk to the neighbours, the walls close both ends of the row
+                    for side in [c - 1, c + 1]:
+                        if 0 <= side < self.cols:
+                            add((r, c), (r, side))
+
+                elif cell == 0:
+                    # Fall to the first platform below, if there is one
+                    below = r + 1
+                    while below < self.rows and level_matrix[below][c] == 0:
+                        below += 1
+                    if below < self.rows:
+                        add((r, c), (below, c), below - r)
+
+        return edges
+
+    def build_reverse_edges(self):
+        """
+        Build the moves that lead to every cell.
+
+        Returns:
+            list: For every cell number, a list of (previous cell number, cost) pairs.
+        """
+        reverse_edges = [[] for _ in range(self.size)]
+        for origin, moves in enumerate(self.edges):
+            for target, cost in moves:
+                reverse_edges[target].append((origin, cost))
+
+        return reverse_edges
+
+    def shortest_paths(self, source):
+        """
+        Run Dijkstra's algorithm from a cell.
+
+        Args:
+            source (int): The number of the starting cell.
+
+        Returns:
+            tuple: The distance to every cell and the first step towards it, UNREACHABLE if there is no path.
+        """
+        distance = [UNREACHABLE] * self.size
+        next_hop = [UNREACHABLE] * self.size
+        distance[source] = 0
+
+        queue = [(0, source, UNREACHABLE)]
+        visited = set()
+        while queue:
+            cost, node, first = heapq.heappop(queue)
+            if node in visited:
+                continue
+            visited.add(node)
+            distance[node] = cost
+            next_hop[node] = first
+
+            for neighbour, step in self.edges[node]:
+                if neighbour not in visited:
+                    heapq.heappush(queue, (cost + step, neighbour, neighbour if node == source else first))
+
+        return distance, next_hop
+
+    def distances_to(self, target):
+        """
+        Get the distance from every cell to a target, running Dijkstra's algorithm backwards
+        from it the first time and keeping the result for the next NAV_TARGET_CACHE targets.
+
+        Args:
+            target (int): The number of the destination cell.
+
+        Returns:
+            list: The distance of every cell to the target, UNREACHABLE if there is no path.
+        """
+        distance = self.targets.get(target)
+        if distance is not None:
+            self.targets.move_to_end(target)
+            return distance
+
+        distance = [UNREACHABLE] * self.size
+        queue = [(0, target)]
+        while queue:
+            cost, node = heapq.heappop(queue)
+            if distance[node] != UNREACHABLE:
+                continue
+            distance[node] = cost
+
+            for previous, step in self.reverse_edges[node]:
+                if distance[previous] == UNREACHABLE:
+                    heapq.heappush(queue, (cost + step, previous))
+
+        self.targets[target] = distance
+        if len(self.targets) > NAV_TARGET_CACHE:
+            self.targets.popitem(last=False)
+
+        return distance
+
+    def distance_between(self, origin, target):
+        """
+        Get the length of the shortest path between two cells.
+
+        Args:
+            origin (tuple): The (row, column) of the starting cell.
+            target (tuple): The (row, column) of the destination cell.
+
+        Returns:
+            int: The distance, or UNREACHABLE if there is no path.
+        """
+        if not self.all_pairs:
+            return self.distances_to(self.index(target))[self.index(origin)]
+
+        return self.distance[self.index(origin)][self.index(target)]
+
+    def next_step(self, origin, target):
+        """
+        Get the first cell of the shortest path between two cells.
+
+        Args:
+            origin (tuple): The (row, column) of the starting cell.
+            target (tuple): The (row, column) of the destination cell.
+
+        Returns:
+            tuple: The (row, column) of the next cell, or None if already there or there is no path.
+        """
+        if self.all_pairs:
+            hop = self.next_hop[self.index(origin)][self.index(target)]
+        else:
+            # The neighbour that leaves the shortest distance to the target
+            distance = self.distances_to(self.index(target))
+            hop, best = UNREACHABLE, UNREACHABLE
+            if distance[self.index(origin)] > 0:
+                for neighbour, step in self.edges[self.index(origin)]:
+                    if distance[neighbour] != UNREACHABLE and (best == UNREACHABLE or step + distance[neighbour] < best):
+                        hop, best = neighbour, step + distance[neighbour]
+
+        if hop == UNREACHABLE:
+            return None
+
+        return self.cell(hop)
@@ -1,33 +1,68 @@
+import time
 import pygame
 import sys
 
 from core.game import Game
-from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from core.display import Display
+from utils.tracer import tracer
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, IDLE_WAIT_MS, STARTUP_LOG
 
 def main():
+    start_time = time.perf_counter()
+
     pygame.init()
     pygame.display.set_caption("Mappy")
     pygame.mixer.init()
 
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    clock = pygame.time.Clock()
+    # The scenes draw at the native resolution, the display scales it to the window
+    display = Display(SCREEN_WIDTH, SCREEN_HEIGHT)
+    if STARTUP_LOG:
+        print(display.describe())
 
-    game = Game(screen)
+    game = Game(display.surface, start_time)
+    first_frame = True
 
     # Main loop
     running = True
     while running:
-        dt = clock.tick(FPS) / 1000  # Delta time en segundos
+        dt = game.pacer.tick()  # Delta time en segundos
+
+        # Static scenes already on screen sleep until an event arrives, waking up a few times per second
+        events = pygame.event.get()
+        if not events and game.idle():
+            event = pygame.event.wait(IDLE_WAIT_MS)
+            events = [event] if event.type != pygame.NOEVENT else []
+            game.pacer.resync()  # The wait is not a frame
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
 
+            display.handle_event(event)
             game.handle_event(event)
 
         game.update(dt)
-        game.draw()
-        pygame.display.flip()
+        if game.needs_draw():
+            game.draw()
+            display.present()
+            game.latency.frame_flipped()
+
+        # Report the time to first frame
+        if first_frame:
+            first_frame = False
+            tracer.instant("first frame")
+            if STARTUP_LOG:
+                print(f"First frame {(time.perf_counter() - start_time) * 1000:.0f} ms after start")
+
+    # Report the frame pacing and the input latency measured during the session
+    for line in game.pacer.report():
+        print(line)
+
+    if game.latency.histograms["flip"].count:
+        for line in game.latency.report():
+            print(line)
+
+    game.close()
 
     pygame.quit()
     sys.exit()
@@ -0,0 +1,199 @@
+import io
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+import multiprocessing
+from contextlib import redirect_stdout
+
+# The games run without a window or sound card, and the workers can be stopped with a signal
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_NO_SIGNAL_HANDLERS", "1")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+
+"""
+Batch runner that plays many headless games in a process pool, one seed per game, and
+summarizes the scores, rounds reached, deaths and frame cost.
+
+Usage:
+    python simulate.py [--games 100] [--workers N] [--seed 0] [--minutes 5] [--policy random|sweep] [--output results.json]
+"""
+
+POLICIES = ["random", "sweep"]
+
+_screen = None  # Display surface of the worker process
+
+def init_worker():
+    """
+    Initialize pygame once in every worker process.
+    """
+    global _screen
+
+    pygame.init()
+    pygame.mixer.init()
+    _screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    # The traces and telemetry of thousands of games are not needed
+    from utils.tracer import tracer
+    from utils.telemetry import telemetry
+    tracer.enabled = False
+    telemetry.enabled = False
+
+def press(game, event_type, key):
+    """
+    Send a key event to the game.
+
+    Args:
+        game (Game): The game.
+        event_type (int): pygame.KEYDOWN or pygame.KEYUP.
+        key (int): The key code.
+    """
+    game.handle_event(pygame.event.Event(event_type, key=key))
+
+def choose_key(policy, frame, rng):
+    """
+    Choose the key to hold during the next input period.
+
+    Args:
+        policy (str): "random" holds a random direction, "sweep" walks left and right in turns and drops every few turns.
+        frame (int): The current frame.
+        rng (random.Random): The random generator of the game.
+
+    Returns:
+        int: The key code, or None to release every key.
+    """
+    if policy == "random":
+        return rng.choice([pygame.K_LEFT, pygame.K_RIGHT, pygame.K_DOWN, None])
+
+    turn = frame // (FPS * 2)
+    if turn % 5 == 4:
+        return pygame.K_DOWN
+    return pygame.K_LEFT if turn % 2 == 0 else pygame.K_RIGHT
+
+def run_game(job):
+    """
+    Play one game until the game over screen or the frame limit.
+
+    Args:
+        job (tuple): The seed, the frame limit and the input policy.
+
+    Returns:
+        dict: The results of the game.
+    """
+    from core.game import Game
+
+    seed, max_frames, policy = job
+    random.seed(seed)
+    rng = random.Random(seed)
+
+    with redirect_stdout(io.StringIO()):
+        game = Game(_screen)
+        game.finish_loading()
+
+    press(game, pygame.KEYDOWN, pygame.K_SPACE)
+
+    frame_times = []
+    deaths = 0
+    held = None
+    previous_scene = game.scene
+    start = time.perf_counter()
+
+    for frame in range(max_frames):
+        # Change the held key every third of a second
+        if frame % (FPS // 3) == 0:
+            if held:
+                press(game, pygame.KEYUP, held)
+            held = choose_key(policy, frame, rng)
+            if held:
+                press(game, pygame.KEYDOWN, held)
+
+        frame_start = time.perf_counter()
+        game.update(1 / FPS)
+        game.draw()
+        frame_times.append((time.perf_counter() - frame_start) * 1000)
+
+        if game.scene != previous_scene and game.scene in ["reset", "game_over"]:
+            deaths += 1
+        previous_scene = game.scene
+
+        if game.scene == "game_over_screen":
+            break
+
+    frame_times.sort()
+    return {
+        "seed": seed,
+        "score": game.HUD.current_score,
+        "round": game.level_number,
+        "deaths": deaths,
+        "game_over": game.scene == "game_over_screen",
+        "frames": len(frame_times),
+        "frame_ms": statistics.fmean(frame_times),
+        "frame_p95_ms": frame_times[int(len(frame_times) * 0.95)],
+        "wall_s": time.perf_counter() - start,
+    }
+
+def summarize(results, elapsed):
+    """
+    Build the summary report of a batch.
+
+    Args:
+        results (list): The results of every game.
+        elapsed (float): The time the batch took, in seconds.
+
+    Returns:
+        list: The lines of the report.
+    """
+    scores = [result["score"] for result in results]
+    rounds = [result["round"] for result in results]
+    deaths = [result["deaths"] for result in results]
+    frames = sum(result["frames"] for result in results)
+    frame_ms = sum(result["frame_ms"] * result["frames"] for result in results) / frames
+
+    return [
+        f"games:       {len(results)} in {elapsed:.1f} s ({len(results) / elapsed:.1f} games/s, {frames / elapsed:.0f} frames/s)",
+        f"game over:   {sum(result['game_over'] for result in results)}",
+        f"score:       mean {statistics.fmean(scores):.0f}, median {statistics.median(scores):.0f}, max {max(scores)}",
+        f"round:       mean {statistics.fmean(rounds):.2f}, max {max(rounds)}",
+        f"deaths:      mean {statistics.fmean(deaths):.2f}",
+        f"frame cost:  mean {frame_ms:.2f} ms, worst p95 {max(result['frame_p95_ms'] for result in results):.2f} ms",
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description="Play many headless games in parallel and summarize the results.")
+    parser.add_argument("--games", type=int, default=100, help="number of games")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game, the next games use the following seeds")
+    parser.add_argument("--minutes", type=float, default=5, help="game time limit of every game, in minutes")
+    parser.add_argument("--policy", choices=POLICIES, default="random", help="how the player is controlled")
+    parser.add_argument("--output", help="path of a JSON file for the results of every game")
+    args = parser.parse_args()
+
+    max_frames = int(args.minutes * 60 * FPS)
+    jobs = [(args.seed + n, max_frames, args.policy) for n in range(args.games)]
+
+    start = time.perf_counter()
+    results = []
+    with multiprocessing.Pool(args.workers, initializer=init_worker) as pool:
+        for result in pool.imap_unordered(run_game, jobs):
+            results.append(result)
+            print(f"\r{len(results)}/{args.games} games", end="", flush=True)
+    print()
+
+    results.sort(key=lambda result: result["seed"])
+    for line in summarize(results, time.perf_counter() - start):
+        print(line)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,21 @@
 import pygame
 from os import path
 
+from utils.tracer import traced
+from utils.assets import load_sprite
+
+_spans = {}  # (Segment widths, height) -> images of the platform spans with those cells
+
 class Platform(pygame.sprite.Sprite):
     """
     Represents a platform in the game. Platforms can either be regular or floor platforms,
     and they have a visual representation loaded from image files.
+
+    A platform can span several cells of the level, drawn side by side as they would be
+    as separate platforms (see levels.compiler).
     """
 
-    def __init__(self, x, y, width=100, height=25, floor=False):
+    def __init__(self, x, y, width=100, height=25, floor=False, segments=None):
         """
         Initializes the Platform object with its position, dimensions, and type.
 
@@ -17,19 +25,45 @@ class Platform(pygame.sprite.Sprite):
             width (int, optional): The width of the platform. Defaults to 100.
             height (int, optional): The height of the platform. Defaults to 25.
             floor (bool, optional): Whether the platform is a floor platform. Defaults to False.
+            segments (list, optional): Widths of the cells the platform spans, overriding width. Defaults to None (a single cell).
         """
         super().__init__()
-        self.load_images()  # Load the platform images from the assets folder.
+        self.segments = tuple(segments) if segments else (width,)
+        self.load_images(self.segments, height)  # Load the platform images from the assets folder.
         # Set the image based on whether the platform is a floor or not.
-        self.image = pygame.transform.scale(self.platform, (width, height)) if floor else pygame.transform.scale(self.platform_floor, (width, height + 15))
+        self.image = self.platform if floor else self.platform_floor
         self.rect = self.image.get_rect(topleft=(x, y))  # Define the rectangle for collision detection.
 
-    def load_images(self):
+    @traced("Platform.load_images", "assets")
+    def load_images(self, segments, height):
         """
-        Loads the platform images from the assets folder.
+        Loads the platform images from the assets folder, already scaled to the platform size.
+        Spans of several cells repeat the image scaled to each cell, built once for every
+        combination of widths and shared.
 
         The images are expected to be located in the "assets/sprites/structures" directory.
+
+        Args:
+            segments (tuple): The widths of the cells of the platform.
+            height (int): The height of the platform.
         """
         base_path = path.join("assets", "sprites", "structures")
-        self.platform = pygame.image.load(path.join(base_path, "platform.png"))  # Load the regular platform image.
-        self.platform_floor = pygame.image.load(path.join(base_path, "platform_floor.png"))  # Load the floor platform image.
\ No newline at end of file
+
+        if len(segments) == 1:
+            self.platform = load_sprite(path.join(base_path, "platform.png"), (segments[0], height))  # Load the regular platform image.
+            self.platform_floor = load_sprite(path.join(base_path, "platform_floor.png"), (segments[0], height + 15))  # Load the floor platform image.
+            return
+
+        key = (segments, height)
+        if key not in _spans:
+            images = []
+            for name, image_height in [("platform.png", height), ("platform_floor.png", height + 15)]:
+                image = pygame.Surface((sum(segments), image_height), pygame.SRCALPHA)
+                x = 0
+                for width in segments:
+                    image.blit(load_sprite(path.join(base_path, name), (width, image_height)), (x, 0))
+                    x += width
+                images.append(image.convert_alpha() if pygame.display.get_surface() else image)
+            _spans[key] = images
+
+        self.platform, self.platform_floor = _spans[key]
\ No newline at end of file
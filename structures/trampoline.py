@@ -1,7 +1,20 @@
 import pygame
 from os import path
+from utils.tracer import traced
+from utils.assets import load_sound
+from utils.atlas import load_atlas
+from utils.animation import Animator, load_clips
 from config.settings import GRAY, CYAN, TRAMPOLINE_SCORE
 
+# Colors of the trampoline after 0, 1, 2 and 3 bounces
+TRAMPOLINE_COLORS = ("green", "blue", "pink", "red")
+
+# Bounce animation of every color, each frame shown for 3 ticks
+TRAMPOLINE_CLIPS = {
+    color: ([(f"{color}_trampoline_moving_{frame}", 3) for frame in [1, 2, 3, 2, 1, 4, 5, 4]], False)
+    for color in TRAMPOLINE_COLORS
+}
+
 class Trampoline(pygame.sprite.Sprite):
     """
     Represents a trampoline in the game. The trampoline can interact with the player, change its state based on usage,
@@ -28,11 +41,9 @@ class Trampoline(pygame.sprite.Sprite):
         self.color = "green"  # Initial color of the trampoline.
 
         self.animation = False  # Indicates whether the trampoline is animating.
-        self.animation_counter = 1  # Counter for animation frames.
-        self.animation_frame = 0  # Current frame in the animation sequence.
-        self.animation_sequence = [1, 2, 3, 2, 1, 4, 5, 4]  # Sequence of animation frames.
+        self.animator = Animator()  # Plays the bounce animation clips.
 
-        self.sound = pygame.mixer.Sound(path.join("assets", "sounds", "mappy_trampoline_jump.mp3"))  # Load the trampoline sound.
+        self.sound = load_sound(path.join("assets", "sounds", "mappy_trampoline_jump.mp3"))  # Load the trampoline sound.
 
     def reset(self):
         """
@@ -70,8 +81,8 @@ class Trampoline(pygame.sprite.Sprite):
         Starts the trampoline's animation and plays the bounce sound.
         """
         self.sound.play()
-        self.animation_counter = 1
-        self.animation_frame = 0
+        self.color = TRAMPOLINE_COLORS[min(self.bounce_counter, 3)]
+        self.animator.play(self.clips[self.color], restart=True)
         self.animation = True
 
     def stop_animation(self):
@@ -82,26 +93,19 @@ class Trampoline(pygame.sprite.Sprite):
 
     def animate(self):
         """
-        Handles the trampoline's animation logic based on the bounce counter and animation sequence.
+        Handles the trampoline's animation logic based on the bounce counter and the bounce clip.
         """
-        match self.bounce_counter:
-            case 0: self.color = "green"
-            case 1: self.color = "blue"
-            case 2: self.color = "pink"
-            case 3: self.color = "red"
-
-        if self.animation_frame < 7:
-            if self.animation_counter % 3 == 0:
-                self.animation_frame += 1
+        # Follow color changes without restarting the bounce
+        color = TRAMPOLINE_COLORS[min(self.bounce_counter, 3)]
+        if color != self.color:
+            self.color = color
+            self.animator.switch(self.clips[color])
 
-            frame = self.animation_sequence[self.animation_frame]
-            self.image = self.images[f"{self.color}_trampoline_moving_{frame}"]
-
-            self.animation_counter += 1
+        if not self.animator.finished():
+            self.image = self.animator.frame()
         else:
-            self.image = self.images[f"{self.color}_trampoline"]
-            self.animation_frame = 0
-            self.animation_counter = 1
+            self.image = self.color_images[self.color]
+            self.animator.stop()
             self.stop_animation()
 
     def update(self):
@@ -114,9 +118,11 @@ class Trampoline(pygame.sprite.Sprite):
         if self.broken:
             self.image = self.images["broken_trampoline"]
 
+    @traced("Trampoline.load_images", "assets")
     def load_images(self, width, height):
         """
-        Loads the trampoline images for different states and animations.
+        Loads the trampoline images for different states and animations, as views of the
+        atlas shared by every trampoline of the same size.
 
         Args:
             width (int): The width to scale the images to.
@@ -124,34 +130,13 @@ class Trampoline(pygame.sprite.Sprite):
         """
         base_path = path.join("assets", "sprites", "trampolines")
 
-        self.images = {
-            "green_trampoline": pygame.transform.scale(pygame.image.load(path.join(base_path, "green_trampoline.png")), (width, height)),
-            "green_trampoline_moving_1": pygame.transform.scale(pygame.image.load(path.join(base_path, "green_trampoline_moving_1.png")), (width, height)),
-            "green_trampoline_moving_2": pygame.transform.scale(pygame.image.load(path.join(base_path, "green_trampoline_moving_2.png")), (width, height)),
-            "green_trampoline_moving_3": pygame.transform.scale(pygame.image.load(path.join(base_path, "green_trampoline_moving_3.png")), (width, height)),
-            "green_trampoline_moving_4": pygame.transform.scale(pygame.image.load(path.join(base_path, "green_trampoline_moving_4.png")), (width, height)),
-            "green_trampoline_moving_5": pygame.transform.scale(pygame.image.load(path.join(base_path, "green_trampoline_moving_5.png")), (width, height)),
-
-            "blue_trampoline": pygame.transform.scale(pygame.image.load(path.join(base_path, "blue_trampoline.png")), (width, height)),
-            "blue_trampoline_moving_1": pygame.transform.scale(pygame.image.load(path.join(base_path, "blue_trampoline_moving_1.png")), (width, height)),
-            "blue_trampoline_moving_2": pygame.transform.scale(pygame.image.load(path.join(base_path, "blue_trampoline_moving_2.png")), (width, height)),
-            "blue_trampoline_moving_3": pygame.transform.scale(pygame.image.load(path.join(base_path, "blue_trampoline_moving_3.png")), (width, height)),
-            "blue_trampoline_moving_4": pygame.transform.scale(pygame.image.load(path.join(base_path, "blue_trampoline_moving_4.png")), (width, height)),
-            "blue_trampoline_moving_5": pygame.transform.scale(pygame.image.load(path.join(base_path, "blue_trampoline_moving_5.png")), (width, height)),
-
-            "pink_trampoline": pygame.transform.scale(pygame.image.load(path.join(base_path, "pink_trampoline.png")), (width, height)),
-            "pink_trampoline_moving_1": pygame.transform.scale(pygame.image.load(path.join(base_path, "pink_trampoline_moving_1.png")), (width, height)),
-            "pink_trampoline_moving_2": pygame.transform.scale(pygame.image.load(path.join(base_path, "pink_trampoline_moving_2.png")), (width, height)),
-            "pink_trampoline_moving_3": pygame.transform.scale(pygame.image.load(path.join(base_path, "pink_trampoline_moving_3.png")), (width, height)),
-            "pink_trampoline_moving_4": pygame.transform.scale(pygame.image.load(path.join(base_path, "pink_trampoline_moving_4.png")), (width, height)),
-            "pink_trampoline_moving_5": pygame.transform.scale(pygame.image.load(path.join(base_path, "pink_trampoline_moving_5.png")), (width, height)),
-
-            "red_trampoline": pygame.transform.scale(pygame.image.load(path.join(base_path, "red_trampoline.png")), (width, height)),
-            "red_trampoline_moving_1": pygame.transform.scale(pygame.image.load(path.join(base_path, "red_trampoline_moving_1.png")), (width, height)),
-            "red_trampoline_moving_2": pygame.transform.scale(pygame.image.load(path.join(base_path, "red_trampoline_moving_2.png")), (width, height)),
-            "red_trampoline_moving_3": pygame.transform.scale(pygame.image.load(path.join(base_path, "red_trampoline_moving_3.png")), (width, height)),
-            "red_trampoline_moving_4": pygame.transform.scale(pygame.image.load(path.join(base_path, "red_trampoline_moving_4.png")), (width, height)),
-            "red_trampoline_moving_5": pygame.transform.scale(pygame.image.load(path.join(base_path, "red_trampoline_moving_5.png")), (width, height)),
-
-            "broken_trampoline": pygame.transform.scale(pygame.image.load(path.join(base_path, "broken_trampoline.png")), (width, height)),
-        }
\ No newline at end of file
+        frames = []
+        for color in ["green", "blue", "pink", "red"]:
+            frames.append((f"{color}_trampoline", path.join(base_path, f"{color}_trampoline.png"), (width, height), False))
+            for n in range(1, 6):
+                frames.append((f"{color}_trampoline_moving_{n}", path.join(base_path, f"{color}_trampoline_moving_{n}.png"), (width, height), False))
+        frames.append(("broken_trampoline", path.join(base_path, "broken_trampoline.png"), (width, height), False))
+
+        self.images = load_atlas(f"trampoline_{width}x{height}", frames).frames
+        self.clips = load_clips(f"trampoline_{width}x{height}", self.images, TRAMPOLINE_CLIPS)
+        self.color_images = {color: self.images[f"{color}_trampoline"] for color in TRAMPOLINE_COLORS}
\ No newline at end of file
@@ -1,6 +1,9 @@
 import pygame
 from os import path
 
+from utils.tracer import traced
+from utils.assets import load_sprite
+
 class Wall(pygame.sprite.Sprite):
     """
     Represents a wall structure in the game. This class is a sprite that can detect collisions
@@ -18,8 +21,8 @@ class Wall(pygame.sprite.Sprite):
             height (int, optional): The height of the wall. Defaults to 75.
         """
         super().__init__()
-        self.load_images()  # Load the wall image from the assets folder.
-        self.image = pygame.transform.scale(self.wall, (width, height))  # Scale the image to the specified dimensions.
+        self.load_images(width, height)  # Load the wall image from the assets folder.
+        self.image = self.wall  # Image already scaled to the specified dimensions.
         self.rect = self.image.get_rect(bottomright=(x, y))  # Set the rectangle for collision detection.
 
     def check_collision(self, entity):
@@ -42,11 +45,16 @@ class Wall(pygame.sprite.Sprite):
                 entity.rect.bottomright = (self.rect.bottomleft[0] - 4, self.rect.bottomright[1])
                 entity.state = "left"
 
-    def load_images(self):
+    @traced("Wall.load_images", "assets")
+    def load_images(self, width, height):
         """
-        Loads the wall image from the assets folder.
+        Loads the wall image from the assets folder, already scaled to the wall size.
 
         The image is expected to be located in the "assets/sprites/structures" directory.
+
+        Args:
+            width (int): The width of the wall.
+            height (int): The height of the wall.
         """
         base_path = path.join("assets", "sprites", "structures")
-        self.wall = pygame.image.load(path.join(base_path, "wall.png"))  # Load the wall image file.
\ No newline at end of file
+        self.wall = load_sprite(path.join(base_path, "wall.png"), (width, height))  # Load the wall image file.
\ No newline at end of file
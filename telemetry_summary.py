@@ -0,0 +1,145 @@
+import sys
+import glob
+import json
+import argparse
+import statistics
+from os import path
+
+from config.settings import TELEMETRY_DIR
+
+"""
+Summary tool that aggregates the telemetry files written by the game: the sessions, and the
+levels of every round with their outcomes, frame cost, build time, score and player actions.
+
+Usage:
+    python telemetry_summary.py [files or directories ...] [--json]
+"""
+
+def read_records(paths):
+    """
+    Read the records of telemetry files, skipping the lines that are not valid JSON, such as
+    the last line of a session that was killed while writing it.
+
+    Args:
+        paths (list): Paths of files, or of directories whose .jsonl files are read.
+
+    Returns:
+        tuple: The records and the number of skipped lines.
+    """
+    files = []
+    for file_path in paths:
+        if path.isdir(file_path):
+            files.extend(sorted(glob.glob(path.join(file_path, "*.jsonl"))))
+        else:
+            files.append(file_path)
+
+    records = []
+    skipped = 0
+    for file_path in files:
+        with open(file_path, "r") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    skipped += 1
+
+    return records, skipped
+
+def summarize_levels(levels):
+    """
+    Aggregate level records by round.
+
+    Args:
+        levels (list): The level records.
+
+    Returns:
+        dict: Round number -> the aggregated metrics of its levels.
+    """
+    rounds = {}
+    for record in levels:
+        rounds.setdefault(record["round"], []).append(record)
+
+    summary = {}
+    for round_number, records in sorted(rounds.items()):
+        frames = sum(record["frames"] for record in records)
+        summary[round_number] = {
+            "levels": len(records),
+            "cleared": sum(record["outcome"] == "cleared" for record in records),
+            "frames": frames,
+            "update_ms": sum(record["update_ms"] * record["frames"] for record in records) / frames if frames else 0.0,
+            "update_p99_ms": max(record["update_p99_ms"] for record in records),
+            "draw_ms": statistics.fmean(record["draw_ms"] for record in records),
+            "draw_p99_ms": max(record["draw_p99_ms"] for record in records),
+            "build_ms": statistics.fmean(record["build_ms"] for record in records),
+            "score": statistics.fmean(record["score"] for record in records),
+            "deaths": sum(record["deaths"] for record in records),
+            "items": sum(record["items"] for record in records),
+            "bounces": sum(record["bounces"] for record in records),
+        }
+
+    return summary
+
+def report(sessions, rounds, skipped):
+    """
+    Build the text report of the aggregated telemetry.
+
+    Args:
+        sessions (list): The session records.
+        rounds (dict): The aggregated metrics of every round.
+        skipped (int): The number of lines that could not be read.
+
+    Returns:
+        list: The lines of the report.
+    """
+    lines = []
+    if sessions:
+        frames = sum(session["frames"] for session in sessions)
+        lines.extend([
+            f"sessions:    {len(sessions)}, {sum(session['duration_s'] for session in sessions) / 60:.1f} minutes, {frames} frames",
+            f"score:       mean {statistics.fmean(session['score'] for session in sessions):.0f}, max {max(session['score'] for session in sessions)}",
+            f"round:       mean {statistics.fmean(session['round'] for session in sessions):.2f}, max {max(session['round'] for session in sessions)}",
+            f"update:      mean {sum(session['update_ms'] * session['frames'] for session in sessions) / frames if frames else 0.0:.2f} ms, "
+            f"worst p99 {max(session['update_p99_ms'] for session in sessions):.2f} ms",
+            f"draw:        worst p99 {max(session['draw_p99_ms'] for session in sessions):.2f} ms",
+            f"dropped:     {sum(session['dropped'] for session in sessions)} records",
+        ])
+    else:
+        lines.append("sessions:    none finished")
+
+    if skipped:
+        lines.append(f"skipped:     {skipped} unreadable lines")
+
+    if rounds:
+        lines.append("")
+        lines.append(f"{'round':>5} {'levels':>6} {'clear':>5} {'update':>7} {'p99':>6} {'draw':>6} {'p99':>6} {'build':>7} {'score':>6} {'deaths':>6} {'items':>5} {'bounce':>6}")
+        for round_number, summary in rounds.items():
+            lines.append(
+                f"{round_number:>5} {summary['levels']:>6} {summary['cleared']:>5} "
+                f"{summary['update_ms']:>7.2f} {summary['update_p99_ms']:>6.2f} {summary['draw_ms']:>6.2f} {summary['draw_p99_ms']:>6.2f} "
+                f"{summary['build_ms']:>7.2f} {summary['score']:>6.0f} {summary['deaths']:>6} {summary['items']:>5} {summary['bounces']:>6}"
+            )
+        lines.append("(times in ms; score is the mean per level, deaths, items and bounces are totals)")
+
+    return lines
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate the telemetry files written by the game.")
+    parser.add_argument("paths", nargs="*", default=[TELEMETRY_DIR], help="telemetry files or directories")
+    parser.add_argument("--json", action="store_true", help="print the aggregated rounds as JSON")
+    args = parser.parse_args()
+
+    records, skipped = read_records(args.paths)
+    sessions = [record for record in records if record.get("type") == "session"]
+    rounds = summarize_levels([record for record in records if record.get("type") == "level"])
+
+    if args.json:
+        print(json.dumps({str(round_number): summary for round_number, summary in rounds.items()}, indent=4))
+    else:
+        for line in report(sessions, rounds, skipped):
+            print(line)
+
+    if not records:
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
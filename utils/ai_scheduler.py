@@ -0,0 +1,87 @@
+import time
+from collections import deque
+
+from config.settings import AI_THINK_INTERVAL, AI_TIME_BUDGET_MS
+
+"""
+This module defines the AIScheduler class, which spreads the decisions of the enemies across
+frames: every agent thinks once every few ticks, in round-robin, within a time budget per frame.
+"""
+
+class AIScheduler:
+    """
+    Runs the think method of the agents at a fixed rate, staggered across frames.
+
+    Agents get a slot when registered and think on the ticks of their slot. When the time budget
+    of a frame is spent, the remaining agents are deferred to the start of the next frame.
+
+    Args:
+        interval (int, optional): Ticks between two decisions of the same agent. Defaults to AI_THINK_INTERVAL.
+        budget_ms (float, optional): Time available for decisions in each frame, in milliseconds. Defaults to AI_TIME_BUDGET_MS.
+    """
+    def __init__(self, interval=AI_THINK_INTERVAL, budget_ms=AI_TIME_BUDGET_MS):
+        self.interval = max(1, interval)
+        self.budget = budget_ms / 1000
+        self.tick = 0
+        self.next_slot = 0
+        self.deferred = deque()
+
+        # Metrics of the last frame
+        self.thought = 0
+        self.skipped = 0
+        self.deferred_count = 0
+
+        # Metrics since the scheduler was created
+        self.total_thought = 0
+        self.total_deferred = 0
+
+    def register(self, agent):
+        """
+        Give an agent the next round-robin slot.
+
+        Args:
+            agent: An object with a think_slot attribute and a think method.
+        """
+        agent.think_slot = self.next_slot
+        self.next_slot = (self.next_slot + 1) % self.interval
+
+    def run(self, agents, *args):
+        """
+        Let the agents whose slot is due think, deferred ones first, until the budget is spent.
+
+        Args:
+            agents (iterable): The active agents.
+            *args: Arguments passed to every think call.
+        """
+        slot = self.tick % self.interval
+        self.tick += 1
+
+        due = list(self.deferred)
+        self.deferred.clear()
+        due_set = set(due)
+        for agent in agents:
+            if agent.think_slot == slot and agent not in due_set:
+                due.append(agent)
+
+        self.thought = 0
+        start = time.perf_counter()
+        for index, agent in enumerate(due):
+            # Always make progress, then stop when the budget is spent
+            if self.thought > 0 and time.perf_counter() - start > self.budget:
+                self.deferred.extend(due[index:])
+                break
+
+            if agent.alive():
+                agent.think(*args)
+                self.thought += 1
+
+        self.deferred_count = len(self.deferred)
+        self.skipped = len(agents) - self.thought - self.deferred_count
+        self.total_thought += self.thought
+        self.total_deferred += self.deferred_count
+
+    def clear(self):
+        """
+        Forget the deferred agents, for example when they are removed from the level.
+        """
+        self.deferred.clear()
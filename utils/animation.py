@@ -0,0 +1,146 @@
+"""
+This module defines animation clips, precompiled sequences of frames, and the Animator class
+that plays them. Every animation follows the shared clock, so the frame of a clip is computed
+from the current tick and the tick it started at, only when it is needed.
+"""
+
+_clips = {}  # Clip set name -> dict of clips, shared by every entity of the same type
+
+class AnimationClock:
+    """
+    Frame counter shared by every animation, advanced once per game update.
+    """
+    __slots__ = ("tick",)
+
+    def __init__(self):
+        self.tick = 0
+
+    def advance(self):
+        """
+        Move every animation to the next tick.
+        """
+        self.tick += 1
+
+    def since(self, start_tick):
+        """
+        Get the ticks elapsed since a given tick.
+
+        Args:
+            start_tick (int): The tick to measure from.
+
+        Returns:
+            int: The elapsed ticks.
+        """
+        return self.tick - start_tick
+
+class AnimationClip:
+    """
+    Precompiled animation, stored as a timeline with one entry per tick.
+
+    Args:
+        frames (list): (surface, ticks) pairs, each frame is shown for the given number of ticks.
+        loop (bool, optional): Whether the clip starts again after the last frame. Defaults to True.
+    """
+    __slots__ = ("timeline", "length", "loop")
+
+    def __init__(self, frames, loop=True):
+        self.timeline = tuple(surface for surface, ticks in frames for _ in range(ticks))
+        self.length = len(self.timeline)
+        self.loop = loop
+
+    def frame_at(self, tick):
+        """
+        Get the frame shown at a given tick of the clip.
+
+        Args:
+            tick (int): Ticks elapsed since the clip started.
+
+        Returns:
+            pygame.Surface: The frame. Clips that do not loop hold their last frame.
+        """
+        if tick < self.length:
+            return self.timeline[tick]
+        if self.loop:
+            return self.timeline[tick % self.length]
+        return self.timeline[-1]
+
+class Animator:
+    """
+    Plays one clip at a time for an entity. Only the clip and the tick it started at are stored,
+    so an entity that is not updated for a while shows the right frame as soon as it asks for it.
+    """
+    __slots__ = ("clip", "start_tick")
+
+    def __init__(self):
+        self.clip = None
+        self.start_tick = 0
+
+    def play(self, clip, restart=False):
+        """
+        Start playing a clip. Playing the clip that is already playing does not restart it.
+
+        Args:
+            clip (AnimationClip): The clip to play.
+            restart (bool, optional): Whether to start from the first frame even if it is already playing. Defaults to False.
+        """
+        if clip is not self.clip or restart:
+            self.clip = clip
+            self.start_tick = clock.tick
+
+    def switch(self, clip):
+        """
+        Change to a variant of the current clip, such as another color, keeping the elapsed ticks.
+
+        Args:
+            clip (AnimationClip): The clip to continue with.
+        """
+        self.clip = clip
+
+    def stop(self):
+        """
+        Stop playing the current clip.
+        """
+        self.clip = None
+        self.start_tick = 0
+
+    def frame(self):
+        """
+        Get the frame of the current clip at the current tick of the clock.
+
+        Returns:
+            pygame.Surface: The frame to show.
+        """
+        return self.clip.frame_at(clock.since(self.start_tick))
+
+    def finished(self):
+        """
+        Check if the current clip reached its end.
+
+        Returns:
+            bool: True if there is no clip or a clip that does not loop has shown every frame.
+        """
+        return self.clip is None or (not self.clip.loop and clock.since(self.start_tick) >= self.clip.length)
+
+clock = AnimationClock()
+
+def load_clips(name, images, specs):
+    """
+    Get the clips of an entity type, compiling them from its images the first time.
+
+    Args:
+        name (str): The name of the clip set, unique for each entity type and image size.
+        images (dict): Frame name -> pygame.Surface.
+        specs (dict): Clip name -> (list of (frame name, ticks) pairs, loop).
+
+    Returns:
+        dict: Clip name -> AnimationClip.
+    """
+    clips = _clips.get(name)
+    if clips is None:
+        clips = {
+            clip_name: AnimationClip([(images[frame_name], ticks) for frame_name, ticks in frames], loop)
+            for clip_name, (frames, loop) in specs.items()
+        }
+        _clips[name] = clips
+
+    return clips
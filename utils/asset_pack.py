@@ -0,0 +1,212 @@
+import os
+import json
+import mmap
+import struct
+import pygame
+
+"""
+This module defines the asset pack format: sprites already scaled and flipped, stored as raw RGBA
+pixels, and sounds stored as decoded PCM, all in one file that is memory-mapped at startup.
+
+Layout: magic (8 bytes), header length (uint32), JSON header, then the data blocks.
+The header maps every key to the offset and length of its block.
+"""
+
+PACK_MAGIC = b"MAPPYPK1"
+
+def sprite_key(file_path, size=None, flip=False):
+    """
+    Build the pack key of a sprite variant.
+
+    Args:
+        file_path (str): The path of the source image file.
+        size (tuple, optional): The final size of the sprite, None to keep the original. Defaults to None.
+        flip (bool, optional): Whether the sprite is flipped horizontally. Defaults to False.
+
+    Returns:
+        str: The key of the sprite in the pack.
+    """
+    size_text = f"{size[0]}x{size[1]}" if size else "original"
+    return f"{file_path.replace(os.sep, '/')}|{size_text}|{'flip' if flip else 'noflip'}"
+
+def sound_key(file_path):
+    """
+    Build the pack key of a sound.
+
+    Args:
+        file_path (str): The path of the source sound file.
+
+    Returns:
+        str: The key of the sound in the pack.
+    """
+    return file_path.replace(os.sep, "/")
+
+def bake_sprite(file_path, size=None, flip=False):
+    """
+    Decode, scale and flip a sprite the same way the game does at runtime.
+
+    Args:
+        file_path (str): The path of the source image file.
+        size (tuple, optional): The final size of the sprite. Defaults to None.
+        flip (bool, optional): Whether to flip it horizontally. Defaults to False.
+
+    Returns:
+        pygame.Surface: The baked sprite.
+    """
+    image = pygame.image.load(file_path)
+    if size:
+        image = pygame.transform.scale(image, size)
+    if flip:
+        image = pygame.transform.flip(image, True, False)
+    return image
+
+def build_asset_pack(pack_path, sprites, sounds):
+    """
+    Bake sprites and sounds into a pack file. Missing source files are skipped.
+
+    Args:
+        pack_path (str): The path of the pack file to write.
+        sprites (list): (file path, size, flip) tuples of the sprite variants to bake.
+        sounds (list): Paths of the sound files to decode.
+
+    Returns:
+        tuple: The number of baked entries and the list of skipped source files.
+    """
+    entries = {}
+    blocks = []
+    offset = 0
+    skipped = []
+
+    def add_block(key, data, entry):
+        nonlocal offset
+        entry.update({"offset": offset, "length": len(data)})
+        entries[key] = entry
+        blocks.append(data)
+        offset += len(data)
+
+    for file_path, size, flip in sprites:
+        if not os.path.exists(file_path):
+            skipped.append(file_path)
+            continue
+        image = bake_sprite(file_path, size, flip)
+        add_block(sprite_key(file_path, size, flip), pygame.image.tobytes(image, "RGBA"), {"kind": "image", "size": list(image.get_size())})
+
+    for file_path in sounds:
+        if not os.path.exists(file_path):
+            skipped.append(file_path)
+            continue
+        sound = pygame.mixer.Sound(file_path)
+        add_block(sound_key(file_path), sound.get_raw(), {"kind": "sound"})
+
+    header = json.dumps({"mixer": list(pygame.mixer.get_init()), "entries": entries}).encode("utf-8")
+
+    directory = os.path.dirname(pack_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(pack_path, "wb") as f:
+        f.write(PACK_MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for data in blocks:
+            f.write(data)
+
+    return len(entries), skipped
+
+class AssetPack:
+    """
+    Read-only view of a pack file. Sprites are created directly on top of the mapped
+    pixels and sounds from the mapped PCM, without decoding any file.
+
+    Args:
+        pack_path (str): The path of the pack file.
+
+    Raises:
+        ValueError: If the file is not an asset pack.
+    """
+    def __init__(self, pack_path):
+        self.file = open(pack_path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.data[:len(PACK_MAGIC)] != PACK_MAGIC:
+            self.close()
+            raise ValueError(f"{pack_path} is not an asset pack")
+
+        header_start = len(PACK_MAGIC) + 4
+        header_length = struct.unpack_from("<I", self.data, len(PACK_MAGIC))[0]
+        header = json.loads(bytes(self.data[header_start:header_start + header_length]))
+
+        self.entries = header["entries"]
+        self.mixer = tuple(header["mixer"])
+        self.data_start = header_start + header_length
+        self.view = memoryview(self.data)
+
+        # Source files with at least one usable variant, sounds only if the mixer format matches
+        sounds_usable = pygame.mixer.get_init() == self.mixer
+        self.files = {key.split("|")[0] for key, entry in self.entries.items() if entry["kind"] == "image" or sounds_usable}
+
+    def block(self, entry):
+        """
+        Get the mapped bytes of an entry, without copying them.
+
+        Args:
+            entry (dict): The header entry.
+
+        Returns:
+            memoryview: The bytes of the entry.
+        """
+        start = self.data_start + entry["offset"]
+        return self.view[start:start + entry["length"]]
+
+    def covers(self, file_path):
+        """
+        Check if the pack has any variant of a source file.
+
+        Args:
+            file_path (str): The path of the source file.
+
+        Returns:
+            bool: True if the file is in the pack, False otherwise.
+        """
+        return file_path.replace(os.sep, "/") in self.files
+
+    def sprite(self, file_path, size=None, flip=False):
+        """
+        Get a baked sprite variant.
+
+        Args:
+            file_path (str): The path of the source image file.
+            size (tuple, optional): The final size of the sprite. Defaults to None.
+            flip (bool, optional): Whether the sprite is flipped horizontally. Defaults to False.
+
+        Returns:
+            pygame.Surface: The sprite backed by the mapped pixels, or None if it was not baked.
+        """
+        entry = self.entries.get(sprite_key(file_path, size, flip))
+        if entry is None:
+            return None
+        return pygame.image.frombuffer(self.block(entry), tuple(entry["size"]), "RGBA")
+
+    def sound(self, file_path):
+        """
+        Get a decoded sound.
+
+        Args:
+            file_path (str): The path of the source sound file.
+
+        Returns:
+            pygame.mixer.Sound: The sound, or None if it was not baked or the mixer format differs.
+        """
+        entry = self.entries.get(sound_key(file_path))
+        if entry is None or pygame.mixer.get_init() != self.mixer:
+            return None
+        return pygame.mixer.Sound(buffer=self.block(entry))
+
+    def close(self):
+        """
+        Unmap and close the pack file. Surfaces created from it must not be used afterwards.
+        """
+        if hasattr(self, "view"):
+            self.view.release()
+        self.data.close()
+        self.file.close()
@@ -0,0 +1,247 @@
+import os
+import threading
+import pygame
+
+from utils.tracer import tracer
+from utils.asset_pack import AssetPack
+
+"""
+This module caches decoded images, sounds and fonts, and defines the AssetLoader class,
+which decodes them in a background thread while the start screen is already shown.
+When an asset pack is open, sprites and sounds are taken from it instead of decoding the files.
+"""
+
+_pack = None  # AssetPack opened by open_asset_pack
+_images = {}  # File path -> decoded pygame.Surface, as stored in the file
+_sprites = {}  # (File path, size, flip) -> pygame.Surface ready to draw
+_sounds = {}  # File path -> pygame.mixer.Sound
+_fonts = {}  # (File path, size) -> pygame.font.Font
+_lock = threading.Lock()
+
+def open_asset_pack(pack_path):
+    """
+    Memory-map an asset pack so the baked sprites and sounds are taken from it.
+
+    Args:
+        pack_path (str): The path of the pack file.
+
+    Returns:
+        bool: True if the pack was opened, False if it does not exist or is not valid.
+    """
+    global _pack
+
+    if not os.path.exists(pack_path):
+        return False
+
+    with tracer.span("open_asset_pack", "assets"):
+        try:
+            _pack = AssetPack(pack_path)
+        except (ValueError, KeyError, OSError):
+            return False
+
+    return True
+
+def in_asset_pack(file_path):
+    """
+    Check if a file is provided by the open asset pack.
+
+    Args:
+        file_path (str): The path of the source file.
+
+    Returns:
+        bool: True if the pack has the file, False otherwise.
+    """
+    return _pack is not None and _pack.covers(file_path)
+
+def load_sprite(file_path, size=None, flip=False):
+    """
+    Get a sprite ready to draw: scaled to its final size, flipped if requested and converted
+    to the display format. Each variant is built only once and shared.
+
+    Args:
+        file_path (str): The path of the image file.
+        size (tuple, optional): The final size of the sprite, None to keep the original. Defaults to None.
+        flip (bool, optional): Whether to flip it horizontally. Defaults to False.
+
+    Returns:
+        pygame.Surface: The sprite, which must not be modified.
+    """
+    key = (file_path, size, flip)
+    sprite = _sprites.get(key)
+    if sprite is not None:
+        return sprite
+
+    return _sprites.setdefault(key, build_sprite(file_path, size, flip))
+
+def build_sprite(file_path, size=None, flip=False):
+    """
+    Build a new sprite surface, like load_sprite but without keeping it in the cache.
+
+    Args:
+        file_path (str): The path of the image file.
+        size (tuple, optional): The final size of the sprite, None to keep the original. Defaults to None.
+        flip (bool, optional): Whether to flip it horizontally. Defaults to False.
+
+    Returns:
+        pygame.Surface: The new sprite.
+    """
+    # Baked variant from the pack, or decoded and transformed at runtime
+    sprite = _pack.sprite(file_path, size, flip) if _pack else None
+    if sprite is None:
+        sprite = load_image(file_path)
+        if size:
+            sprite = pygame.transform.scale(sprite, size)
+        if flip:
+            sprite = pygame.transform.flip(sprite, True, False)
+
+    if pygame.display.get_surface() is not None:
+        sprite = sprite.convert_alpha()
+
+    return sprite
+
+def load_image(file_path):
+    """
+    Load an image file, decoding it only the first time it is requested.
+
+    The returned surface is shared, so it must not be modified; convert or scale it instead.
+
+    Args:
+        file_path (str): The path of the image file.
+
+    Returns:
+        pygame.Surface: The decoded image.
+    """
+    with _lock:
+        image = _images.get(file_path)
+    if image is not None:
+        return image
+
+    with tracer.span(f"load_image {os.path.basename(file_path)}", "assets"):
+        image = pygame.image.load(file_path)
+
+    with _lock:
+        return _images.setdefault(file_path, image)
+
+def load_sound(file_path):
+    """
+    Load a sound file, decoding it only the first time it is requested.
+
+    Args:
+        file_path (str): The path of the sound file.
+
+    Returns:
+        pygame.mixer.Sound: The decoded sound, shared by every caller.
+    """
+    with _lock:
+        sound = _sounds.get(file_path)
+    if sound is not None:
+        return sound
+
+    with tracer.span(f"load_sound {os.path.basename(file_path)}", "assets"):
+        sound = _pack.sound(file_path) if _pack else None
+        if sound is None:
+            sound = pygame.mixer.Sound(file_path)
+
+    with _lock:
+        return _sounds.setdefault(file_path, sound)
+
+def load_font(file_path, size):
+    """
+    Load a font file at a given size, only the first time it is requested.
+
+    Args:
+        file_path (str): The path of the font file.
+        size (int): The size of the font.
+
+    Returns:
+        pygame.font.Font: The font, shared by every caller.
+    """
+    key = (file_path, size)
+    with _lock:
+        font = _fonts.get(key)
+    if font is not None:
+        return font
+
+    with tracer.span(f"load_font {os.path.basename(file_path)} {size}", "assets"):
+        font = pygame.font.Font(file_path, size)
+
+    with _lock:
+        return _fonts.setdefault(key, font)
+
+def list_files(directory, extension):
+    """
+    List every file with a given extension inside a directory and its subdirectories.
+
+    Args:
+        directory (str): The directory to search.
+        extension (str): The file extension, including the dot.
+
+    Returns:
+        list: The sorted file paths.
+    """
+    found = []
+    for root, _, files in os.walk(directory):
+        for file_name in files:
+            if file_name.endswith(extension):
+                found.append(os.path.join(root, file_name))
+
+    return sorted(found)
+
+class AssetLoader:
+    """
+    Decodes a list of images and sounds in a background thread, filling the asset caches.
+
+    Args:
+        images (list): Paths of the image files to decode.
+        sounds (list): Paths of the sound files to decode.
+    """
+    def __init__(self, images, sounds):
+        self.jobs = [(load_image, file_path) for file_path in images] + [(load_sound, file_path) for file_path in sounds]
+        self.total = len(self.jobs)
+        self.done = 0
+        self.errors = []
+
+        self.thread = threading.Thread(target=self.run, name="AssetLoader", daemon=True)
+
+    def start(self):
+        """
+        Start decoding the assets in the background.
+        """
+        self.thread.start()
+
+    def run(self):
+        """
+        Decode every asset in order. Failures are recorded, the asset is loaded again
+        (and the error raised) when the game requests it.
+        """
+        with tracer.span("AssetLoader.run", "assets"):
+            for load, file_path in self.jobs:
+                try:
+                    load(file_path)
+                except (pygame.error, OSError) as error:
+                    self.errors.append((file_path, error))
+                self.done += 1
+
+    def progress(self):
+        """
+        Get the fraction of assets already decoded.
+
+        Returns:
+            float: A value between 0 and 1.
+        """
+        return self.done / self.total if self.total else 1.0
+
+    def finished(self):
+        """
+        Check if the loader has decoded every asset.
+
+        Returns:
+            bool: True if the background thread is done, False otherwise.
+        """
+        return self.done == self.total and not self.thread.is_alive()
+
+    def wait(self):
+        """
+        Block until every asset is decoded.
+        """
+        self.thread.join()
@@ -0,0 +1,73 @@
+import pygame
+
+from utils.assets import build_sprite
+from utils.tracer import tracer
+
+"""
+This module defines the Atlas class, which packs the animation frames of an entity type into
+a single surface and exposes every frame as a subsurface view of it.
+"""
+
+ATLAS_MAX_WIDTH = 1024
+
+_atlases = {}  # Atlas name -> Atlas, shared by every entity of the same type
+
+class Atlas:
+    """
+    Single surface holding several frames, packed in rows from left to right.
+
+    Args:
+        frames (dict): Frame name -> pygame.Surface, in the order they are packed.
+        max_width (int, optional): Maximum width of a row. Defaults to ATLAS_MAX_WIDTH.
+    """
+    def __init__(self, frames, max_width=ATLAS_MAX_WIDTH):
+        # Place every frame, starting a new row when the current one is full
+        placements = {}
+        x, y = 0, 0
+        row_height = 0
+        width = 0
+        for name, frame in frames.items():
+            frame_width, frame_height = frame.get_size()
+            if x > 0 and x + frame_width > max_width:
+                x = 0
+                y += row_height
+                row_height = 0
+
+            placements[name] = pygame.Rect(x, y, frame_width, frame_height)
+            x += frame_width
+            row_height = max(row_height, frame_height)
+            width = max(width, x)
+
+        self.surface = pygame.Surface((max(width, 1), max(y + row_height, 1)), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+
+        # Copy the frames into the atlas and keep only views of it.
+        # BLEND_RGBA_MAX over the transparent atlas copies the pixels exactly, alpha included
+        self.frames = {}
+        for name, rect in placements.items():
+            self.surface.blit(frames[name], rect, special_flags=pygame.BLEND_RGBA_MAX)
+            self.frames[name] = self.surface.subsurface(rect)
+
+    def __getitem__(self, name):
+        return self.frames[name]
+
+def load_atlas(name, frames):
+    """
+    Get the atlas of an entity type, slicing it from the frame image files the first time.
+
+    Args:
+        name (str): The name of the atlas, unique for each entity type and frame size.
+        frames (list): (frame name, file path, size, flip) tuples of every frame.
+
+    Returns:
+        Atlas: The shared atlas.
+    """
+    atlas = _atlases.get(name)
+    if atlas is not None:
+        return atlas
+
+    with tracer.span(f"load_atlas {name}", "assets"):
+        atlas = Atlas({frame_name: build_sprite(file_path, size, flip) for frame_name, file_path, size, flip in frames})
+
+    return _atlases.setdefault(name, atlas)
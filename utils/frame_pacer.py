@@ -0,0 +1,142 @@
+import time
+import math
+import pygame
+
+from utils.histogram import Histogram
+from utils.tracer import tracer
+from config.settings import FRAME_PACER_PRECISE, FRAME_PACER_SPIN_MS, FRAME_TIME_BUCKETS_MS
+
+"""
+This module defines the FramePacer class, which waits for the start of every frame and keeps
+statistics of the frame pacing: a histogram of the frame times, the number of missed deadlines
+and the jitter around the frame period.
+"""
+
+class FramePacer:
+    """
+    Limits the frame rate like pygame.time.Clock.tick, optionally with a precise scheduler.
+
+    pygame.time.Clock.tick waits in whole milliseconds from the end of the previous tick, so
+    frames drift and alternate between 16 and 17 ms at 60 FPS. The precise scheduler keeps a
+    deadline on time.perf_counter, sleeps until spin_ms before it and spins for the rest. A frame
+    whose work ends after its deadline is counted as missed and the next deadline starts from
+    now, so a slow frame is not followed by a burst of short ones.
+
+    Args:
+        fps (int): The target frame rate.
+        precise (bool, optional): Whether to use the precise scheduler instead of pygame.time.Clock. Defaults to FRAME_PACER_PRECISE.
+        spin_ms (float, optional): The time spent spinning before every deadline, in milliseconds. Defaults to FRAME_PACER_SPIN_MS.
+        bounds (list, optional): Upper bounds of the frame time histogram buckets. Defaults to FRAME_TIME_BUCKETS_MS.
+    """
+    def __init__(self, fps, precise=FRAME_PACER_PRECISE, spin_ms=FRAME_PACER_SPIN_MS, bounds=FRAME_TIME_BUCKETS_MS):
+        self.fps = fps
+        self.period = 1 / fps
+        self.precise = precise
+        self.spin = spin_ms / 1000
+        self.clock = pygame.time.Clock()
+
+        self.frame_times = Histogram(bounds)
+        self.missed = 0
+        self.deviation_total = 0.0  # Sums of the deviation from the period, in milliseconds
+        self.deviation_squares = 0.0
+        self.last_tick = None
+        self.deadline = None
+
+    def tick(self):
+        """
+        Wait for the start of the next frame and record the time of the previous one.
+
+        Returns:
+            float: The time elapsed since the previous tick, in seconds.
+        """
+        # The work of the previous frame ended after its deadline
+        missed = self.deadline is not None and time.perf_counter() > self.deadline
+        if missed:
+            self.missed += 1
+
+        if self.precise:
+            self.wait()
+        else:
+            self.clock.tick(self.fps)
+
+        now = time.perf_counter()
+        dt = now - self.last_tick if self.last_tick is not None else 0.0
+        if self.last_tick is not None:
+            self.record(dt * 1000)
+
+        self.last_tick = now
+
+        # pygame.time.Clock keeps no schedule, so its deadlines always count from the last tick
+        if self.precise and self.deadline is not None and not missed:
+            self.deadline += self.period
+        else:
+            self.deadline = now + self.period
+
+        return dt
+
+    def wait(self):
+        """
+        Sleep until shortly before the deadline and spin on time.perf_counter until it arrives.
+        """
+        if self.deadline is None:
+            return
+
+        remaining = self.deadline - time.perf_counter()
+        if remaining > self.spin:
+            time.sleep(remaining - self.spin)
+
+        while time.perf_counter() < self.deadline:
+            pass
+
+    def resync(self):
+        """
+        Start the schedule again after the main loop waited for events. The wait is not a frame,
+        so the next tick records nothing and does not count a missed deadline. The precise scheduler
+        does not wait on that tick, while pygame.time.Clock waits a full period from the wake-up.
+        """
+        self.clock.tick()
+        self.last_tick = None
+        self.deadline = None
+
+    def record(self, frame_ms):
+        """
+        Add a frame time to the statistics.
+
+        Args:
+            frame_ms (float): The frame time, in milliseconds.
+        """
+        deviation = frame_ms - self.period * 1000
+        self.frame_times.add(frame_ms)
+        self.deviation_total += abs(deviation)
+        self.deviation_squares += deviation * deviation
+
+        tracer.counter("frame pacing", frame_ms=frame_ms)
+
+    def jitter(self):
+        """
+        Get the jitter of the frame times around the frame period.
+
+        Returns:
+            tuple: The mean absolute deviation and the root mean square deviation, in milliseconds.
+        """
+        count = self.frame_times.count
+        if not count:
+            return 0.0, 0.0
+
+        return self.deviation_total / count, math.sqrt(self.deviation_squares / count)
+
+    def report(self):
+        """
+        Build the frame pacing report.
+
+        Returns:
+            list: The lines of the report.
+        """
+        mean_deviation, rms_deviation = self.jitter()
+        lines = [
+            f"Frame pacing ({'precise scheduler' if self.precise else 'pygame clock'}, target {self.period * 1000:.2f} ms): "
+            f"{self.missed} missed deadlines, jitter {mean_deviation:.2f} ms mean, {rms_deviation:.2f} ms rms"
+        ]
+        lines.extend(self.frame_times.report("frame time"))
+
+        return lines
@@ -2,12 +2,38 @@ import random
 import json
 import os
 import pygame
-from config.settings import SCORES_FILE
-from levels.levels_distribution import LEVELS_DISTRIBUTION
+from config.settings import SCORES_FILE, LEVEL_FILE, LEVEL_PACK_FILE
+from levels.levels_distribution import LEVELS_DISTRIBUTION, ROUND_LAYOUTS
+from utils.level_pack import LevelPack
+from utils.tracer import traced, tracer
+
+_level_pack = None  # LevelPack opened by get_level_pack, False if there is no usable pack
+
+def get_level_pack():
+    """
+    Open the level pack the first time it is needed.
+
+    Returns:
+        LevelPack: The level pack, or None if it does not exist or is not valid.
+    """
+    global _level_pack
+
+    if _level_pack is None:
+        _level_pack = False
+        if os.path.exists(LEVEL_PACK_FILE):
+            with tracer.span("open_level_pack", "io"):
+                try:
+                    _level_pack = LevelPack(LEVEL_PACK_FILE)
+                except (ValueError, OSError):
+                    pass
+
+    return _level_pack or None
 
 def get_level_matrix(level_number):
     """
-    Retrieve the level matrix for a given level number.
+    Retrieve the level matrix for a given level number, from the level pack if there is one
+    and from levels.levels_distribution otherwise. Round numbers past the last round of the
+    round table start over from round 1.
 
     Args:
         level_number (int): The level number to retrieve the matrix for.
@@ -15,17 +41,62 @@ def get_level_matrix(level_number):
     Returns:
         list: The level matrix corresponding to the given level number.
     """
-    # Determine the level index based on the level number
-    if 1 <= level_number <= 2 or 16 <= level_number <= 18:
-        level = 0
-    elif 4 <= level_number <= 6 or 20 <= level_number <= 22:
-        level = 1
-    elif 8 <= level_number <= 10 or 24 <= level_number <= 26:
-        level = 2
-    elif 12 <= level_number <= 14 or 28 <= level_number <= 30:
-        level = 3
+    pack = get_level_pack()
+    if pack:
+        try:
+            return pack.layout_for_round(level_number)
+        except (ValueError, OSError):
+            pass
+
+    return LEVELS_DISTRIBUTION[ROUND_LAYOUTS[(level_number - 1) % len(ROUND_LAYOUTS)]]
+
+def generate_wide_level_matrix(sections):
+    """
+    Generate a wide level matrix by joining random layouts side by side.
+
+    Consecutive layouts share the trampoline column between them, so a level of n sections
+    has 10 * n + 1 columns.
+
+    Args:
+        sections (int): The number of layouts to join.
 
-    return LEVELS_DISTRIBUTION[level]
+    Returns:
+        list: The wide level matrix.
+    """
+    level_matrix = [list(row) for row in random.choice(LEVELS_DISTRIBUTION)]
+    for _ in range(sections - 1):
+        layout = random.choice(LEVELS_DISTRIBUTION)
+        for row, layout_row in zip(level_matrix, layout):
+            row.extend(layout_row[1:])
+
+    return level_matrix
+
+def generate_by_sections(generator, level_matrix, section_columns=10):
+    """
+    Apply a matrix generator to every section of a wide level, so items and doors are spread
+    over the whole level instead of gathering where the generator starts.
+
+    Args:
+        generator (callable): generate_items_matrix or generate_doors_matrix.
+        level_matrix (list): The level matrix, made of sections sharing their border column.
+        section_columns (int, optional): Columns between two section borders. Defaults to 10.
+
+    Returns:
+        list: The generated matrix of the whole level.
+    """
+    cols = len(level_matrix[0])
+    if cols <= section_columns + 1:
+        return generator(level_matrix)
+
+    matrix = [[0 for _ in range(cols)] for _ in level_matrix]
+    for start in range(0, cols - 1, section_columns):
+        section = generator([row[start:start + section_columns + 1] for row in level_matrix])
+        for row, section_row in zip(matrix, section):
+            for c_index, value in enumerate(section_row):
+                if value:
+                    row[start + c_index] = value
+
+    return matrix
 
 def generate_items_matrix(level_matrix):
     """
@@ -97,6 +168,7 @@ def generate_doors_matrix(level_matrix):
 
     return doors_matrix
     
+@traced("load_scores", "io")
 def load_scores():
     """
     Load scores from the JSON file.
@@ -114,6 +186,7 @@ def load_scores():
         except json.JSONDecodeError:
             return []
 
+@traced("save_score", "io")
 def save_score(name, score, round):
     """
     Save a new score to the JSON file.
@@ -133,6 +206,39 @@ def save_score(name, score, round):
     with open(SCORES_FILE, "w") as f:
         json.dump(scores, f, indent=4)
 
+@traced("load_progress", "io")
+def load_progress():
+    """
+    Load the saved level progress from the JSON file.
+
+    Returns:
+        dict: The saved level, score and lifes. The level is -1 if there is no saved progress.
+    """
+    empty_save = {"level": -1, "score": 0, "lifes": 4}
+
+    # Check if the progress file exists
+    if not os.path.exists(LEVEL_FILE):
+        return empty_save
+
+    with open(LEVEL_FILE, "r") as f:
+        try:
+            return json.load(f)
+        except json.JSONDecodeError:
+            return empty_save
+
+@traced("save_progress", "io")
+def save_progress(level, score, lifes):
+    """
+    Save the current level progress to the JSON file.
+
+    Args:
+        level (int): The level number to continue from.
+        score (int): The score at the start of the level.
+        lifes (int): The remaining lifes of the player.
+    """
+    with open(LEVEL_FILE, "w") as f:
+        json.dump({"level": level, "score": score, "lifes": lifes}, f, indent=4)
+
 def scale_image_by_height(image, target_height):
     """
     Scale an image to a target height while maintaining its aspect ratio.
@@ -0,0 +1,102 @@
+from bisect import bisect_left
+
+"""
+This module defines the Histogram class, which counts measurements in fixed buckets and keeps
+their sum and extremes, so long runs can be summarized without storing every value.
+"""
+
+class Histogram:
+    """
+    Counts values in buckets delimited by upper bounds, plus one bucket for larger values.
+
+    Args:
+        bounds (list): The upper bound of every bucket, in increasing order.
+    """
+    def __init__(self, bounds):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        """
+        Count a value.
+
+        Args:
+            value (float): The value.
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def mean(self):
+        """
+        Get the mean of the values.
+
+        Returns:
+            float: The mean, 0 without values.
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction):
+        """
+        Estimate a percentile as the upper bound of the bucket that contains it.
+
+        Args:
+            fraction (float): The percentile, between 0 and 1.
+
+        Returns:
+            float: The estimated value, the maximum if it falls in the last bucket, 0 without values.
+        """
+        if not self.count:
+            return 0.0
+
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= fraction * self.count:
+                return self.bounds[index] if index < len(self.bounds) else self.max
+
+        return self.max
+
+    def clear(self):
+        """
+        Forget every value.
+        """
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def report(self, title, unit="ms", width=30):
+        """
+        Build a text report with the summary and a bar for every bucket.
+
+        Args:
+            title (str): The name of the measurement.
+            unit (str, optional): The unit of the values. Defaults to "ms".
+            width (int, optional): The length of the longest bar, in characters. Defaults to 30.
+
+        Returns:
+            list: The lines of the report.
+        """
+        if not self.count:
+            return [f"{title}: no samples"]
+
+        lines = [
+            f"{title}: {self.count} samples, mean {self.mean():.2f} {unit}, "
+            f"p50 {self.percentile(0.5):.2f}, p95 {self.percentile(0.95):.2f}, max {self.max:.2f} {unit}"
+        ]
+
+        largest = max(self.counts)
+        for index, count in enumerate(self.counts):
+            label = f"<= {self.bounds[index]:g}" if index < len(self.bounds) else f">  {self.bounds[-1]:g}"
+            bar = "#" * round(count / largest * width) if largest else ""
+            lines.append(f"  {label:>8} {unit} {count:>7} {bar}")
+
+        return lines
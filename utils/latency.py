@@ -0,0 +1,133 @@
+import time
+
+from utils.histogram import Histogram
+from utils.tracer import tracer
+from config.settings import LATENCY_BUCKETS_MS, LATENCY_TIMEOUT_FRAMES
+
+"""
+This module defines the InputLatency class, which follows every movement key from the moment
+Game.handle_event receives it to the change of Mappy's state, the end of the update and draw
+of that frame, and the display.flip that shows it.
+"""
+
+class InputLatency:
+    """
+    Measures the latency of the movement keys, stage by stage, as histograms in milliseconds.
+
+    The event handler applies a movement key at once or not at all, so a key is followed only
+    if Mappy's state changed when its handler returns; keys without effect (for example LEFT
+    during a bounce) are only counted. Followed keys that are not flipped within timeout_frames
+    updates, as in headless runs, are dropped.
+
+    Args:
+        bounds (list, optional): Upper bounds of the histogram buckets. Defaults to LATENCY_BUCKETS_MS.
+        timeout_frames (int, optional): Updates after which a key not shown yet is dropped. Defaults to LATENCY_TIMEOUT_FRAMES.
+    """
+    STAGES = ["state", "update", "draw", "flip"]
+
+    def __init__(self, bounds=LATENCY_BUCKETS_MS, timeout_frames=LATENCY_TIMEOUT_FRAMES):
+        self.timeout_frames = timeout_frames
+        self.histograms = {stage: Histogram(bounds) for stage in self.STAGES}
+        self.pending = []  # Dicts with the key and the times of its stages
+        self.ignored = 0
+        self.dropped = 0
+
+    def key_down(self, key):
+        """
+        Get the time a key reached Game.handle_event.
+
+        Args:
+            key (int): The key code.
+
+        Returns:
+            dict: The sample of the key, to pass to key_handled.
+        """
+        return {"key": key, "input": time.perf_counter(), "frames": 0}
+
+    def key_handled(self, sample, previous_state, player):
+        """
+        Follow a key if its handler changed Mappy's state.
+
+        Args:
+            sample (dict): The sample returned by key_down.
+            previous_state (str): Mappy's state before the handler.
+            player (Mappy): The player.
+        """
+        if player.state == previous_state:
+            self.ignored += 1
+            return
+
+        sample["state"] = time.perf_counter()
+        self.pending.append(sample)
+
+    def frame_updated(self):
+        """
+        Record the end of the update of a frame, dropping the keys that waited too long for a flip.
+        """
+        self.mark("update", "state")
+
+        for sample in self.pending:
+            sample["frames"] += 1
+
+        waiting = len(self.pending)
+        self.pending = [sample for sample in self.pending if sample["frames"] < self.timeout_frames]
+        self.dropped += waiting - len(self.pending)
+
+    def frame_drawn(self):
+        """
+        Record the end of the drawing of a frame.
+        """
+        self.mark("draw", "update")
+
+    def frame_flipped(self):
+        """
+        Record the flip of a frame, completing the keys whose change it shows.
+        """
+        self.mark("flip", "draw")
+
+        remaining = []
+        for sample in self.pending:
+            if "flip" in sample:
+                self.complete(sample)
+            else:
+                remaining.append(sample)
+
+        self.pending = remaining
+
+    def mark(self, stage, previous):
+        """
+        Set the time of a stage for the keys that reached the previous one.
+
+        Args:
+            stage (str): The stage that ended.
+            previous (str): The stage that comes before it.
+        """
+        now = time.perf_counter()
+        for sample in self.pending:
+            if previous in sample and stage not in sample:
+                sample[stage] = now
+
+    def complete(self, sample):
+        """
+        Add the latencies of a key that reached the screen to the histograms.
+
+        Args:
+            sample (dict): The stages of the key.
+        """
+        for stage in self.STAGES:
+            self.histograms[stage].add((sample[stage] - sample["input"]) * 1000)
+
+        tracer.counter("input latency", flip_ms=(sample["flip"] - sample["input"]) * 1000)
+
+    def report(self):
+        """
+        Build the latency report.
+
+        Returns:
+            list: The lines of the report, one histogram per stage measured from the key.
+        """
+        lines = [f"Input latency ({self.histograms['flip'].count} keys shown, {self.ignored} without effect, {self.dropped} never flipped)"]
+        for stage in self.STAGES:
+            lines.extend(self.histograms[stage].report(f"key -> {stage}"))
+
+        return lines
@@ -0,0 +1,187 @@
+import os
+import zlib
+import struct
+
+"""
+This module defines the level pack format: level layouts stored as one byte per cell, with an
+index and a table giving the layout of every round, so the game reads only the layouts it plays.
+
+Layout: magic (8 bytes), layout count and round count (uint16 each), round table (one uint16
+layout index per round, starting at round 1), index (offset, rows and columns as uint16 and CRC-32 of every
+layout) and the layout blocks. Offsets are counted from the start of the file.
+"""
+
+LEVEL_PACK_MAGIC = b"MAPPYLV2"
+
+HEADER = struct.Struct("<8sHH")
+ROUND_ENTRY = struct.Struct("<H")
+INDEX_ENTRY = struct.Struct("<IHHI")
+
+VALID_CELLS = {0, 1, 2}
+
+def build_level_pack(pack_path, layouts, round_layouts):
+    """
+    Write layouts and the round table into a pack file.
+
+    Args:
+        pack_path (str): The path of the pack file to write.
+        layouts (list): The level matrices.
+        round_layouts (list): The index of the layout of every round, starting at round 1.
+
+    Returns:
+        int: The size of the pack, in bytes.
+
+    Raises:
+        ValueError: If a layout or the round table is not valid.
+    """
+    for layout in layouts:
+        validate_layout(layout)
+    for index in round_layouts:
+        if not 0 <= index < len(layouts):
+            raise ValueError(f"round table points to missing layout {index}")
+
+    data_start = HEADER.size + ROUND_ENTRY.size * len(round_layouts) + INDEX_ENTRY.size * len(layouts)
+    blocks = [bytes(cell for row in layout for cell in row) for layout in layouts]
+
+    index = []
+    offset = data_start
+    for layout, block in zip(layouts, blocks):
+        index.append(INDEX_ENTRY.pack(offset, len(layout), len(layout[0]), zlib.crc32(block)))
+        offset += len(block)
+
+    directory = os.path.dirname(pack_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(pack_path, "wb") as f:
+        f.write(HEADER.pack(LEVEL_PACK_MAGIC, len(layouts), len(round_layouts)))
+        for layout_index in round_layouts:
+            f.write(ROUND_ENTRY.pack(layout_index))
+        for entry in index:
+            f.write(entry)
+        for block in blocks:
+            f.write(block)
+
+    return offset
+
+def validate_layout(layout):
+    """
+    Check that a level matrix can be built.
+
+    Args:
+        layout (list): The level matrix.
+
+    Raises:
+        ValueError: If the matrix is empty, not rectangular, too large or has unknown cells.
+    """
+    if not layout or not layout[0]:
+        raise ValueError("empty layout")
+    if len(layout) > 65535 or len(layout[0]) > 65535:
+        raise ValueError(f"layout of {len(layout)}x{len(layout[0])} cells is too large")
+    if any(len(row) != len(layout[0]) for row in layout):
+        raise ValueError("rows of different length")
+    if any(cell not in VALID_CELLS for row in layout for cell in row):
+        raise ValueError("unknown cell value")
+
+class LevelPack:
+    """
+    Read-only view of a level pack. The header, round table and index are read when the pack is
+    opened, and every layout is read, validated and cached the first time it is requested.
+
+    Args:
+        pack_path (str): The path of the pack file.
+
+    Raises:
+        ValueError: If the file is not a valid level pack.
+    """
+    def __init__(self, pack_path):
+        self.file = open(pack_path, "rb")
+        self.size = os.fstat(self.file.fileno()).st_size
+        self.layouts = {}  # Layout index -> level matrix, once read
+
+        try:
+            magic, self.layout_count, self.round_count = HEADER.unpack(self.read(0, HEADER.size))
+            if magic != LEVEL_PACK_MAGIC:
+                raise ValueError(f"{pack_path} is not a level pack")
+
+            rounds = self.read(HEADER.size, ROUND_ENTRY.size * self.round_count)
+            self.round_layouts = [entry[0] for entry in ROUND_ENTRY.iter_unpack(rounds)]
+
+            index = self.read(HEADER.size + len(rounds), INDEX_ENTRY.size * self.layout_count)
+            self.index = list(INDEX_ENTRY.iter_unpack(index))
+        except (ValueError, struct.error):
+            self.close()
+            raise
+
+        if self.round_count == 0 or any(layout >= self.layout_count for layout in self.round_layouts):
+            self.close()
+            raise ValueError(f"{pack_path} has an invalid round table")
+        if any(offset + rows * cols > self.size for offset, rows, cols, _ in self.index):
+            self.close()
+            raise ValueError(f"{pack_path} is truncated")
+
+    def read(self, offset, length):
+        """
+        Read bytes of the pack.
+
+        Args:
+            offset (int): The position of the first byte.
+            length (int): The number of bytes.
+
+        Returns:
+            bytes: The bytes read.
+
+        Raises:
+            ValueError: If the file ends before.
+        """
+        self.file.seek(offset)
+        data = self.file.read(length)
+        if len(data) != length:
+            raise ValueError("level pack is truncated")
+        return data
+
+    def layout(self, index):
+        """
+        Get a layout of the pack.
+
+        Args:
+            index (int): The index of the layout.
+
+        Returns:
+            list: The level matrix, which must not be modified.
+
+        Raises:
+            ValueError: If the layout is damaged.
+        """
+        layout = self.layouts.get(index)
+        if layout is not None:
+            return layout
+
+        offset, rows, cols, checksum = self.index[index]
+        block = self.read(offset, rows * cols)
+        if zlib.crc32(block) != checksum:
+            raise ValueError(f"layout {index} of the level pack is damaged")
+
+        layout = [list(block[r * cols:(r + 1) * cols]) for r in range(rows)]
+        validate_layout(layout)
+
+        self.layouts[index] = layout
+        return layout
+
+    def layout_for_round(self, round_number):
+        """
+        Get the layout of a round. The round table repeats after its last round.
+
+        Args:
+            round_number (int): The round, starting at 1.
+
+        Returns:
+            list: The level matrix, which must not be modified.
+        """
+        return self.layout(self.round_layouts[(round_number - 1) % self.round_count])
+
+    def close(self):
+        """
+        Close the pack file. The layouts already read can still be used.
+        """
+        self.file.close()
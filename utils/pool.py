@@ -0,0 +1,64 @@
+"""
+This module defines the ObjectPool class, which recycles sprites instead of constructing new ones.
+"""
+
+class ObjectPool:
+    """
+    Keeps released objects so they can be reused by later acquisitions.
+
+    Pooled objects must implement a reset method that accepts the same arguments as their constructor.
+
+    Args:
+        factory (callable): Builds a new object when the pool is empty.
+        max_size (int, optional): Maximum number of free objects kept. Defaults to 32.
+    """
+    def __init__(self, factory, max_size=32):
+        self.factory = factory
+        self.max_size = max_size
+        self.free = []
+
+        self.created = 0  # Objects built by the factory
+        self.reused = 0  # Acquisitions served from the free list
+
+    def acquire(self, *args, **kwargs):
+        """
+        Get an object from the pool, building a new one if there are none free.
+
+        Args:
+            *args: Arguments passed to the factory or to the reset method.
+            **kwargs: Keyword arguments passed to the factory or to the reset method.
+
+        Returns:
+            The ready to use object.
+        """
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.factory(*args, **kwargs)
+            self.created += 1
+
+        return obj
+
+    def release(self, obj):
+        """
+        Return an object to the pool, removing it from every sprite group it belongs to.
+
+        Args:
+            obj (pygame.sprite.Sprite): The object to return.
+        """
+        obj.kill()
+
+        if len(self.free) < self.max_size:
+            self.free.append(obj)
+
+    def release_all(self, objects):
+        """
+        Return several objects to the pool.
+
+        Args:
+            objects (iterable): The objects to return.
+        """
+        for obj in list(objects):
+            self.release(obj)
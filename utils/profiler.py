@@ -0,0 +1,133 @@
+import time
+from collections import deque
+from contextlib import nullcontext
+
+"""
+This module defines the FrameProfiler class, which measures how long each section of a frame takes.
+"""
+
+# Shared no-op context returned while the profiler is disabled
+NULL_SECTION = nullcontext()
+
+class FrameProfiler:
+    """
+    Collects per-frame timings of named sections and keeps rolling averages of them.
+
+    Args:
+        history (int, optional): Number of frames kept for the averages and the frame graph. Defaults to 120.
+    """
+    def __init__(self, history=120):
+        self.enabled = False
+        self.history = history
+
+        self.sections = {}  # Section name -> deque with the last frame times in ms
+        self.current = {}  # Section name -> time accumulated in the current frame in ms
+        self.frame_times = deque(maxlen=history)  # Full frame durations in ms
+        self.counters = {}  # Counter name -> last reported value
+        self.frame_start = None
+
+    def toggle(self):
+        """
+        Enable or disable the profiler, discarding the previous measurements.
+        """
+        self.enabled = not self.enabled
+        self.sections.clear()
+        self.current.clear()
+        self.frame_times.clear()
+        self.counters.clear()
+        self.frame_start = None
+
+    def begin_frame(self):
+        """
+        Close the previous frame, storing its section timings, and start a new one.
+        """
+        if not self.enabled:
+            return
+
+        now = time.perf_counter()
+        if self.frame_start is not None:
+            self.frame_times.append((now - self.frame_start) * 1000)
+
+            for name, history in self.sections.items():
+                history.append(self.current.get(name, 0.0))
+        self.current.clear()
+        self.frame_start = now
+
+    def section(self, name):
+        """
+        Return a context manager that measures the code inside it under the given name.
+
+        Args:
+            name (str): The name of the section.
+
+        Returns:
+            A context manager, a shared no-op one when the profiler is disabled.
+        """
+        if not self.enabled:
+            return NULL_SECTION
+
+        if name not in self.sections:
+            self.sections[name] = deque(maxlen=self.history)
+        return ProfilerSection(self, name)
+
+    def count(self, name, value):
+        """
+        Report the current value of a counter, such as the number of live sprites.
+
+        Args:
+            name (str): The name of the counter.
+            value (int): The current value.
+        """
+        if self.enabled:
+            self.counters[name] = value
+
+    def average(self, name):
+        """
+        Get the rolling average time of a section.
+
+        Args:
+            name (str): The name of the section.
+
+        Returns:
+            float: The average time in milliseconds, or 0 if there are no samples.
+        """
+        history = self.sections.get(name)
+        if not history:
+            return 0.0
+        return sum(history) / len(history)
+
+    def average_frame_time(self):
+        """
+        Get the rolling average duration of a whole frame.
+
+        Returns:
+            float: The average frame time in milliseconds, or 0 if there are no samples.
+        """
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times)
+
+class ProfilerSection:
+    """
+    Context manager that adds the time spent inside it to a profiler section.
+
+    Args:
+        profiler (FrameProfiler): The profiler that receives the measurement.
+        name (str): The name of the section.
+    """
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = (time.perf_counter() - self.start) * 1000
+        current = self.profiler.current
+        current[self.name] = current.get(self.name, 0.0) + elapsed
+        return False
@@ -0,0 +1,248 @@
+import os
+import json
+import time
+import queue
+import threading
+
+from utils.histogram import Histogram
+from config.settings import TELEMETRY_ENABLED, TELEMETRY_DIR, TELEMETRY_QUEUE_SIZE, TELEMETRY_BUCKETS_MS
+
+"""
+This module defines the TelemetryWriter class, which appends metric records as JSON lines to a
+file of the current session from a background thread, and the SessionMetrics class, which
+collects the metrics of a session and of every level played in it.
+
+Every record is a JSON object with a "type": "level" when a level ends (cleared, game over or
+quit) and "session" when the game closes. telemetry_summary.py aggregates the files.
+"""
+
+class TelemetryWriter:
+    """
+    Writes records to a JSON lines file without blocking the game loop. Records go through a
+    bounded queue to a daemon thread that encodes and writes them; when the queue is full the
+    record is dropped and counted instead of waiting.
+
+    Args:
+        directory (str): The directory of the session files.
+        capacity (int): Maximum number of records waiting to be written.
+        enabled (bool, optional): Whether records are written. Defaults to True.
+    """
+    def __init__(self, directory, capacity, enabled=True):
+        self.enabled = enabled
+        self.directory = directory
+        self.session = time.strftime("%Y%m%d_%H%M%S")
+        self.queue = queue.Queue(maxsize=capacity)
+        self.dropped = 0
+        self.thread = None  # Started with the first record
+
+    @property
+    def file_path(self):
+        """
+        The path of the file of the current session.
+        """
+        return os.path.join(self.directory, f"session_{self.session}.jsonl")
+
+    def write(self, record):
+        """
+        Queue a record to be written.
+
+        Args:
+            record (dict): The record, serializable as JSON.
+        """
+        if not self.enabled:
+            return
+
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name="TelemetryWriter", daemon=True)
+            self.thread.start()
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def run(self):
+        """
+        Write the queued records until close() is called, flushing after every batch.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        with open(self.file_path, "a") as f:
+            while True:
+                batch = [self.queue.get()]
+                while not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+
+                for record in batch:
+                    if record is None:
+                        return
+                    f.write(json.dumps(record) + "\n")
+                f.flush()
+
+    def close(self, timeout=1.0):
+        """
+        Write the queued records and stop the background thread.
+
+        Args:
+            timeout (float, optional): Maximum time to wait for the thread, in seconds. Defaults to 1.
+        """
+        if self.thread is None:
+            return
+
+        try:
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self.thread.join(timeout)
+
+class SessionMetrics:
+    """
+    Collects the frames, update and draw times, deaths and score of a session and of the level
+    being played, and sends a record to a TelemetryWriter when each of them ends.
+
+    Args:
+        writer (TelemetryWriter): The writer of the records.
+        bounds (list, optional): Upper bounds of the update and draw time histograms, in milliseconds. Defaults to TELEMETRY_BUCKETS_MS.
+    """
+    def __init__(self, writer, bounds=TELEMETRY_BUCKETS_MS):
+        self.writer = writer
+        self.bounds = bounds
+        self.start = time.time()
+
+        self.session = self.new_stats()
+        self.levels = 0
+        self.max_round = 0
+
+        self.level = None  # The level being played and its statistics
+        self.level_stats = None
+
+    def new_stats(self):
+        """
+        Create empty statistics for a session or a level.
+
+        Returns:
+            dict: The frame count, update and draw time histograms and death count.
+        """
+        return {"frames": 0, "update": Histogram(self.bounds), "draw": Histogram(self.bounds), "deaths": 0}
+
+    def start_level(self, level, round_number, build_ms, score):
+        """
+        Start collecting the metrics of a level.
+
+        Args:
+            level (Level): The level, which counts its items and bounces.
+            round_number (int): The round of the level.
+            build_ms (float): The time spent building the level, in milliseconds.
+            score (int): The score when the level starts.
+        """
+        self.level = level
+        self.level_stats = self.new_stats()
+        self.level_stats.update(round=round_number, build_ms=build_ms, score=score, items=level.items_left)
+        self.max_round = max(self.max_round, round_number)
+
+    def updated(self, update_ms):
+        """
+        Count an updated frame.
+
+        Args:
+            update_ms (float): The time of the update, in milliseconds.
+        """
+        for stats in [self.session, self.level_stats]:
+            if stats is not None:
+                stats["frames"] += 1
+                stats["update"].add(update_ms)
+
+    def drawn(self, draw_ms):
+        """
+        Count a drawn frame.
+
+        Args:
+            draw_ms (float): The time of the drawing, in milliseconds.
+        """
+        for stats in [self.session, self.level_stats]:
+            if stats is not None:
+                stats["draw"].add(draw_ms)
+
+    def died(self):
+        """
+        Count a death of the player.
+        """
+        for stats in [self.session, self.level_stats]:
+            if stats is not None:
+                stats["deaths"] += 1
+
+    def timings(self, stats):
+        """
+        Summarize the update and draw times of some statistics.
+
+        Args:
+            stats (dict): The statistics of a session or a level.
+
+        Returns:
+            dict: The mean and 99th percentile of the update and draw times, in milliseconds.
+        """
+        return {
+            "update_ms": round(stats["update"].mean(), 3),
+            "update_p99_ms": stats["update"].percentile(0.99),
+            "draw_ms": round(stats["draw"].mean(), 3),
+            "draw_p99_ms": stats["draw"].percentile(0.99),
+        }
+
+    def end_level(self, outcome, score):
+        """
+        Send the record of the level being played, if any.
+
+        Args:
+            outcome (str): "cleared", "game_over" or "quit".
+            score (int): The score when the level ends.
+        """
+        if self.level is None:
+            return
+
+        stats = self.level_stats
+        self.writer.write({
+            "type": "level",
+            "session": self.writer.session,
+            "time": round(time.time(), 3),
+            "round": stats["round"],
+            "outcome": outcome,
+            "frames": stats["frames"],
+            **self.timings(stats),
+            "build_ms": round(stats["build_ms"], 3),
+            "score": score - stats["score"],
+            "deaths": stats["deaths"],
+            "items": stats["items"] - self.level.items_left,
+            "bounces": self.level.bounces,
+        })
+
+        self.levels += 1
+        self.level = None
+        self.level_stats = None
+
+    def end_session(self, score):
+        """
+        Send the record of the session, ending the level being played, and stop the writer.
+
+        Args:
+            score (int): The final score.
+        """
+        self.end_level("quit", score)
+
+        stats = self.session
+        self.writer.write({
+            "type": "session",
+            "session": self.writer.session,
+            "time": round(time.time(), 3),
+            "duration_s": round(time.time() - self.start, 3),
+            "frames": stats["frames"],
+            **self.timings(stats),
+            "levels": self.levels,
+            "deaths": stats["deaths"],
+            "score": score,
+            "round": self.max_round,
+            "dropped": self.writer.dropped,
+        })
+        self.writer.close()
+
+# Global telemetry writer shared by the whole game
+telemetry = TelemetryWriter(TELEMETRY_DIR, TELEMETRY_QUEUE_SIZE, TELEMETRY_ENABLED)
@@ -0,0 +1,171 @@
+import os
+import json
+import time
+import threading
+from collections import deque
+from contextlib import nullcontext
+from functools import wraps
+
+from config.settings import TRACE_ENABLED, TRACE_BUFFER_SIZE
+
+"""
+This module defines the Tracer class, which records named timing spans into a ring buffer
+and exports them in the Chrome trace event format (readable by chrome://tracing and Perfetto).
+"""
+
+# Shared no-op context returned while tracing is disabled
+NULL_SPAN = nullcontext()
+
+class Tracer:
+    """
+    Records timing spans and counters into a fixed size ring buffer.
+
+    Args:
+        capacity (int): Maximum number of events kept, the oldest ones are discarded first.
+        enabled (bool, optional): Whether events are recorded. Defaults to True.
+    """
+    def __init__(self, capacity, enabled=True):
+        self.enabled = enabled
+        self.events = deque(maxlen=capacity)
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+
+    def now(self):
+        """
+        Get the current trace timestamp.
+
+        Returns:
+            float: Microseconds elapsed since the tracer was created.
+        """
+        return (time.perf_counter_ns() - self.origin) / 1000
+
+    def span(self, name, category="game"):
+        """
+        Return a context manager that records the code inside it as a span.
+
+        Args:
+            name (str): The name of the span.
+            category (str, optional): The category of the span. Defaults to "game".
+
+        Returns:
+            A context manager, a shared no-op one when tracing is disabled.
+        """
+        if not self.enabled:
+            return NULL_SPAN
+        return TraceSpan(self, name, category)
+
+    def counter(self, name, **values):
+        """
+        Record the current value of one or more counters.
+
+        Args:
+            name (str): The name of the counter track.
+            **values: Counter names and their values.
+        """
+        if not self.enabled:
+            return
+        self.events.append(("C", name, "counter", self.now(), 0, threading.get_ident(), values))
+
+    def instant(self, name, category="game"):
+        """
+        Record a single point in time, such as a scene change.
+
+        Args:
+            name (str): The name of the event.
+            category (str, optional): The category of the event. Defaults to "game".
+        """
+        if not self.enabled:
+            return
+        self.events.append(("i", name, category, self.now(), 0, threading.get_ident(), None))
+
+    def clear(self):
+        """
+        Discard every recorded event.
+        """
+        self.events.clear()
+
+    def to_chrome_trace(self):
+        """
+        Convert the recorded events into the Chrome trace event format.
+
+        Returns:
+            dict: The trace, ready to be serialized as JSON.
+        """
+        trace_events = []
+        for phase, name, category, ts, duration, tid, args in list(self.events):
+            event = {"name": name, "cat": category, "ph": phase, "ts": ts, "pid": self.pid, "tid": tid}
+            if phase == "X":
+                event["dur"] = duration
+            elif phase == "i":
+                event["s"] = "t"
+            if args:
+                event["args"] = args
+            trace_events.append(event)
+
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def export(self, file_path):
+        """
+        Write the recorded events to a JSON file in the Chrome trace event format.
+
+        Args:
+            file_path (str): The path of the file to write.
+
+        Returns:
+            str: The path of the written file.
+        """
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(file_path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+        return file_path
+
+class TraceSpan:
+    """
+    Context manager that records a complete ("X") event when it exits.
+
+    Args:
+        tracer (Tracer): The tracer that receives the event.
+        name (str): The name of the span.
+        category (str): The category of the span.
+    """
+    __slots__ = ("tracer", "name", "category", "start")
+
+    def __init__(self, tracer, name, category):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = self.tracer.now()
+        return self
+
+    def __exit__(self, *exc):
+        end = self.tracer.now()
+        self.tracer.events.append(("X", self.name, self.category, self.start, end - self.start, threading.get_ident(), None))
+        return False
+
+def traced(name, category="game"):
+    """
+    Decorator that records every call of a function as a span of the global tracer.
+
+    Args:
+        name (str): The name of the span.
+        category (str, optional): The category of the span. Defaults to "game".
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return function(*args, **kwargs)
+            with TraceSpan(tracer, name, category):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+# Global tracer shared by the whole game
+tracer = Tracer(TRACE_BUFFER_SIZE, TRACE_ENABLED)